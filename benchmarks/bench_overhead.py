@@ -0,0 +1,251 @@
+"""
+Framework-overhead benchmarks for flowtic, run fully offline against FakeProvider.
+
+    python benchmarks/bench_overhead.py --output bench.json
+    python benchmarks/bench_overhead.py --compare bench.json
+
+Timings exclude the fake provider's own cost where possible, so the numbers
+reflect what flowtic adds around each completion.
+"""
+import argparse
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+from PIL import Image
+
+from flowtic import Agent, CommunicationProtocol, SessionManager, Tool, Tools
+from flowtic.providers import FakeProvider, FakeResponse
+
+
+def echo_tool(text: str):
+    return text, None
+
+
+ECHO_TOOL = Tool(
+    tool_definition={
+        "type": "function",
+        "function": {
+            "name": "echo_tool",
+            "description": "Echo the text back",
+            "parameters": {
+                "type": "object",
+                "properties": {"text": {"type": "string"}},
+                "required": ["text"],
+            },
+        },
+    },
+    tool_execution=echo_tool,
+)
+
+
+def _timed(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+
+def _provider_cost(iterations: int, item) -> float:
+    provider = FakeProvider(responder=lambda messages, tools: item)
+    return _timed(lambda: provider.completion(model="fake", messages=[]), iterations)
+
+
+def _reset(agent: Agent, initial) -> None:
+    agent.session.load_buffer(agent.name, initial)
+
+
+def bench_turn(iterations: int) -> dict:
+    agent = Agent(
+        agent_name="bench",
+        model_name="fake",
+        allow_user_input=False,
+        provider=FakeProvider(responder=lambda messages, tools: "ok"),
+    )
+    initial = agent.session.export_buffer(agent.name)
+
+    def run():
+        agent("hello")
+        _reset(agent, initial)
+
+    per_call = _timed(run, iterations)
+    provider = _provider_cost(iterations, "ok")
+    return {"per_turn_us": per_call * 1e6, "overhead_us": (per_call - provider) * 1e6}
+
+
+def bench_tool_turn(iterations: int) -> dict:
+    script = itertools.cycle([FakeResponse(tool_calls=[("echo_tool", {"text": "x"})]), "done"])
+    agent = Agent(
+        agent_name="bench",
+        model_name="fake",
+        tools=Tools([ECHO_TOOL]),
+        allow_user_input=False,
+        provider=FakeProvider(responder=lambda messages, tools: next(script)),
+    )
+    initial = agent.session.export_buffer(agent.name)
+
+    def run():
+        agent("hello")
+        _reset(agent, initial)
+
+    per_call = _timed(run, iterations)
+    provider = (
+        _provider_cost(iterations, FakeResponse(tool_calls=[("echo_tool", {"text": "x"})]))
+        + _provider_cost(iterations, "done")
+    )
+    return {"per_call_us": per_call * 1e6, "overhead_us": (per_call - provider) * 1e6}
+
+
+def bench_handoff(iterations: int) -> dict:
+    sender = Agent(
+        agent_name="sender",
+        model_name="fake",
+        allow_user_input=False,
+        provider=FakeProvider(responder=lambda messages, tools: FakeResponse.handoff("receiver", "task")),
+    )
+    receiver = Agent(
+        agent_name="receiver",
+        model_name="fake",
+        allow_user_input=False,
+        provider=FakeProvider(responder=lambda messages, tools: "done"),
+    )
+    protocol = CommunicationProtocol("sender->receiver", [sender, receiver])
+    initial = {agent.name: agent.session.export_buffer(agent.name) for agent in (sender, receiver)}
+
+    def run():
+        protocol.execute("go")
+        _reset(sender, initial["sender"])
+        _reset(receiver, initial["receiver"])
+
+    per_call = _timed(run, iterations)
+    provider = _provider_cost(iterations, FakeResponse.handoff("receiver", "task")) + _provider_cost(iterations, "done")
+    return {"per_handoff_us": per_call * 1e6, "overhead_us": (per_call - provider) * 1e6}
+
+
+def bench_images(iterations: int) -> dict:
+    rng = random.Random(0)
+    image = Image.frombytes("RGB", (1024, 768), bytes(rng.getrandbits(8) for _ in range(1024 * 768 * 3)))
+    buffered = io.BytesIO()
+    image.save(buffered, format="PNG")
+    png_bytes = buffered.getvalue()
+    image = Image.open(io.BytesIO(png_bytes))
+
+    session = SessionManager()
+    results = {"image_bytes": len(png_bytes)}
+
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as handle:
+        handle.write(png_bytes)
+        path = handle.name
+
+    try:
+        for label, source in (("bytes", png_bytes), ("path", path), ("pil", image)):
+            per_image = _timed(lambda: session._handle_image(source), iterations)
+            results[f"{label}_images_per_s"] = 1 / per_image
+            results[f"{label}_mb_per_s"] = len(png_bytes) / per_image / 1e6
+    finally:
+        os.unlink(path)
+
+    return results
+
+
+def bench_session_memory(sessions: int, messages: int) -> dict:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    agents = []
+    for index in range(sessions):
+        agent = Agent(
+            agent_name=f"agent_{index}",
+            model_name="fake",
+            allow_user_input=False,
+            provider=FakeProvider(responder=lambda messages, tools: "a short reply from the model"),
+        )
+        for _ in range(messages):
+            agent("a short message from the user")
+        agents.append(agent)
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "sessions": sessions,
+        "turns_per_session": messages,
+        "bytes_per_session": allocated / sessions,
+    }
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_all(quick: bool) -> dict:
+    iterations = 200 if quick else 2000
+    return {
+        "meta": {
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "quick": quick,
+        },
+        "results": {
+            "turn": bench_turn(iterations),
+            "tool_turn": bench_tool_turn(iterations),
+            "handoff": bench_handoff(iterations),
+            "images": bench_images(5 if quick else 30),
+            "session_memory": bench_session_memory(100 if quick else 1000, 10),
+        },
+    }
+
+
+def compare(current: dict, baseline: dict) -> None:
+    print(f"{'benchmark':<40}{'baseline':>14}{'current':>14}{'change':>10}")
+    for group, metrics in current["results"].items():
+        for metric, value in metrics.items():
+            previous = baseline.get("results", {}).get(group, {}).get(metric)
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or previous is None:
+                continue
+            change = f"{(value - previous) / previous * 100:+.1f}%" if previous else "n/a"
+            print(f"{group + '.' + metric:<40}{previous:>14.2f}{value:>14.2f}{change:>10}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="compare against a previous JSON result")
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for smoke runs")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.quick)
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    if args.compare:
+        with open(args.compare) as handle:
+            compare(results, json.load(handle))
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from .agents import Agent
-from .agents.tools import Tool, Tools
+from .agents.tools import Tool, LazyTool, Tools
 from .session import SessionManager
 from .communication import CommunicationProtocol
 from .communication.callbacks import Callback
@@ -10,5 +10,6 @@ __all__ = [
     "CommunicationProtocol",
     "Callback",
     "Tool",
+    "LazyTool",
     "Tools",
 ]
\ No newline at end of file
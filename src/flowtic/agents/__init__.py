@@ -1,4 +1,6 @@
 from .core import Agent, AsyncAgent
-from .tools import Tool, Tools
+from .cascade import Cascade, CascadeTier
+from .tools import Tool, LazyTool, Tools, ToolSelector, BM25ToolSelector
+from .validation import ToolArgumentError
 
-__all__ = ['Agent', 'AsyncAgent', 'Tool', 'Tools']
+__all__ = ['Agent', 'AsyncAgent', 'Cascade', 'CascadeTier', 'Tool', 'LazyTool', 'Tools', 'ToolSelector', 'BM25ToolSelector', 'ToolArgumentError']
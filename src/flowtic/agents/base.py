@@ -1,10 +1,17 @@
 from abc import ABC
+import asyncio
 import inspect
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from flowtic.session import SessionManager
+from flowtic.session.checkpoint import RunCheckpoint, SuspendedRun
 from flowtic.agents.tools import Tool, Tools
-from litellm import completion, acompletion
+from flowtic.agents.validation import ToolArgumentError
+from flowtic.agents.deadline import remaining
+from flowtic.agents.cascade import Cascade
 from flowtic.communication import Callback
+from flowtic.communication.callbacks import callback_args
+from flowtic.providers.base import Provider, get_default_provider
+from flowtic.providers.limiter import get_adaptive_controller
 
 class AgentInterface(ABC):
     def __init__(
@@ -21,6 +28,9 @@ class AgentInterface(ABC):
         callbacks: Callback | None = None,
         temperature: float = 1,
         reasoning_effort=None,
+        provider: Provider | None = None,
+        cascade: Cascade | None = None,
+        max_tool_repairs: int = 2,
         verbose: bool = False
     ):
         self.agent_name = agent_name
@@ -34,7 +44,11 @@ class AgentInterface(ABC):
         self.callbacks = callbacks
         self.temperature = temperature
         self.reasoning_effort = reasoning_effort
+        self.provider = provider
+        self.cascade = cascade
+        self.max_tool_repairs = max_tool_repairs
         self.verbose = verbose
+        self._used_tools = set()
 
         if not self.session:
             print("Session not provided, creating a new one...") if self.verbose else None 
@@ -60,27 +74,92 @@ class AgentInterface(ABC):
     def name(self) -> str:
         return self.agent_name
     
-    def completion(self, **kwargs) -> Any:
-        return completion(
+    def _deadline_kwargs(self) -> Dict[str, Any]:
+        left = remaining()
+        return {'timeout': left} if left is not None else {}
+
+    def _close_pending_tool_calls(self, tool_calls: List[Any], answered: set, error: BaseException) -> None:
+        # Every tool_call in the buffer needs a tool result, or the next request on this session is rejected.
+        if isinstance(error, TimeoutError):
+            reason = "cancelled: deadline exceeded"
+        elif isinstance(error, asyncio.CancelledError):
+            reason = "cancelled"
+        else:
+            reason = f"failed: {type(error).__name__}: {error}"
+
+        for tool_call in tool_calls:
+            if tool_call.id not in answered:
+                self.add_context(tool_output={
+                    'fn_name': tool_call.function.name,
+                    'tool_call_id': tool_call.id,
+                    'output': f"Tool call {reason}",
+                })
+
+    def _get_provider(self) -> Provider:
+        return self.provider or get_default_provider()
+
+    def _selection_query(self, window: int = 4) -> str:
+        parts = []
+        for message in self.session.get_buffer_memory(tag=self.name)[-window:]:
+            content = message.get('content') if isinstance(message, dict) else getattr(message, 'content', None)
+            if isinstance(content, str):
+                parts.append(content)
+            elif isinstance(content, list):
+                parts.extend(item.get('text', '') for item in content if isinstance(item, dict))
+        return ' '.join(parts)
+
+    def _tool_definitions(self) -> Optional[List[Dict]]:
+        if not self.tools:
+            return None
+        if self.tools.selector is None:
+            return self.tools.get_definitions()
+        # Tools already called in this conversation stay available so follow-up calls keep working.
+        return self.tools.select_definitions(self._selection_query(), include=self._used_tools)
+
+    def _parse_tool_arguments(self, tool_call: Any) -> Dict[str, Any]:
+        if not self.tools:
+            raise ToolArgumentError(f"there is no tool called {tool_call.function.name!r}. No tools are available")
+        return self.tools.parse_arguments(tool_call.function.name, tool_call.function.arguments)
+
+    def _tool_argument_error(self, tool_call: Any, error: ToolArgumentError) -> Dict[str, Any]:
+        return {
+            'fn_name': tool_call.function.name,
+            'tool_call_id': tool_call.id,
+            'output': f"Error: invalid call to {tool_call.function.name}: {error}. Fix the arguments and call the tool again.",
+        }
+
+    def _get_tool_callable(self, tool_name: str) -> Any:
+        callable_func = self.tools.get_callable(tool_name)
+        self._used_tools.add(tool_name)
+        return callable_func
+
+    def _completion_params(self, **kwargs) -> Dict[str, Any]:
+        tool_definitions = self._tool_definitions()
+        return dict(
                 model=self.model_name,
-                messages=self.session.get_buffer_memory(tag=self.name),
-                tools=self.tools.get_definitions() if self.tools else None,
-                tool_choice=self.tool_choice if self.tools else None,
+                messages=self.session.get_prompt_messages(tag=self.name),
+                tools=tool_definitions or None,
+                tool_choice=self.tool_choice if tool_definitions else None,
                 temperature=self.temperature,
                 reasoning_effort=self.reasoning_effort,
                 **kwargs
             )
 
+    def completion(self, **kwargs) -> Any:
+        params = self._completion_params(**kwargs)
+        if self.cascade is not None:
+            return self.cascade.complete(self._get_provider(), params)
+        return self._get_provider().completion(**params)
+
     def acompletion(self, **kwargs) -> Any:
-        return acompletion(
-                model=self.model_name,
-                messages=self.session.get_buffer_memory(tag=self.name),
-                tools=self.tools.get_definitions() if self.tools else None,
-                tool_choice=self.tool_choice if self.tools else None,
-                temperature=self.temperature,
-                reasoning_effort=self.reasoning_effort,
-                **kwargs
-            )
+        params = self._completion_params(**kwargs)
+        provider = self._get_provider()
+        controller = get_adaptive_controller()
+        if controller is not None:
+            provider = controller.wrap(provider)
+        if self.cascade is not None:
+            return self.cascade.acomplete(provider, params)
+        return provider.acompletion(**params)
     
     def _register_session(self) -> None:
         self.session._register_buffer(self.name)
@@ -100,42 +179,56 @@ class AgentInterface(ABC):
         else:
             raise ValueError("No input provided")
     
+    async def aadd_context(
+        self,
+        input: Optional[Dict[str, Any]] = None,
+        assistant_output: Optional[Any] = None,
+        tool_output: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if input:
+            await self.session.aadd_user_context(self.name, **input)
+        else:
+            self.add_context(assistant_output=assistant_output, tool_output=tool_output)
+
     def add_tool(self, tool: Tool) -> None:
-        if not self.tools:
+        if self.tools is None:
             self.tools = Tools([tool])
         else:
             self.tools.register_tool(tool)
 
+    def _user_loop_args(self, assistant_message: str) -> tuple:
+        return callback_args(self.callbacks.on_user_loop, self.name, assistant_message)
+
     def _call_user_loop(self, assistant_message: str):
-        method = self.callbacks.on_user_loop
-        signature = inspect.signature(method)
-        positional_params = [
-            parameter
-            for parameter in signature.parameters.values()
-            if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-        ]
+        return self.callbacks.on_user_loop(*self._user_loop_args(assistant_message))
 
-        if any(parameter.kind == inspect.Parameter.VAR_POSITIONAL for parameter in signature.parameters.values()):
-            return method(self.name, assistant_message)
+    async def _acall_user_loop(self, assistant_message: str):
+        method = self.callbacks.on_user_loop
+        args = self._user_loop_args(assistant_message)
+        if inspect.iscoroutinefunction(method):
+            return await method(*args)
+        # Blocking callbacks (e.g. ``input()``) must not stall other conversations on the loop.
+        return await asyncio.to_thread(method, *args)
 
-        if len(positional_params) <= 1:
-            return method(assistant_message)
+    def _suspend(self, assistant_message: str, turn_count: int, final_output: Optional[str]) -> SuspendedRun:
+        return SuspendedRun(
+            RunCheckpoint(
+                agent_name=self.name,
+                buffers={self.name: self.session.export_buffer(self.name)},
+                turn_count=turn_count,
+                final_output=final_output,
+                message=assistant_message,
+            )
+        )
 
-        return method(self.name, assistant_message)
+    def _restore(self, checkpoint: RunCheckpoint | str) -> RunCheckpoint:
+        checkpoint = RunCheckpoint.load(checkpoint)
+        if checkpoint.agent_name != self.name:
+            raise ValueError(f"Checkpoint belongs to agent {checkpoint.agent_name}, not {self.name}")
+        if self.name in checkpoint.buffers:
+            self.session.load_buffer(self.name, checkpoint.buffers[self.name])
+        return checkpoint
 
     def _call_tool_callback(self, function_name: str, arguments: Dict[str, Any]):
         method = self.callbacks.on_tool_call
-        signature = inspect.signature(method)
-        positional_params = [
-            parameter
-            for parameter in signature.parameters.values()
-            if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-        ]
-
-        if any(parameter.kind == inspect.Parameter.VAR_POSITIONAL for parameter in signature.parameters.values()):
-            return method(self.name, function_name, arguments)
-
-        if len(positional_params) <= 2:
-            return method(function_name, arguments)
-
-        return method(self.name, function_name, arguments)
+        return method(*callback_args(method, self.name, function_name, arguments))
@@ -0,0 +1,213 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import litellm
+
+from flowtic.agents.deadline import DeadlineExceeded
+from flowtic.providers.base import Provider
+
+TURN_TYPES = ('user', 'tool', 'handoff')
+_HANDOFF_TOOLS = ('_spin_into', '_async_spin_into')
+
+
+class CascadeTier:
+    """
+    One model in a cascade.
+
+    Args:
+        model_name (str): Any litellm model name.
+        input_cost_per_token (Optional[float], optional): Price per prompt token. Defaults to None (litellm's price list).
+        output_cost_per_token (Optional[float], optional): Price per completion token. Defaults to None (litellm's price list).
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        input_cost_per_token: Optional[float] = None,
+        output_cost_per_token: Optional[float] = None,
+    ) -> None:
+        self.model_name = model_name
+        self.input_cost_per_token = input_cost_per_token
+        self.output_cost_per_token = output_cost_per_token
+
+    def cost(self, response: Any) -> float:
+        usage = getattr(response, 'usage', None)
+        if self.input_cost_per_token is not None or self.output_cost_per_token is not None:
+            prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+            completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+            return prompt_tokens * (self.input_cost_per_token or 0.0) + completion_tokens * (self.output_cost_per_token or 0.0)
+        try:
+            return litellm.completion_cost(completion_response=response, model=self.model_name)
+        except Exception:
+            return 0.0
+
+
+def _turn_type(messages: List) -> str:
+    last = messages[-1] if messages else {}
+    if last.get('role') != 'tool':
+        return 'user'
+    return 'handoff' if last.get('name') in _HANDOFF_TOOLS else 'tool'
+
+
+def _has_malformed_tool_arguments(message: Any) -> bool:
+    for tool_call in message.tool_calls or []:
+        try:
+            if not isinstance(json.loads(tool_call.function.arguments or '{}'), dict):
+                return True
+        except (TypeError, ValueError):
+            return True
+    return False
+
+
+class Cascade:
+    """
+    Try cheap models first and escalate to stronger ones only when needed.
+
+    Each turn starts at the cheapest tier allowed for its turn type and moves
+    up one tier when the response fails ``validator``, has tool arguments that
+    are not a JSON object, or the request raises. The agent's own
+    ``model_name`` is always the last tier, and its answer is used as-is.
+    Responses from lower tiers that were escalated are discarded, so the
+    agent's history only ever holds the accepted response.
+
+    Args:
+        tiers (List[Union[str, CascadeTier]]): Models to try before the agent's own model, cheapest first.
+        validator (Optional[Callable], optional): ``validator(message, turn_type) -> bool`` accepting or rejecting a
+            response message. Use it for confidence checks too. Defaults to None (accept everything).
+        rules (Optional[Dict[str, Union[int, str]]], optional): Tier (index or model name) each turn type starts at.
+            Turn types are ``'user'`` (new input), ``'tool'`` (after tool results) and ``'handoff'`` (after a
+            handoff returned). Defaults to None (every turn starts at the first tier).
+        escalate_on_malformed_tool_args (bool, optional): Escalate when tool arguments don't parse. Defaults to True.
+        escalate_on_error (bool, optional): Escalate when a tier's request raises. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        tiers: List[Union[str, CascadeTier]],
+        validator: Optional[Callable[[Any, str], bool]] = None,
+        rules: Optional[Dict[str, Union[int, str]]] = None,
+        escalate_on_malformed_tool_args: bool = True,
+        escalate_on_error: bool = True,
+    ) -> None:
+        self.tiers = [tier if isinstance(tier, CascadeTier) else CascadeTier(tier) for tier in tiers]
+        self.validator = validator
+        self.rules = dict(rules or {})
+        self.escalate_on_malformed_tool_args = escalate_on_malformed_tool_args
+        self.escalate_on_error = escalate_on_error
+
+        for turn_type in self.rules:
+            if turn_type not in TURN_TYPES:
+                raise ValueError(f"Unknown turn type {turn_type!r}. Expected one of {TURN_TYPES}")
+
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {
+            'calls': 0,
+            'accepted': 0,
+            'escalated': 0,
+            'errors': 0,
+            'latency': 0.0,
+            'cost': 0.0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+        })
+
+    def _tiers_for(self, model_name: str) -> List[CascadeTier]:
+        tiers = list(self.tiers)
+        if not tiers or tiers[-1].model_name != model_name:
+            tiers.append(CascadeTier(model_name))
+        return tiers
+
+    def _start_index(self, tiers: List[CascadeTier], turn_type: str) -> int:
+        rule = self.rules.get(turn_type, 0)
+        if isinstance(rule, str):
+            names = [tier.model_name for tier in tiers]
+            if rule not in names:
+                raise ValueError(f"Cascade rule for {turn_type!r} names unknown model {rule!r}")
+            return names.index(rule)
+        return min(max(rule, 0), len(tiers) - 1)
+
+    def _plan(self, params: Dict[str, Any]) -> tuple:
+        tiers = self._tiers_for(params['model'])
+        turn_type = _turn_type(params['messages'])
+        return tiers, turn_type, self._start_index(tiers, turn_type)
+
+    def _should_escalate(self, response: Any, turn_type: str) -> bool:
+        message = response.choices[0].message
+        if self.escalate_on_malformed_tool_args and _has_malformed_tool_arguments(message):
+            return True
+        if self.validator is not None and not self.validator(message, turn_type):
+            return True
+        return False
+
+    def _record(self, tier: CascadeTier, started: float, response: Any = None, outcome: str = 'accepted') -> None:
+        usage = getattr(response, 'usage', None)
+        cost = tier.cost(response) if response is not None else 0.0
+        with self._lock:
+            stats = self._stats[tier.model_name]
+            stats['calls'] += 1
+            stats[outcome] += 1
+            stats['latency'] += time.perf_counter() - started
+            stats['cost'] += cost
+            stats['prompt_tokens'] += getattr(usage, 'prompt_tokens', 0) or 0
+            stats['completion_tokens'] += getattr(usage, 'completion_tokens', 0) or 0
+
+    def _outcome(self, response: Any, turn_type: str, is_last: bool) -> str:
+        if is_last or not self._should_escalate(response, turn_type):
+            return 'accepted'
+        return 'escalated'
+
+    def complete(self, provider: Provider, params: Dict[str, Any]) -> Any:
+        tiers, turn_type, start = self._plan(params)
+        for index in range(start, len(tiers)):
+            tier, is_last = tiers[index], index == len(tiers) - 1
+            started = time.perf_counter()
+            try:
+                response = provider.completion(**{**params, 'model': tier.model_name})
+            except DeadlineExceeded:
+                raise
+            except Exception:
+                self._record(tier, started, outcome='errors')
+                if is_last or not self.escalate_on_error:
+                    raise
+                continue
+
+            outcome = self._outcome(response, turn_type, is_last)
+            self._record(tier, started, response, outcome)
+            if outcome == 'accepted':
+                return response
+
+    async def acomplete(self, provider: Provider, params: Dict[str, Any]) -> Any:
+        tiers, turn_type, start = self._plan(params)
+        for index in range(start, len(tiers)):
+            tier, is_last = tiers[index], index == len(tiers) - 1
+            started = time.perf_counter()
+            try:
+                response = await provider.acompletion(**{**params, 'model': tier.model_name})
+            except DeadlineExceeded:
+                raise
+            except Exception:
+                self._record(tier, started, outcome='errors')
+                if is_last or not self.escalate_on_error:
+                    raise
+                continue
+
+            outcome = self._outcome(response, turn_type, is_last)
+            self._record(tier, started, response, outcome)
+            if outcome == 'accepted':
+                return response
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Calls, outcomes, total and mean latency (seconds), cost and tokens per model."""
+        with self._lock:
+            report = {}
+            for model_name, stats in self._stats.items():
+                report[model_name] = dict(stats)
+                report[model_name]['mean_latency'] = stats['latency'] / stats['calls'] if stats['calls'] else 0.0
+            return report
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
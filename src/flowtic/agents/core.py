@@ -1,8 +1,19 @@
 import asyncio
-import json
+import inspect
 from typing import Any, List, Optional
 
 from flowtic.agents.base import AgentInterface
+from flowtic.agents.validation import ToolArgumentError
+from flowtic.agents.deadline import (
+    await_within_deadline,
+    call_within_deadline,
+    check_deadline,
+    deadline,
+    run_blocking,
+)
+from flowtic.communication.callbacks import SuspendRun
+from flowtic.communication.channel.context import HandoffDeclined
+from flowtic.session.checkpoint import RunCheckpoint
 
 
 def _message_content_to_text(content: Any) -> Optional[str]:
@@ -35,30 +46,59 @@ class Agent(AgentInterface):
             session (Optional[SessionManager], optional): The session for the agent to keep context. Defaults to None.
             allow_user_input (bool, optional): Whether to allow the model to take user input. Defaults to True.
             max_turns (int, optional): The maximum number of turns. Defaults to -1 (unlimited).
+            provider (Optional[Provider], optional): Where completion requests go. Defaults to the process-wide litellm provider.
+            cascade (Optional[Cascade], optional): Try cheaper models before ``model_name`` and escalate on demand. Defaults to None.
+            max_tool_repairs (int, optional): Invalid tool calls sent back to the model to fix, per call, before the error is raised. Defaults to 2.
         """
         super().__init__(**kwargs)
     
-    def __call__(self, input: str, images: Optional[List] = None):
+    def __call__(self, input: str, images: Optional[List] = None, timeout: Optional[float] = None):
         """
         call the agent
 
         Args:
             input (str): The input to the agent.
             images (Optional[List], optional): List of images as a local file path or url or base64 encoded string. Defaults to None.
+            timeout (Optional[float], optional): Seconds before the call (including nested handoffs) fails with
+                ``DeadlineExceeded``. Defaults to None (the caller's deadline, if any).
         """
 
         if self.verbose:
             print(f">> Staring {self.name} agent execution")
 
-        self.add_context(input={'text': input, 'images': images})
-        
-        turn_count = 0
-        final_output = None
+        with deadline(timeout):
+            self.add_context(input={'text': input, 'images': images})
+            return self._run()
+
+    def resume(
+        self,
+        checkpoint: RunCheckpoint | str,
+        user_input: str,
+        images: Optional[List] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        resume a run parked by ``SuspendRun`` with the user's reply
+
+        Args:
+            checkpoint (RunCheckpoint | str): The checkpoint or token of the suspended run.
+            user_input (str): The user's reply to the parked question.
+            images (Optional[List], optional): List of images to attach to the reply. Defaults to None.
+            timeout (Optional[float], optional): Seconds before the resumed run fails with ``DeadlineExceeded``. Defaults to None.
+        """
+        checkpoint = self._restore(checkpoint)
+        with deadline(timeout):
+            self.add_context(input={'text': user_input, 'images': images})
+            return self._run(checkpoint.turn_count, checkpoint.final_output)
+
+    def _run(self, turn_count: int = 0, final_output: Optional[str] = None):
+        repairs = 0
         while True:
             if self.max_turns > 0 and turn_count >= self.max_turns:
                 break
-                
-            response = self.completion()
+            check_deadline()
+
+            response = self.completion(**self._deadline_kwargs())
             response_message = response.choices[0].message
             self.add_context(assistant_output=response_message)
             turn_count += 1
@@ -70,22 +110,36 @@ class Agent(AgentInterface):
 
             if tool_calls:
                 communication_occurred = False
-                for tool_call in tool_calls:
-                    function_name = tool_call.function.name
-                    function_args = json.loads(tool_call.function.arguments)
-                    self._call_tool_callback(function_name, function_args)
-                    if function_name == '_spin_into':
-                        tool_output = self.tools.get_callable(function_name)(self.name, **function_args)
-                        communication_occurred = True
-                    else:
-                        tool_output = self.tools.get_callable(function_name)(**function_args)
-
-                    assert isinstance(tool_output, tuple), "Tool output should return a tuple of (text, images (none if no images))"
-
-                    self.add_context(tool_output={'fn_name': function_name, 'tool_call_id': tool_call.id, 'output': str(tool_output[0])})
-                    if tool_output[1]:
-                        self.add_context(input={'text': 'Here are the tool output images:\n', 'images': tool_output[1] \
-                            if isinstance(tool_output[1], list) else [tool_output[1]]})
+                answered = set()
+                try:
+                    for tool_call in tool_calls:
+                        function_name = tool_call.function.name
+                        try:
+                            function_args = self._parse_tool_arguments(tool_call)
+                        except ToolArgumentError as error:
+                            repairs += 1
+                            if repairs > self.max_tool_repairs:
+                                raise
+                            self.add_context(tool_output=self._tool_argument_error(tool_call, error))
+                            answered.add(tool_call.id)
+                            continue
+                        self._call_tool_callback(function_name, function_args)
+                        if function_name == '_spin_into':
+                            tool_output = self._get_tool_callable(function_name)(self.name, **function_args)
+                            communication_occurred = communication_occurred or not isinstance(tool_output[0], HandoffDeclined)
+                        else:
+                            tool_output = call_within_deadline(self._get_tool_callable(function_name), **function_args)
+
+                        assert isinstance(tool_output, tuple), "Tool output should return a tuple of (text, images (none if no images))"
+
+                        self.add_context(tool_output={'fn_name': function_name, 'tool_call_id': tool_call.id, 'output': str(tool_output[0])})
+                        answered.add(tool_call.id)
+                        if tool_output[1]:
+                            self.add_context(input={'text': 'Here are the tool output images:\n', 'images': tool_output[1] \
+                                if isinstance(tool_output[1], list) else [tool_output[1]]})
+                except BaseException as exc:
+                    self._close_pending_tool_calls(tool_calls, answered, exc)
+                    raise
                 
                 # If agent communicated to another agent and doesn't allow user input, stop
                 if communication_occurred and not self.allow_user_input:
@@ -96,6 +150,8 @@ class Agent(AgentInterface):
                     try:
                         user_input = self._call_user_loop(message_text or "")
                         self.add_context(input={'text': user_input})
+                    except SuspendRun:
+                        return self._suspend(message_text or "", turn_count, final_output)
                     except NotImplementedError:
                         break
                 else:
@@ -117,39 +173,72 @@ class AsyncAgent(AgentInterface):
             session (Optional[SessionManager], optional): The session for the agent to keep context. Defaults to None.
             allow_user_input (bool, optional): Whether to allow the model to take user input. Defaults to True.
             max_turns (int, optional): The maximum number of turns. Defaults to -1 (unlimited).
+            provider (Optional[Provider], optional): Where completion requests go. Defaults to the process-wide litellm provider.
+            cascade (Optional[Cascade], optional): Try cheaper models before ``model_name`` and escalate on demand. Defaults to None.
+            max_tool_repairs (int, optional): Invalid tool calls sent back to the model to fix, per call, before the error is raised. Defaults to 2.
         """
         super().__init__(**kwargs)
 
     async def run_async_or_sync(self, func, *args, **kwargs):
-        result = func(*args, **kwargs)
+        if inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(getattr(func, '__call__', None)):
+            return await func(*args, **kwargs)
+        # Sync tools run in a thread so a blocking one can't stall the loop, keep a deadline
+        # from firing or keep the run from being cancelled.
+        result = await run_blocking(func, *args, **kwargs)
         if asyncio.iscoroutine(result):
             return await result
-        return result 
+        return result
 
-    async def __call__(self, input: str, images: Optional[List] = None):
+    async def __call__(self, input: str, images: Optional[List] = None, timeout: Optional[float] = None):
         """
         call the agent
 
         Args:
             input (str): The input to the agent.
             images (Optional[List], optional): List of images as a local file path or url or base64 encoded string. Defaults to None.
+            timeout (Optional[float], optional): Seconds before the call (including nested handoffs) is cancelled with
+                ``DeadlineExceeded``. Defaults to None (the caller's deadline, if any).
         """
 
         if self.verbose:
             print(f">> Staring {self.name} agent execution")
 
-        self.add_context(input={'text': input, 'images': images})
-        
-        turn_count = 0
-        final_output = None
+        with deadline(timeout):
+            await self.aadd_context(input={'text': input, 'images': images})
+            return await await_within_deadline(self._run())
+
+    async def resume(
+        self,
+        checkpoint: RunCheckpoint | str,
+        user_input: str,
+        images: Optional[List] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        resume a run parked by ``SuspendRun`` with the user's reply
+
+        Args:
+            checkpoint (RunCheckpoint | str): The checkpoint or token of the suspended run.
+            user_input (str): The user's reply to the parked question.
+            images (Optional[List], optional): List of images to attach to the reply. Defaults to None.
+            timeout (Optional[float], optional): Seconds before the resumed run is cancelled with ``DeadlineExceeded``. Defaults to None.
+        """
+        checkpoint = self._restore(checkpoint)
+        with deadline(timeout):
+            await self.aadd_context(input={'text': user_input, 'images': images})
+            return await await_within_deadline(self._run(checkpoint.turn_count, checkpoint.final_output))
+
+    async def _run(self, turn_count: int = 0, final_output: Optional[str] = None):
+        repairs = 0
         while True:
             if self.max_turns > 0 and turn_count >= self.max_turns:
                 break
+            check_deadline()
             if self.verbose: 
                 print("Session Buffer:")
                 print(self.session.get_buffer_memory(self.name))
 
-            response = await self.acompletion()
+            response = await self.acompletion(**self._deadline_kwargs())
             response_message = response.choices[0].message
             
             if self.verbose:
@@ -168,41 +257,59 @@ class AsyncAgent(AgentInterface):
 
                 tasks = []
                 tool_metadata = []
-                for tool_call in tool_calls:
-                    callable_func = self.tools.get_callable(tool_call.function.name)
-                    args = json.loads(tool_call.function.arguments)
-                    self._call_tool_callback(tool_call.function.name, args)
-
-                    if tool_call.function.name == '_async_spin_into':
-                        communication_occurred = True
-                        task = asyncio.create_task(self.run_async_or_sync(callable_func, self.name, **args))
-                    else:
-                        task = asyncio.create_task(self.run_async_or_sync(callable_func, **args))
-
-                    tasks.append(task)
-                    tool_metadata.append({
-                        'function_name': tool_call.function.name,
-                        'tool_call': tool_call
-                    })
-
-                tool_outputs = await asyncio.gather(*tasks)
-
-                for tool_output, metadata in zip(tool_outputs, tool_metadata):
-                    if self.verbose:
-                        print("TOOL OUTPUT: ")
-                        print(tool_output)
-
-                    # if metadata['function_name'] != '_async_spin_into':
-                    assert isinstance(tool_output, tuple), "Tool output should return a tuple of (text, images (none if no images))"
-                    self.add_context(tool_output={
-                        'fn_name': metadata['function_name'],
-                        'tool_call_id': metadata['tool_call'].id,
-                        'output': str(tool_output[0])
-                    })
-
-                    if tool_output[1]:
-                        self.add_context(input={'text': 'Here are the tool output images:\n', 'images': tool_output[1] \
-                            if isinstance(tool_output[1], list) else [tool_output[1]]})
+                answered = set()
+                try:
+                    for tool_call in tool_calls:
+                        try:
+                            args = self._parse_tool_arguments(tool_call)
+                        except ToolArgumentError as error:
+                            repairs += 1
+                            if repairs > self.max_tool_repairs:
+                                raise
+                            self.add_context(tool_output=self._tool_argument_error(tool_call, error))
+                            answered.add(tool_call.id)
+                            continue
+                        callable_func = self._get_tool_callable(tool_call.function.name)
+                        self._call_tool_callback(tool_call.function.name, args)
+
+                        if tool_call.function.name == '_async_spin_into':
+                            task = asyncio.create_task(self.run_async_or_sync(callable_func, self.name, **args))
+                        else:
+                            task = asyncio.create_task(self.run_async_or_sync(callable_func, **args))
+
+                        tasks.append(task)
+                        tool_metadata.append({
+                            'function_name': tool_call.function.name,
+                            'tool_call': tool_call
+                        })
+
+                    tool_outputs = await asyncio.gather(*tasks)
+
+                    for tool_output, metadata in zip(tool_outputs, tool_metadata):
+                        if self.verbose:
+                            print("TOOL OUTPUT: ")
+                            print(tool_output)
+
+                        # if metadata['function_name'] != '_async_spin_into':
+                        assert isinstance(tool_output, tuple), "Tool output should return a tuple of (text, images (none if no images))"
+                        if metadata['function_name'] == '_async_spin_into' and not isinstance(tool_output[0], HandoffDeclined):
+                            communication_occurred = True
+                        self.add_context(tool_output={
+                            'fn_name': metadata['function_name'],
+                            'tool_call_id': metadata['tool_call'].id,
+                            'output': str(tool_output[0])
+                        })
+                        answered.add(metadata['tool_call'].id)
+
+                        if tool_output[1]:
+                            await self.aadd_context(input={'text': 'Here are the tool output images:\n', 'images': tool_output[1] \
+                                if isinstance(tool_output[1], list) else [tool_output[1]]})
+                except BaseException as exc:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    self._close_pending_tool_calls(tool_calls, answered, exc)
+                    raise
                 
                 # If agent communicated to another agent and doesn't allow user input, stop
                 if communication_occurred and not self.allow_user_input:
@@ -211,8 +318,10 @@ class AsyncAgent(AgentInterface):
             else:
                 if self.allow_user_input:
                     try:
-                        user_input = self._call_user_loop(message_text or "")
-                        self.add_context(input={'text': user_input})
+                        user_input = await self._acall_user_loop(message_text or "")
+                        await self.aadd_context(input={'text': user_input})
+                    except SuspendRun:
+                        return self._suspend(message_text or "", turn_count, final_output)
                     except NotImplementedError:
                         break
                 else:
@@ -0,0 +1,137 @@
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional
+
+# Absolute deadline on the time.monotonic() clock, which asyncio's loop.time() also uses.
+_deadline: ContextVar[Optional[float]] = ContextVar('flowtic_deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+def get_deadline() -> Optional[float]:
+    return _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the active deadline, or None if there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def check_deadline() -> None:
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("Deadline exceeded")
+
+
+@contextmanager
+def deadline(timeout: Optional[float]):
+    """
+    Run the block under a deadline ``timeout`` seconds from now.
+
+    Nested deadlines can only shorten the active one, so a handoff never
+    outlives the call that started it. ``None`` keeps the active deadline.
+    """
+    if timeout is None:
+        yield get_deadline()
+        return
+
+    current = _deadline.get()
+    new_deadline = time.monotonic() + timeout
+    if current is not None:
+        new_deadline = min(current, new_deadline)
+
+    token = _deadline.set(new_deadline)
+    try:
+        yield new_deadline
+    finally:
+        _deadline.reset(token)
+
+
+def call_within_deadline(func: Callable, *args, **kwargs) -> Any:
+    """
+    Call a blocking function, giving up when the active deadline passes.
+
+    The function runs in a daemon thread that is abandoned on timeout, since
+    Python threads cannot be killed.
+    """
+    left = remaining()
+    if left is None:
+        return func(*args, **kwargs)
+    check_deadline()
+
+    result = {}
+    context = contextvars.copy_context()
+
+    def target():
+        try:
+            result['value'] = context.run(func, *args, **kwargs)
+        except BaseException as exc:
+            result['error'] = exc
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(left)
+    if thread.is_alive():
+        raise DeadlineExceeded(f"Deadline exceeded while running {getattr(func, '__name__', func)!r}")
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking function in a daemon thread without blocking the event loop.
+
+    Unlike ``asyncio.to_thread``, an abandoned call does not hold up loop
+    shutdown, so a hung tool cannot outlive a cancelled run's ``asyncio.run``.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    context = contextvars.copy_context()
+
+    def resolve(value: Any = None, error: Optional[BaseException] = None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def target():
+        try:
+            value = context.run(func, *args, **kwargs)
+        except BaseException as exc:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(resolve, None, exc)
+            return
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(resolve, value)
+
+    threading.Thread(target=target, daemon=True).start()
+    return await future
+
+
+async def await_within_deadline(awaitable: Awaitable) -> Any:
+    """Await ``awaitable``, cancelling it and raising ``DeadlineExceeded`` when the active deadline passes."""
+    deadline_at = get_deadline()
+    if deadline_at is None:
+        return await awaitable
+
+    try:
+        async with asyncio.timeout_at(deadline_at):
+            return await awaitable
+    except DeadlineExceeded:
+        raise
+    except TimeoutError as exc:
+        if time.monotonic() < deadline_at:
+            raise
+        raise DeadlineExceeded("Deadline exceeded") from exc
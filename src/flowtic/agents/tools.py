@@ -1,40 +1,234 @@
-from typing import Dict, Callable, List
+import importlib
+import threading
+from abc import ABC, abstractmethod
+import time
+from typing import Any, Dict, Callable, Iterable, List, Optional
+
+from flowtic.agents.validation import ToolArgumentError, compile_validator, parse_arguments
+from flowtic.retrieval import BM25Index
 
 class Tool():
     def __init__(
         self,
         tool_definition: Dict,
         tool_execution: Callable,
+        pinned: bool = False,
     ) -> None:
         self.tool_definition = tool_definition
         self.tool_execution = tool_execution
+        self.pinned = pinned
 
         assert tool_definition['function']['name'] == tool_execution.__name__, "Tool name mismatch"
+        self._compile_validator()
+
+    def _compile_validator(self) -> None:
+        self._validator = compile_validator(self.tool_definition['function'].get('parameters'))
+        self._stats_lock = threading.Lock()
+        self.validation_stats = {'calls': 0, 'failures': 0, 'seconds': 0.0}
 
     def get_name(self) -> str:
         return self.tool_definition['function']['name']
 
+    def parse_arguments(self, raw: Any) -> Dict[str, Any]:
+        """Decode and validate the model's arguments, raising ``ToolArgumentError`` if they don't fit the schema."""
+        started = time.perf_counter()
+        failed = False
+        try:
+            return parse_arguments(raw, self._validator)
+        except ToolArgumentError:
+            failed = True
+            raise
+        finally:
+            with self._stats_lock:
+                self.validation_stats['calls'] += 1
+                self.validation_stats['failures'] += failed
+                self.validation_stats['seconds'] += time.perf_counter() - started
+
+    def get_search_text(self) -> str:
+        function = self.tool_definition['function']
+        parts = [function['name'], function.get('description', '')]
+        for name, schema in function.get('parameters', {}).get('properties', {}).items():
+            parts.append(name)
+            parts.append(schema.get('description', ''))
+        return ' '.join(parts)
+
+class LazyTool(Tool):
+    """
+    A tool whose implementation is imported the first time it is called.
+
+    Args:
+        tool_definition (Dict): The tool schema sent to the model.
+        import_path (str): Where the implementation lives, as ``"package.module:function"``.
+        pinned (bool, optional): Always send this tool, even when a selector is used. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        tool_definition: Dict,
+        import_path: str,
+        pinned: bool = False,
+    ) -> None:
+        module_name, _, attribute = import_path.partition(':')
+        if not module_name or not attribute:
+            raise ValueError(f"Invalid import path {import_path!r}, expected 'package.module:function'")
+
+        self.tool_definition = tool_definition
+        self.import_path = import_path
+        self.pinned = pinned
+        self.import_seconds: Optional[float] = None
+        self._tool_execution: Optional[Callable] = None
+        self._lock = threading.Lock()
+        self._compile_validator()
+
+    @property
+    def resolved(self) -> bool:
+        return self._tool_execution is not None
+
+    @property
+    def tool_execution(self) -> Callable:
+        if self._tool_execution is None:
+            self.resolve()
+        return self._tool_execution
+
+    def resolve(self) -> Callable:
+        with self._lock:
+            if self._tool_execution is None:
+                module_name, _, attribute = self.import_path.partition(':')
+                started = time.perf_counter()
+                try:
+                    target = importlib.import_module(module_name)
+                    for part in attribute.split('.'):
+                        target = getattr(target, part)
+                except (ImportError, AttributeError) as exc:
+                    raise ImportError(f"Cannot load tool {self.get_name()!r} from {self.import_path!r}: {exc}") from exc
+                if not callable(target):
+                    raise TypeError(f"Tool {self.get_name()!r}: {self.import_path!r} is not callable")
+                self.import_seconds = time.perf_counter() - started
+                self._tool_execution = target
+        return self._tool_execution
+
+class ToolSelector(ABC):
+    """Picks the tool schemas sent to the model on a turn."""
+
+    @abstractmethod
+    def add(self, tool: Tool) -> None: ...
+
+    @abstractmethod
+    def remove(self, tool_name: str) -> None: ...
+
+    @abstractmethod
+    def select(self, query: str) -> List[str]: ...
+
+class BM25ToolSelector(ToolSelector):
+    """
+    Send only the ``top_k`` tools whose name and description best match the conversation.
+
+    Args:
+        top_k (int, optional): Number of retrieved tools per turn, on top of pinned ones. Defaults to 8.
+    """
+
+    def __init__(self, top_k: int = 8) -> None:
+        self.top_k = top_k
+        self._index = BM25Index()
+
+    def add(self, tool: Tool) -> None:
+        self._index.add(tool.get_name(), tool.get_search_text())
+
+    def remove(self, tool_name: str) -> None:
+        self._index.remove(tool_name)
+
+    def select(self, query: str) -> List[str]:
+        return [name for name, _ in self._index.search(query, self.top_k)]
+
 class Tools():
     def __init__(
         self,
-        tools: List[Tool]
+        tools: List[Tool],
+        selector: Optional[ToolSelector] = None,
     ):
-        self.tools = tools
-        self._map = None
-        self._create_map()
-    
-    def _create_map(self):
-        self._map = {tool.get_name(): tool.tool_execution for tool in self.tools}
-    
+        self._map: Dict[str, Tool] = {}
+        self.selector = selector
+        for tool in tools:
+            self.register_tool(tool)
+
+    @property
+    def tools(self) -> List[Tool]:
+        return list(self._map.values())
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, tool_name: str) -> bool:
+        return tool_name in self._map
+
     def get_callable(self, tool_name: str) -> Callable:
         if tool_name not in self._map:
             raise ValueError(f"Tool {tool_name} not found")
-        return self._map[tool_name]
-    
+        return self._map[tool_name].tool_execution
+
     def get_definitions(self) -> List[Dict]:
-        return [tool.tool_definition for tool in self.tools]
-    
+        return [tool.tool_definition for tool in self._map.values()]
+
+    def select_definitions(self, query: str, include: Iterable[str] = ()) -> List[Dict]:
+        """
+        Definitions to send for a turn: the selector's picks for ``query``, pinned tools and ``include``.
+
+        Without a selector every definition is returned.
+        """
+        if self.selector is None:
+            return self.get_definitions()
+
+        wanted = set(self.selector.select(query)) | set(include)
+        return [
+            tool.tool_definition
+            for name, tool in self._map.items()
+            if tool.pinned or name in wanted
+        ]
+
+    def parse_arguments(self, tool_name: str, raw: Any) -> Dict[str, Any]:
+        if tool_name not in self._map:
+            raise ToolArgumentError(f"there is no tool called {tool_name!r}. Available tools: {list(self._map)}")
+        return self._map[tool_name].parse_arguments(raw)
+
+    def validation_report(self) -> Dict[str, Dict[str, Any]]:
+        """Argument validations, failures, failure rate and total validation seconds per tool."""
+        report = {}
+        for name, tool in self._map.items():
+            stats = dict(tool.validation_stats)
+            stats['failure_rate'] = stats['failures'] / stats['calls'] if stats['calls'] else 0.0
+            report[name] = stats
+        return report
+
+    def preload(self) -> None:
+        """Resolve every lazy tool now, e.g. in a worker's warm-up instead of its first request."""
+        for tool in self._map.values():
+            if isinstance(tool, LazyTool):
+                tool.resolve()
+
+    def import_report(self) -> List[Dict[str, Any]]:
+        """
+        Import cost of each lazy tool, slowest first.
+
+        ``seconds`` is None for tools that have not been called yet. A module
+        already imported by an earlier tool costs close to nothing, so the
+        first tool from a heavy package carries its whole import time.
+        """
+        report = [
+            {
+                'name': name,
+                'import_path': tool.import_path,
+                'resolved': tool.resolved,
+                'seconds': tool.import_seconds,
+            }
+            for name, tool in self._map.items()
+            if isinstance(tool, LazyTool)
+        ]
+        return sorted(report, key=lambda row: row['seconds'] or 0.0, reverse=True)
+
     def register_tool(self, tool: Tool) -> None:
-        self.tools = [existing_tool for existing_tool in self.tools if existing_tool.get_name() != tool.get_name()]
-        self.tools.append(tool)
-        self._create_map()
+        name = tool.get_name()
+        if self.selector is not None:
+            if name in self._map:
+                self.selector.remove(name)
+            self.selector.add(tool)
+        self._map[name] = tool
@@ -0,0 +1,110 @@
+import json
+from typing import Any, Callable, Dict, List
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    'string': lambda value: isinstance(value, str),
+    'integer': lambda value: isinstance(value, int) and not isinstance(value, bool),
+    'number': lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    'boolean': lambda value: isinstance(value, bool),
+    'object': lambda value: isinstance(value, dict),
+    'array': lambda value: isinstance(value, list),
+    'null': lambda value: value is None,
+}
+
+Validator = Callable[[Any, str, List[str]], None]
+
+
+class ToolArgumentError(ValueError):
+    """A tool call the model has to repair: unknown tool, unparsable JSON or arguments that break the schema."""
+
+
+def _compile(schema: Dict[str, Any]) -> Validator:
+    checks: List[Validator] = []
+
+    types = schema.get('type')
+    if types is not None:
+        types = [types] if isinstance(types, str) else list(types)
+        type_checks = [_TYPE_CHECKS[name] for name in types if name in _TYPE_CHECKS]
+        expected = ' or '.join(types)
+
+        def check_type(value, path, errors):
+            if type_checks and not any(check(value) for check in type_checks):
+                errors.append(f"{path} must be {expected}, got {type(value).__name__}")
+        checks.append(check_type)
+
+    if 'enum' in schema:
+        allowed = list(schema['enum'])
+
+        def check_enum(value, path, errors):
+            if value not in allowed:
+                errors.append(f"{path} must be one of {allowed}, got {value!r}")
+        checks.append(check_enum)
+
+    properties = {name: _compile(subschema) for name, subschema in schema.get('properties', {}).items()}
+    required = list(schema.get('required', []))
+    additional = schema.get('additionalProperties', True)
+    if properties or required or additional is not True:
+        extra = _compile(additional) if isinstance(additional, dict) else None
+
+        def check_object(value, path, errors):
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    errors.append(f"{path}.{name} is required")
+            for name, item in value.items():
+                if name in properties:
+                    properties[name](item, f"{path}.{name}", errors)
+                elif additional is False:
+                    errors.append(f"{path}.{name} is not an allowed argument")
+                elif extra is not None:
+                    extra(item, f"{path}.{name}", errors)
+        checks.append(check_object)
+
+    if isinstance(schema.get('items'), dict):
+        items = _compile(schema['items'])
+
+        def check_items(value, path, errors):
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    items(item, f"{path}[{index}]", errors)
+        checks.append(check_items)
+
+    def validate(value, path, errors):
+        for check in checks:
+            check(value, path, errors)
+    return validate
+
+
+def compile_validator(schema: Dict[str, Any]) -> Callable[[Any], List[str]]:
+    """
+    Compile a JSON schema into a function returning the list of problems with a value.
+
+    Covers what tool schemas use in practice: ``type``, ``enum``, ``properties``,
+    ``required``, ``additionalProperties`` and ``items``. Other keywords are ignored.
+    """
+    validate = _compile(schema or {'type': 'object'})
+
+    def validator(value: Any) -> List[str]:
+        errors: List[str] = []
+        validate(value, 'arguments', errors)
+        return errors
+    return validator
+
+
+def parse_arguments(raw: Any, validator: Callable[[Any], List[str]]) -> Dict[str, Any]:
+    if isinstance(raw, dict):
+        arguments = raw
+    else:
+        try:
+            arguments = json.loads(raw or '{}')
+        except (TypeError, ValueError) as exc:
+            raise ToolArgumentError(f"arguments are not valid JSON ({exc})") from None
+
+    if not isinstance(arguments, dict):
+        raise ToolArgumentError(f"arguments must be a JSON object, got {type(arguments).__name__}")
+
+    errors = validator(arguments)
+    if errors:
+        raise ToolArgumentError("; ".join(errors))
+    return arguments
@@ -0,0 +1,4 @@
+from .core import BatchItemResult, BatchRunner, BatchStats, aexecute_many, execute_many
+from .pool import WorkerError, WorkerPool
+
+__all__ = ['BatchItemResult', 'BatchRunner', 'BatchStats', 'WorkerError', 'WorkerPool', 'aexecute_many', 'execute_many']
@@ -0,0 +1,291 @@
+import asyncio
+import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional
+
+
+class BatchItemResult:
+    def __init__(
+        self,
+        index: int,
+        input: Any,
+        output: Any = None,
+        error: Optional[BaseException] = None,
+        attempts: int = 0,
+        elapsed: float = 0.0,
+    ) -> None:
+        self.index = index
+        self.input = input
+        self.output = output
+        self.error = error
+        self.attempts = attempts
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchItemResult(index={self.index}, {status}, attempts={self.attempts})"
+
+
+class BatchStats:
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retries = 0
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def in_flight(self) -> int:
+        return self.submitted - self.completed
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Completed items per second of wall time."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'retries': self.retries,
+            'in_flight': self.in_flight,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchStats(completed={self.completed}, failed={self.failed}, "
+            f"retries={self.retries}, throughput={self.throughput:.2f}/s)"
+        )
+
+
+def _normalize_item(item: Any) -> Dict[str, Any]:
+    if isinstance(item, str):
+        return {'input': item}
+    if isinstance(item, dict) and 'input' in item:
+        return item
+    raise TypeError("Batch inputs must be strings or dicts with an 'input' key (and optional 'images', 'start_agent')")
+
+
+def _invoke(target: Any, item: Dict[str, Any]):
+    kwargs = {'images': item.get('images')}
+    if hasattr(target, 'async_execute'):
+        if item.get('start_agent'):
+            kwargs['start_agent'] = item['start_agent']
+        if target.async_run_type:
+            return target.async_execute(item['input'], **kwargs)
+        return target.execute(item['input'], **kwargs)
+    return target(item['input'], **kwargs)
+
+
+def _is_async_target(target: Any) -> bool:
+    if hasattr(target, 'async_execute'):
+        return bool(target.async_run_type)
+    return inspect.iscoroutinefunction(type(target).__call__)
+
+
+class BatchRunner:
+    """
+    Run many independent inputs through an agent or protocol.
+
+    Every attempt builds a fresh target from ``factory``, so items never share
+    agents or sessions.
+
+    Args:
+        factory (Callable): Returns a new ``Agent``, ``AsyncAgent`` or ``CommunicationProtocol`` per call.
+        concurrency (int, optional): Maximum items in flight. Defaults to 8.
+        retries (int, optional): Extra attempts for a failing item. Defaults to 0.
+        retry_delay (float, optional): Seconds before the first retry, doubled on each further retry. Defaults to 0.
+        on_progress (Optional[Callable[[BatchStats], Any]], optional): Called after every finished item. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        concurrency: int = 8,
+        retries: int = 0,
+        retry_delay: float = 0.0,
+        on_progress: Optional[Callable[[BatchStats], Any]] = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.factory = factory
+        self.concurrency = concurrency
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.on_progress = on_progress
+        self.stats = BatchStats()
+
+    def _backoff(self, attempt: int) -> float:
+        return self.retry_delay * (2 ** (attempt - 1)) if self.retry_delay > 0 else 0.0
+
+    def _run_item(self, index: int, item: Any) -> BatchItemResult:
+        result = BatchItemResult(index, item)
+        try:
+            normalized = _normalize_item(item)
+        except TypeError as exc:
+            # Retrying can't fix a malformed input, so it fails on the spot.
+            result.attempts, result.error = 1, exc
+            return result
+        started = time.perf_counter()
+
+        for attempt in range(1, self.retries + 2):
+            result.attempts = attempt
+            try:
+                output = _invoke(self.factory(), normalized)
+                if inspect.isawaitable(output):
+                    output = asyncio.run(output)
+                result.output, result.error = output, None
+                break
+            except Exception as exc:
+                result.error = exc
+                if attempt <= self.retries:
+                    time.sleep(self._backoff(attempt))
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    async def _arun_item(self, index: int, item: Any) -> BatchItemResult:
+        result = BatchItemResult(index, item)
+        try:
+            normalized = _normalize_item(item)
+        except TypeError as exc:
+            # Retrying can't fix a malformed input, so it fails on the spot.
+            result.attempts, result.error = 1, exc
+            return result
+        started = time.perf_counter()
+
+        for attempt in range(1, self.retries + 2):
+            result.attempts = attempt
+            try:
+                target = self.factory()
+                if _is_async_target(target):
+                    output = await _invoke(target, normalized)
+                else:
+                    output = await asyncio.to_thread(_invoke, target, normalized)
+                result.output, result.error = output, None
+                break
+            except Exception as exc:
+                result.error = exc
+                if attempt <= self.retries:
+                    await asyncio.sleep(self._backoff(attempt))
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _record(self, result: BatchItemResult) -> BatchItemResult:
+        if result.ok:
+            self.stats.succeeded += 1
+        else:
+            self.stats.failed += 1
+        self.stats.retries += result.attempts - 1
+
+        if self.on_progress is not None:
+            self.on_progress(self.stats)
+        return result
+
+    def _start(self) -> None:
+        self.stats = BatchStats()
+        self.stats.started_at = time.perf_counter()
+
+    def map(self, inputs: Iterable[Any]) -> Iterator[BatchItemResult]:
+        """
+        Run the inputs on a thread pool and yield results in completion order.
+
+        Args:
+            inputs (Iterable): Strings, or dicts with ``input`` and optional ``images``/``start_agent``.
+                Consumed lazily, so generators of any size are fine.
+        """
+        self._start()
+        items = enumerate(inputs)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending = set()
+
+            def fill():
+                for index, item in items:
+                    pending.add(executor.submit(self._run_item, index, item))
+                    self.stats.submitted += 1
+                    if len(pending) >= self.concurrency:
+                        break
+
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    yield self._record(future.result())
+                fill()
+
+        self.stats.finished_at = time.perf_counter()
+
+    async def amap(self, inputs: Iterable[Any]) -> AsyncIterator[BatchItemResult]:
+        """
+        Run the inputs as asyncio tasks and yield results in completion order.
+
+        Synchronous agents and protocols are run in worker threads.
+
+        Args:
+            inputs (Iterable): Strings, or dicts with ``input`` and optional ``images``/``start_agent``.
+        """
+        self._start()
+        items = enumerate(inputs)
+        pending = set()
+
+        def fill():
+            for index, item in items:
+                pending.add(asyncio.create_task(self._arun_item(index, item)))
+                self.stats.submitted += 1
+                if len(pending) >= self.concurrency:
+                    break
+
+        try:
+            fill()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    yield self._record(task.result())
+                fill()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self.stats.finished_at = time.perf_counter()
+
+    def execute_many(self, inputs: Iterable[Any]) -> List[BatchItemResult]:
+        """Run the inputs and return every result in input order."""
+        return sorted(self.map(inputs), key=lambda result: result.index)
+
+    async def aexecute_many(self, inputs: Iterable[Any]) -> List[BatchItemResult]:
+        """Run the inputs asynchronously and return every result in input order."""
+        return sorted([result async for result in self.amap(inputs)], key=lambda result: result.index)
+
+
+def execute_many(factory: Callable[[], Any], inputs: Iterable[Any], **kwargs) -> List[BatchItemResult]:
+    return BatchRunner(factory, **kwargs).execute_many(inputs)
+
+
+async def aexecute_many(factory: Callable[[], Any], inputs: Iterable[Any], **kwargs) -> List[BatchItemResult]:
+    return await BatchRunner(factory, **kwargs).aexecute_many(inputs)
@@ -0,0 +1,286 @@
+import json
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from flowtic.batch.core import BatchItemResult, BatchRunner, BatchStats, _normalize_item
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    output TEXT,
+    error TEXT,
+    worker TEXT,
+    leased_at REAL,
+    elapsed REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+'''
+
+
+class WorkerError(RuntimeError):
+    """An item failed inside a worker process (the message is the original error), or a worker died mid-run."""
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    return connection
+
+
+def _claim(connection: sqlite3.Connection, worker: str, lease_timeout: float) -> Optional[tuple]:
+    connection.execute('BEGIN IMMEDIATE')
+    try:
+        row = connection.execute(
+            "SELECT id, payload FROM jobs WHERE status = 'pending' "
+            "OR (status = 'running' AND leased_at < ?) ORDER BY id LIMIT 1",
+            (time.time() - lease_timeout,),
+        ).fetchone()
+        if row is not None:
+            connection.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, leased_at = ? WHERE id = ?",
+                (worker, time.time(), row[0]),
+            )
+        connection.execute('COMMIT')
+    except BaseException:
+        connection.execute('ROLLBACK')
+        raise
+    return row
+
+
+def _fail(connection: sqlite3.Connection, error: BaseException, job_id: Optional[int] = None, worker: Optional[str] = None) -> None:
+    message = f"{type(error).__name__}: {error}"
+    if job_id is not None:
+        connection.execute(
+            "UPDATE jobs SET status = 'failed', attempts = attempts + 1, error = ? WHERE id = ?", (message, job_id)
+        )
+    else:
+        connection.execute(
+            "UPDATE jobs SET status = 'failed', error = ? WHERE status = 'running' AND worker = ?", (message, worker)
+        )
+
+
+def _worker_main(db_path: str, factory: Callable[[], Any], retries: int, concurrency: int, lease_timeout: float):
+    connection = _connect(db_path)
+    worker = f"{os.getpid()}"
+
+    def jobs() -> Iterator[Dict[str, Any]]:
+        while True:
+            row = _claim(connection, worker, lease_timeout)
+            if row is None:
+                return
+            job_id, payload = row
+            try:
+                item = _normalize_item(json.loads(payload))
+            except (TypeError, ValueError) as exc:
+                _fail(connection, exc, job_id=job_id)
+                continue
+            yield {**item, '_job_id': job_id}
+
+    # Jobs are claimed lazily by the runner, so a worker never holds more leases than it has slots.
+    runner = BatchRunner(factory, concurrency=concurrency, retries=retries)
+    try:
+        for result in runner.map(jobs()):
+            connection.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + ?, output = ?, error = ?, elapsed = ? WHERE id = ?",
+                (
+                    'done' if result.ok else 'failed',
+                    result.attempts,
+                    json.dumps(result.output, default=str) if result.ok else None,
+                    None if result.ok else f"{type(result.error).__name__}: {result.error}",
+                    result.elapsed,
+                    result.input['_job_id'],
+                ),
+            )
+    except Exception as exc:
+        # Don't leave this worker's jobs leased until the timeout; record why they failed and exit non-zero.
+        _fail(connection, exc, worker=worker)
+        raise
+    finally:
+        connection.close()
+
+
+class WorkerPool:
+    """
+    Shard batch runs across processes through a durable SQLite job queue.
+
+    Jobs survive crashes: running ``run()`` again on the same ``db_path`` picks
+    up pending jobs and jobs whose lease expired.
+
+    Args:
+        factory (Callable): A picklable (module-level) callable returning a new ``Agent``,
+            ``AsyncAgent`` or ``CommunicationProtocol``. Called inside the workers.
+        workers (Optional[int], optional): Number of processes. Defaults to ``os.cpu_count()``.
+        db_path (Optional[str], optional): Path of the SQLite queue. Defaults to a temporary file.
+        concurrency (int, optional): Items in flight per worker process. Defaults to 1.
+        retries (int, optional): Extra attempts for a failing item. Defaults to 0.
+        lease_timeout (float, optional): Seconds after which a running job of a dead worker is reclaimed. Defaults to 3600.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        workers: Optional[int] = None,
+        db_path: Optional[str] = None,
+        *,
+        concurrency: int = 1,
+        retries: int = 0,
+        lease_timeout: float = 3600,
+    ) -> None:
+        self.factory = factory
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.retries = retries
+        self.lease_timeout = lease_timeout
+        self.stats = BatchStats()
+
+        if db_path is None:
+            handle, db_path = tempfile.mkstemp(prefix='flowtic-queue-', suffix='.sqlite3')
+            os.close(handle)
+        self.db_path = db_path
+
+        connection = _connect(self.db_path)
+        connection.executescript(_SCHEMA)
+        connection.close()
+
+    def submit(self, inputs: Iterable[Any]) -> List[int]:
+        """
+        Queue inputs and return their job ids.
+
+        Args:
+            inputs (Iterable): Strings, or JSON-serializable dicts with ``input`` and optional ``images``/``start_agent``.
+
+        Raises:
+            TypeError: If an input is neither a string nor a dict with an ``input`` key, or isn't JSON-serializable.
+        """
+        payloads = [json.dumps(_normalize_item(item)) for item in inputs]
+        connection = _connect(self.db_path)
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            ids = [connection.execute('INSERT INTO jobs (payload) VALUES (?)', (payload,)).lastrowid for payload in payloads]
+            connection.execute('COMMIT')
+        finally:
+            connection.close()
+        return ids
+
+    def progress(self) -> Dict[str, int]:
+        connection = _connect(self.db_path)
+        try:
+            rows = connection.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        finally:
+            connection.close()
+        counts = {'pending': 0, 'running': 0, 'done': 0, 'failed': 0}
+        counts.update(dict(rows))
+        return counts
+
+    def run(
+        self,
+        inputs: Optional[Iterable[Any]] = None,
+        on_progress: Optional[Callable[[BatchStats], Any]] = None,
+        poll_interval: float = 1.0,
+    ) -> List[BatchItemResult]:
+        """
+        Drain the queue with the worker processes and return every finished job in id order.
+
+        Args:
+            inputs (Optional[Iterable], optional): Inputs to submit before starting. Defaults to None.
+            on_progress (Optional[Callable[[BatchStats], Any]], optional): Polled every ``poll_interval`` seconds. Defaults to None.
+            poll_interval (float, optional): Seconds between progress polls. Defaults to 1.0.
+
+        Raises:
+            WorkerError: If a worker process died while jobs were still unfinished. They are put back in the queue.
+        """
+        if inputs is not None:
+            self.submit(inputs)
+
+        stats = BatchStats()
+        stats.started_at = time.perf_counter()
+        context = multiprocessing.get_context('spawn')
+        processes = [
+            context.Process(
+                target=_worker_main,
+                args=(self.db_path, self.factory, self.retries, self.concurrency, self.lease_timeout),
+                daemon=True,
+            )
+            for _ in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            while any(process.is_alive() for process in processes):
+                for process in processes:
+                    process.join(timeout=poll_interval / len(processes))
+                if on_progress is not None:
+                    self._update_stats(stats)
+                    on_progress(stats)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        self._update_stats(stats)
+        stats.finished_at = time.perf_counter()
+        self.stats = stats
+
+        crashed = [process for process in processes if process.exitcode]
+        if crashed:
+            # A dead worker's leases would otherwise block its jobs until lease_timeout.
+            connection = _connect(self.db_path)
+            try:
+                connection.execute(
+                    f"UPDATE jobs SET status = 'pending', worker = NULL, leased_at = NULL "
+                    f"WHERE status = 'running' AND worker IN ({', '.join('?' * len(crashed))})",
+                    [str(process.pid) for process in crashed],
+                )
+            finally:
+                connection.close()
+            pending = self.progress()['pending']
+            if pending:
+                raise WorkerError(
+                    f"{len(crashed)} worker(s) exited with codes {[process.exitcode for process in crashed]}, "
+                    f"leaving {pending} jobs unfinished. Call run() again to resume them."
+                )
+        return list(self.results())
+
+    def _update_stats(self, stats: BatchStats) -> None:
+        counts = self.progress()
+        stats.succeeded = counts['done']
+        stats.failed = counts['failed']
+        stats.submitted = sum(counts.values())
+
+        connection = _connect(self.db_path)
+        try:
+            stats.retries = connection.execute(
+                "SELECT COALESCE(SUM(attempts - 1), 0) FROM jobs WHERE status IN ('done', 'failed')"
+            ).fetchone()[0]
+        finally:
+            connection.close()
+
+    def results(self) -> Iterator[BatchItemResult]:
+        """Yield every finished job in id order."""
+        connection = _connect(self.db_path)
+        try:
+            rows = connection.execute(
+                "SELECT id, payload, status, attempts, output, error, elapsed FROM jobs "
+                "WHERE status IN ('done', 'failed') ORDER BY id"
+            ).fetchall()
+        finally:
+            connection.close()
+
+        for job_id, payload, status, attempts, output, error, elapsed in rows:
+            yield BatchItemResult(
+                index=job_id,
+                input=json.loads(payload),
+                output=json.loads(output) if output is not None else None,
+                error=WorkerError(error) if status == 'failed' else None,
+                attempts=attempts,
+                elapsed=elapsed or 0.0,
+            )
@@ -1,4 +1,4 @@
-from .callbacks import Callback
-from .channel import CommunicationProtocol
+from .callbacks import Callback, SuspendRun
+from .channel import ArtifactStore, CommunicationProtocol, HandoffLimitError, RunContext
 
-__all__ = ['Callback', 'CommunicationProtocol']
+__all__ = ['ArtifactStore', 'Callback', 'SuspendRun', 'CommunicationProtocol', 'HandoffLimitError', 'RunContext']
@@ -1,4 +1,15 @@
-from typing import Dict, Any
+import inspect
+from typing import Any, Callable, Dict
+
+
+class SuspendRun(Exception):
+    """
+    Raise from ``on_user_loop`` to park the run until the user replies.
+
+    The agent returns a ``SuspendedRun`` carrying a resumable token instead of
+    blocking while a human types.
+    """
+
 
 class Callback:
     def __init__(self) -> None:
@@ -9,3 +20,25 @@ class Callback:
 
     def on_tool_call(self, agent_name: str, fn_name: str, arguments: Dict[str, Any]):
         return None
+
+
+def callback_args(method: Callable, agent_name: str, *args: Any) -> tuple:
+    """
+    Positional arguments for a callback hook.
+
+    Hooks may be written with or without the leading ``agent_name``, e.g.
+    ``on_tool_call(self, fn_name, arguments)``; the name is passed only when
+    the method takes more positional arguments than ``args``.
+    """
+    parameters = inspect.signature(method).parameters.values()
+    if any(parameter.kind == inspect.Parameter.VAR_POSITIONAL for parameter in parameters):
+        return (agent_name, *args)
+
+    positional_params = [
+        parameter
+        for parameter in parameters
+        if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    if len(positional_params) <= len(args):
+        return args
+    return (agent_name, *args)
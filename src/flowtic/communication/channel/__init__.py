@@ -1 +1,3 @@
 from .core import CommunicationProtocol as CommunicationProtocol
+from .context import HandoffLimitError as HandoffLimitError, RunContext as RunContext
+from .artifacts import ArtifactStore as ArtifactStore
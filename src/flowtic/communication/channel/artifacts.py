@@ -0,0 +1,186 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+from flowtic.agents.tools import Tool
+
+DEFAULT_READ_LENGTH = 4000
+_PREVIEW_LENGTH = 200
+
+
+class ArtifactStore:
+    """
+    Run-scoped blackboard shared by the agents of one protocol run.
+
+    Each artifact is stored once under a short handle such as ``artifact-1``.
+    Agents pass the handle through handoffs and read slices of the text with
+    the ``read_artifact`` tool, so large payloads are not copied into every
+    agent's history.
+    """
+
+    def __init__(self) -> None:
+        self._artifacts: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._artifacts)
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self._artifacts
+
+    def put(self, content: str, name: str = "", author: Optional[str] = None) -> str:
+        with self._lock:
+            handle = f"artifact-{len(self._artifacts) + 1}"
+            self._artifacts[handle] = {'content': str(content), 'name': name, 'author': author}
+        return handle
+
+    def get(self, handle: str) -> str:
+        try:
+            return self._artifacts[handle]['content']
+        except KeyError:
+            raise KeyError(f"No artifact called {handle!r}") from None
+
+    def read(self, handle: str, start: int = 0, length: int = DEFAULT_READ_LENGTH) -> str:
+        content = self.get(handle)
+        start = max(0, start)
+        end = min(len(content), start + max(0, length))
+        return content[start:end]
+
+    def describe(self, handle: str) -> Dict[str, Any]:
+        artifact = self._artifacts[handle]
+        return {
+            'handle': handle,
+            'name': artifact['name'],
+            'author': artifact['author'],
+            'size': len(artifact['content']),
+        }
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            handles = list(self._artifacts)
+        return [self.describe(handle) for handle in handles]
+
+    def reference(self, handle: str) -> str:
+        """Short stand-in for an artifact: its handle, size and the first few hundred characters."""
+        content = self.get(handle)
+        preview = content[:_PREVIEW_LENGTH] + ("..." if len(content) > _PREVIEW_LENGTH else "")
+        return (
+            f"[{handle}: {len(content)} characters, stored in the shared artifact store. "
+            f"Use read_artifact to read it.]\nPreview: {preview}"
+        )
+
+    def spill(self, text: str, threshold: int, name: str = "", author: Optional[str] = None) -> str:
+        """Return ``text`` unchanged if it is short, otherwise store it and return its reference."""
+        if threshold < 0 or len(text) <= threshold:
+            return text
+        return self.reference(self.put(text, name=name, author=author))
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {handle: dict(artifact) for handle, artifact in self._artifacts.items()}
+
+    def load(self, artifacts: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._artifacts = {handle: dict(artifact) for handle, artifact in artifacts.items()}
+
+
+def _current_store() -> Optional[ArtifactStore]:
+    from flowtic.communication.channel.context import RunContext
+
+    run_context = RunContext.current()
+    return run_context.artifacts if run_context is not None else None
+
+
+_NO_RUN = "No protocol run is active, so there is no artifact store."
+
+
+def put_artifact(content: str, name: str = ""):
+    store = _current_store()
+    if store is None:
+        return _NO_RUN, None
+    handle = store.put(content, name=name)
+    return f"Stored as {handle} ({len(content)} characters). Pass the handle instead of the text.", None
+
+
+def read_artifact(handle: str, start: int = 0, length: int = DEFAULT_READ_LENGTH):
+    store = _current_store()
+    if store is None:
+        return _NO_RUN, None
+    if handle not in store:
+        return f"No artifact called {handle!r}. Call list_artifacts to see what is stored.", None
+
+    size = len(store.get(handle))
+    chunk = store.read(handle, start, length)
+    end = start + len(chunk)
+    more = f" Call again with start={end} for more." if end < size else ""
+    return f"[{handle} characters {start}-{end} of {size}.{more}]\n{chunk}", None
+
+
+def list_artifacts():
+    store = _current_store()
+    if store is None:
+        return _NO_RUN, None
+    artifacts = store.list()
+    if not artifacts:
+        return "The artifact store is empty.", None
+    return "\n".join(
+        f"{item['handle']}: {item['size']} characters"
+        + (f", {item['name']}" if item['name'] else "")
+        + (f", from {item['author']}" if item['author'] else "")
+        for item in artifacts
+    ), None
+
+
+def artifact_tools() -> List[Tool]:
+    return [
+        Tool(
+            tool_definition={
+                "type": "function",
+                "function": {
+                    "name": "put_artifact",
+                    "description": "Store a large piece of text (a document, code, data) in the shared artifact store and get a short handle to pass to other agents instead of the text",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "content": {"type": "string", "description": "The text to store"},
+                            "name": {"type": "string", "description": "A short descriptive name"},
+                        },
+                        "required": ["content"],
+                    },
+                },
+            },
+            tool_execution=put_artifact,
+            pinned=True,
+        ),
+        Tool(
+            tool_definition={
+                "type": "function",
+                "function": {
+                    "name": "read_artifact",
+                    "description": "Read part of a stored artifact by its handle",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "handle": {"type": "string", "description": "The artifact handle, e.g. artifact-1"},
+                            "start": {"type": "integer", "description": "Character offset to start reading from. Defaults to 0"},
+                            "length": {"type": "integer", "description": f"Number of characters to read. Defaults to {DEFAULT_READ_LENGTH}"},
+                        },
+                        "required": ["handle"],
+                    },
+                },
+            },
+            tool_execution=read_artifact,
+            pinned=True,
+        ),
+        Tool(
+            tool_definition={
+                "type": "function",
+                "function": {
+                    "name": "list_artifacts",
+                    "description": "List the artifacts in the shared artifact store",
+                    "parameters": {"type": "object", "properties": {}},
+                },
+            },
+            tool_execution=list_artifacts,
+            pinned=True,
+        ),
+    ]
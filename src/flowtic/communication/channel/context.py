@@ -0,0 +1,116 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Tuple
+
+from flowtic.communication.channel.artifacts import ArtifactStore
+
+CYCLE_POLICIES = ('allow', 'reject', 'return')
+
+_current_run: ContextVar[Optional['RunContext']] = ContextVar('flowtic_run_context', default=None)
+_active_chain: ContextVar[Tuple[str, ...]] = ContextVar('flowtic_handoff_chain', default=())
+
+
+class HandoffLimitError(RuntimeError):
+    pass
+
+
+class HandoffDeclined(str):
+    """Tool output of a handoff that was not run, so the sender keeps its turn."""
+
+
+class RunContext:
+    """
+    Tracks the handoffs of one protocol run, enforces its budget and holds
+    the run's shared ``ArtifactStore``.
+
+    The active chain is kept in a context variable, so parallel handoffs of an
+    async run each see only their own ancestors.
+
+    Args:
+        max_handoff_depth (int, optional): Maximum nesting of handoffs. Defaults to -1 (unlimited).
+        max_edge_traversals (int, optional): Maximum times one ``sender->receiver`` edge may be used. Defaults to -1 (unlimited).
+        cycle_policy (str, optional): What to do when a handoff targets an agent already in the active chain:
+            ``"allow"`` (up to ``max_cycles`` times), ``"reject"`` (raise) or ``"return"`` (tell the sender to
+            answer its caller instead). Defaults to "allow".
+        max_cycles (int, optional): Maximum cyclic handoffs under ``"allow"``. Defaults to -1 (unlimited).
+    """
+
+    def __init__(
+        self,
+        max_handoff_depth: int = -1,
+        max_edge_traversals: int = -1,
+        cycle_policy: str = 'allow',
+        max_cycles: int = -1,
+    ) -> None:
+        if cycle_policy not in CYCLE_POLICIES:
+            raise ValueError(f"Unknown cycle policy {cycle_policy!r}. Expected one of {list(CYCLE_POLICIES)}")
+
+        self.max_handoff_depth = max_handoff_depth
+        self.max_edge_traversals = max_edge_traversals
+        self.cycle_policy = cycle_policy
+        self.max_cycles = max_cycles
+        self.edge_counts = defaultdict(int)
+        self.cycle_count = 0
+        self.artifacts = ArtifactStore()
+
+    @classmethod
+    def current(cls) -> Optional['RunContext']:
+        return _current_run.get()
+
+    @property
+    def chain(self) -> Tuple[str, ...]:
+        return _active_chain.get()
+
+    @contextmanager
+    def activate(self, entry_agent: str):
+        run_token = _current_run.set(self)
+        chain_token = _active_chain.set((entry_agent,))
+        try:
+            yield self
+        finally:
+            _active_chain.reset(chain_token)
+            _current_run.reset(run_token)
+
+    def check(self, sender: str, receiver: str) -> Optional[str]:
+        """
+        Validate a handoff against the budget before it runs.
+
+        Returns a message to hand back to the sender instead of running the
+        handoff, or None if the handoff may proceed.
+        """
+        chain = self.chain or (sender,)
+        path = " -> ".join(chain + (receiver,))
+
+        if self.max_handoff_depth >= 0 and len(chain) > self.max_handoff_depth:
+            raise HandoffLimitError(f"Maximum handoff depth {self.max_handoff_depth} exceeded: {path}")
+
+        edge = (sender, receiver)
+        if self.max_edge_traversals >= 0 and self.edge_counts[edge] >= self.max_edge_traversals:
+            raise HandoffLimitError(
+                f"Edge {sender}->{receiver} traversed more than {self.max_edge_traversals} times: {path}"
+            )
+
+        if receiver in chain:
+            if self.cycle_policy == 'reject':
+                raise HandoffLimitError(f"Handoff cycle detected: {path}")
+            if self.cycle_policy == 'return':
+                return HandoffDeclined(
+                    f"{receiver} is already waiting on this conversation ({path}). "
+                    f"Do not contact {receiver} again; finish your work and reply with your final answer."
+                )
+            if self.max_cycles >= 0 and self.cycle_count >= self.max_cycles:
+                raise HandoffLimitError(f"Maximum of {self.max_cycles} handoff cycles exceeded: {path}")
+            self.cycle_count += 1
+
+        self.edge_counts[edge] += 1
+        return None
+
+    @contextmanager
+    def handoff(self, sender: str, receiver: str):
+        chain = self.chain or (sender,)
+        chain_token = _active_chain.set(chain + (receiver,))
+        try:
+            yield
+        finally:
+            _active_chain.reset(chain_token)
@@ -1,10 +1,23 @@
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from flowtic.agents import Agent
+import asyncio
+import contextvars
+import fnmatch
 import re
+import threading
 from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from flowtic.agents.deadline import await_within_deadline, deadline
 from flowtic.agents.tools import Tool
+from flowtic.communication.channel.artifacts import artifact_tools
+from flowtic.communication.channel.context import CYCLE_POLICIES, HandoffDeclined, RunContext
+from flowtic.communication.channel.dag import StaticGraph
+from flowtic.session.checkpoint import RunCheckpoint, SuspendedRun
+
+SESSION_POLICIES = ('persistent', 'fresh')
 
 class CommunicationProtocol:
     def __init__(
@@ -13,41 +26,184 @@ class CommunicationProtocol:
         agents: List['Agent'],
         async_run_type = False,
         *,
+        static: bool = False,
+        max_handoff_depth: int = -1,
+        max_edge_traversals: int = -1,
+        cycle_policy: str = 'allow',
+        max_cycles: int = -1,
+        artifact_threshold: Optional[int] = None,
+        groups: Optional[Dict[str, List[str]]] = None,
+        session_policies: Optional[Dict[str, Union[str, int]]] = None,
+        default_session_policy: Union[str, int] = 'persistent',
         verbose: bool = False,
     ) -> None:
+        """
+        Initialize the communication protocol.
+
+        Args:
+            logic_str (str): The communication graph, e.g. ``"a->b, a->c, b->d"``. Either side of an edge
+                may also be a set ``{a,b,c}``, a group ``workers[*]`` or a glob such as ``worker_*`` or ``*``.
+            agents (List[Agent]): The agents referenced by the graph.
+            async_run_type (bool, optional): Whether the agents are ``AsyncAgent``s. Defaults to False.
+            static (bool, optional): Run the graph as a fixed DAG instead of model-driven handoffs.
+                Agents run in topological order, independent branches in parallel, and each
+                agent's output is passed directly to its successors. Runs always start at the source agents,
+                so ``start_agent`` is rejected. Defaults to False.
+            max_handoff_depth (int, optional): Maximum nesting of handoffs in one run. Defaults to -1 (unlimited).
+            max_edge_traversals (int, optional): Maximum uses of one ``sender->receiver`` edge in one run. Defaults to -1 (unlimited).
+            cycle_policy (str, optional): Handling of handoffs to an agent already in the active chain:
+                ``"allow"``, ``"reject"`` or ``"return"``. Defaults to "allow".
+            max_cycles (int, optional): Maximum cyclic handoffs per run under ``"allow"``. Defaults to -1 (unlimited).
+            artifact_threshold (Optional[int], optional): Give every agent the shared artifact tools and replace
+                handoff messages, contexts and outputs longer than this many characters with artifact handles.
+                Defaults to None (no artifact store).
+            groups (Optional[Dict[str, List[str]]], optional): Named agent groups for ``name[*]``. Defaults to None.
+            session_policies (Optional[Dict[str, Union[str, int]]], optional): What a receiver remembers when a handoff
+                arrives over an edge, keyed by edge (same syntax as ``logic_str``, e.g. ``"hub->worker_*"``):
+                ``"persistent"`` (its whole history), ``"fresh"`` (system prompt only) or an int ``K`` (its last
+                ``K - 1`` handoffs plus the new one). Defaults to None.
+            default_session_policy (Union[str, int], optional): Policy for edges not in ``session_policies``.
+                Defaults to "persistent".
+            verbose (bool, optional): Print the graph on creation. Defaults to False.
+        """
         self.logic_str = logic_str
         self.agents = agents
+        self.static = static
+        self.max_handoff_depth = max_handoff_depth
+        self.max_edge_traversals = max_edge_traversals
+        self.cycle_policy = cycle_policy
+        self.max_cycles = max_cycles
+        self.artifact_threshold = artifact_threshold
+        self.groups = groups or {}
+        self.default_session_policy = self._check_session_policy(default_session_policy)
         self.verbose = verbose
+
+        if self.cycle_policy not in CYCLE_POLICIES:
+            raise ValueError(f"Unknown cycle policy {cycle_policy!r}. Expected one of {list(CYCLE_POLICIES)}")
         
+        self.async_run_type = async_run_type
+        self.agent_map = {agents[i].name: agents[i] for i in range(len(agents))}
+
         self.mapping = self._parse_communication(logic_str)
         if not self.mapping:
             raise ValueError("Communication protocol cannot be empty")
-        
-        self.async_run_type = async_run_type
-        self.agent_map = {agents[i].name: agents[i] for i in range(len(agents))}
+        self._receivers = {sender: frozenset(receivers) for sender, receivers in self.mapping.items()}
         self._communication_validation()
+        self._edge_policies = self._parse_session_policies(session_policies or {})
+        self._kept_handoffs = self._kept_handoff_counts()
+        self._handoff_starts = defaultdict(list)
+        self._active_handoffs = defaultdict(int)
+        self._handoff_lock = threading.Lock()
         if self.verbose:
             self.print_graph_as_tree()
+        if self.artifact_threshold is not None:
+            for agent in self.agents:
+                for tool in artifact_tools():
+                    agent.add_tool(tool)
+        if self.static:
+            self.graph = StaticGraph(self.mapping)
+            return
         for item in self.mapping.items():
             self._inject_handsoff(item[0], item[1])
 
 
+    def _split_fragments(self, sequence: str) -> List[str]:
+        # Split on commas that are not inside a {a,b,c} set.
+        fragments, depth, current = [], 0, []
+        for char in sequence:
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth < 0:
+                    raise ValueError(f"Unbalanced '}}' in {sequence!r}")
+            if char == ',' and depth == 0:
+                fragments.append(''.join(current))
+                current = []
+            else:
+                current.append(char)
+        if depth:
+            raise ValueError(f"Unbalanced '{{' in {sequence!r}")
+        fragments.append(''.join(current))
+        return [fragment for fragment in fragments if fragment.strip()]
+
+    def _expand_endpoint(self, endpoint: str) -> List[str]:
+        if endpoint.startswith('{'):
+            members = [member.strip() for member in endpoint[1:-1].split(',') if member.strip()]
+            if not members:
+                raise ValueError(f"Empty agent set {endpoint!r}")
+            return list(dict.fromkeys(name for member in members for name in self._expand_endpoint(member)))
+
+        if endpoint.endswith('[*]'):
+            group = endpoint[:-3]
+            if group not in self.groups:
+                raise ValueError(f"Unknown group {group!r}. Known groups: {sorted(self.groups)}")
+            return list(self.groups[group])
+
+        if any(char in endpoint for char in '*?'):
+            matches = fnmatch.filter(self.agent_map, endpoint)
+            if not matches:
+                raise ValueError(f"Pattern {endpoint!r} matches no agents")
+            return matches
+
+        return [endpoint]
+
     def _parse_communication(self, sequence: str):
-        pattern = re.compile(r'\s*(\w+)\s*(<->|->)\s*(\w+)\s*')
+        endpoint = r'(\{[^{}]*\}|[\w*?]+(?:\[\*\])?)'
+        pattern = re.compile(rf'\s*{endpoint}\s*(<->|->)\s*{endpoint}\s*')
         graph = defaultdict(list)
 
-        for fragment in sequence.split(','):
+        for fragment in self._split_fragments(sequence):
             m = pattern.fullmatch(fragment.strip())
             if not m:
                 raise ValueError(f"Un-parsable fragment: {fragment!r}")
-            src, arrow, dst = m.groups()
-
-            graph[src].append(dst)
-            if arrow == '<->':
-                graph[dst].append(src)
+            src_endpoint, arrow, dst_endpoint = m.groups()
+            if src_endpoint == dst_endpoint and self._expand_endpoint(src_endpoint) == [src_endpoint]:
+                raise ValueError(f"Agent {src_endpoint!r} can't hand off to itself: {fragment.strip()!r}")
+
+            for src in self._expand_endpoint(src_endpoint):
+                for dst in self._expand_endpoint(dst_endpoint):
+                    # Sets, groups and wildcards on both sides would otherwise connect an agent to itself.
+                    if src == dst:
+                        continue
+                    graph[src].append(dst)
+                    if arrow == '<->':
+                        graph[dst].append(src)
 
         return {n: list(dict.fromkeys(neigh)) for n, neigh in graph.items()}
     
+    def _check_session_policy(self, policy):
+        if isinstance(policy, bool) or not (policy in SESSION_POLICIES or (isinstance(policy, int) and policy >= 1)):
+            raise ValueError(
+                f"Unknown session policy {policy!r}. Expected one of {list(SESSION_POLICIES)} or a window size >= 1"
+            )
+        return policy
+
+    def _parse_session_policies(self, policies: Dict[str, Union[str, int]]):
+        edge_policies = {}
+        for edges, policy in policies.items():
+            self._check_session_policy(policy)
+            matched = False
+            for sender, receivers in self._parse_communication(edges).items():
+                for receiver in receivers:
+                    if receiver not in self._receivers.get(sender, ()):
+                        continue
+                    edge_policies[(sender, receiver)] = policy
+                    matched = True
+            if not matched:
+                raise ValueError(f"Session policy {edges!r} matches no edge of the protocol")
+        return edge_policies
+
+    def _kept_handoff_counts(self) -> Dict[str, int]:
+        # Earlier handoff starts each receiver must remember: K - 1 for its largest int policy, none otherwise.
+        kept = defaultdict(int)
+        for sender, receivers in self.mapping.items():
+            for receiver in receivers:
+                policy = self._edge_policies.get((sender, receiver), self.default_session_policy)
+                if isinstance(policy, int):
+                    kept[receiver] = max(kept[receiver], policy - 1)
+        return dict(kept)
+
     def parse_agents(self):
         agents = []
         agents.extend(list(self.mapping.keys()))
@@ -109,9 +265,29 @@ class CommunicationProtocol:
 
         return f"{prefix}\n\n{cleaned_message}"
 
+    def _spill(self, text: str, name: str, author: str) -> str:
+        run_context = RunContext.current()
+        if self.artifact_threshold is None or run_context is None or not isinstance(text, str):
+            return text
+        return run_context.artifacts.spill(text, self.artifact_threshold, name=name, author=author)
+
+    def _handoff_input(self, sender: str, receiver: str, message: str, context: str) -> str:
+        return self._format_handoff_message(
+            sender,
+            receiver,
+            self._spill(message, f"message from {sender} to {receiver}", sender),
+            self._spill(context, f"context from {sender} to {receiver}", sender),
+        )
+
+    def _handoff_output(self, sender: str, receiver: str, output):
+        output = self._check_nested_output(receiver, output)
+        if isinstance(output, HandoffDeclined):
+            return output
+        return self._spill(output, f"reply from {receiver} to {sender}", receiver)
+
     def _validate_receiver(self, sender: str, receiver: str) -> None:
-        allowed_receivers = self.get_connected_agents(sender)
-        if receiver not in allowed_receivers:
+        if receiver not in self._receivers.get(sender, ()):
+            allowed_receivers = self.get_connected_agents(sender)
             raise ValueError(f"Agent {sender} cannot communicate with {receiver}. Allowed receivers: {allowed_receivers}")
     
     def _inject_handsoff(self, agent: str, recievers: List[str]):
@@ -127,7 +303,8 @@ class CommunicationProtocol:
                             "properties": {
                                 "receiver": {
                                     "type": "string",
-                                    "description": f"you must have to mention receiver name clearly as it is. Only allowed to {','.join([i for i in recievers])}",
+                                    "enum": list(recievers),
+                                    "description": "The agent to hand the task to",
                                 },
                                 "message": {
                                     "type": "string",
@@ -143,6 +320,7 @@ class CommunicationProtocol:
                     },
                 },
                 tool_execution=self._async_spin_into if self.async_run_type else self._spin_into,
+                pinned=True,
                 )
         )
 
@@ -162,22 +340,23 @@ class CommunicationProtocol:
 
         return None
 
+    def _finalize_output(self, agent, output, mark: int):
+        if output is not None:
+            return output
+
+        # A mark rather than a buffer offset, since sessions may evict messages during the run.
+        new_messages = agent.session.messages_since(agent.name, mark)
+        return self._collect_output(new_messages) or f"{agent.name} completed the request"
+
     def _spin_up(self, agent_name: str, input: str, images: Optional[List] = None):
         agent = self.agent_map.get(agent_name)
         if agent is None:
             raise ValueError(f"No agent found called {agent_name}")
         
-        original_buffer = agent.session.get_buffer_memory(tag=agent.name)
-        original_length = len(original_buffer)
-        
-        output = agent(input, images=images)
-        if output is not None:
-            return output
-        
-        updated_buffer = agent.session.get_buffer_memory(tag=agent.name)
-        new_messages = updated_buffer[original_length:]
+        mark = agent.session.appended_count(agent.name)
 
-        return self._collect_output(new_messages) or f"{agent_name} completed the request"
+        output = agent(input, images=images)
+        return self._finalize_output(agent, output, mark)
 
     async def _async_spin_up(self, agent_name: str, input: str, images: Optional[List] = None):
         agent = self.agent_map.get(agent_name)
@@ -185,38 +364,270 @@ class CommunicationProtocol:
         if agent is None:
             raise ValueError(f"No agent found called {agent_name}")
 
-        original_buffer = agent.session.get_buffer_memory(tag=agent.name)
-        original_length = len(original_buffer)
+        mark = agent.session.appended_count(agent.name)
 
         output = await agent(input, images=images)
-        if output is not None:
-            return output
+        return self._finalize_output(agent, output, mark)
+        
+    def _check_nested_output(self, receiver: str, output):
+        if isinstance(output, SuspendedRun):
+            raise RuntimeError(
+                f"Agent {receiver} suspended for user input inside a handoff. "
+                "Only the entry agent of a protocol can suspend a run."
+            )
+        return output
+
+    def _new_run_context(self) -> RunContext:
+        return RunContext(
+            max_handoff_depth=self.max_handoff_depth,
+            max_edge_traversals=self.max_edge_traversals,
+            cycle_policy=self.cycle_policy,
+            max_cycles=self.max_cycles,
+        )
 
-        updated_buffer = agent.session.get_buffer_memory(tag=agent.name)
-        new_messages = updated_buffer[original_length:]
+    def _apply_session_policy(self, sender: str, receiver: str, run_context: RunContext) -> None:
+        policy = self._edge_policies.get((sender, receiver), self.default_session_policy)
+        session = self.agent_map[receiver].session
+        buffer = session.get_buffer_memory(tag=receiver)
+        system = 0
+        while system < len(buffer) and buffer[system].get('role') == 'system':
+            system += 1
+
+        # Handoff starts are append marks, not offsets, so they stay valid when the session evicts
+        # or this method trims. Starts that were evicted since are dropped.
+        appended = session.appended_count(receiver)
+        marks = [mark for mark in self._handoff_starts[receiver] if len(buffer) - (appended - mark) >= system]
+
+        # An agent waiting up the chain or still serving another handoff is mid-turn;
+        # trimming its buffer would drop messages that turn still needs.
+        busy = receiver in run_context.chain or self._active_handoffs[receiver] > 0
+        if policy != 'persistent' and not busy:
+            marks = marks[-(policy - 1):] if policy != 'fresh' and policy > 1 else []
+            cut = len(buffer) - (appended - marks[0]) if marks else len(buffer)
+            if cut > system:
+                session.load_buffer(receiver, buffer[:system] + buffer[cut:])
+
+        # Only int policies read earlier starts, so keep just as many as the largest one needs.
+        kept = self._kept_handoffs.get(receiver, 0)
+        self._handoff_starts[receiver] = (marks + [appended])[-kept:] if kept else []
+
+    @contextmanager
+    def _receiving(self, sender: str, receiver: str, run_context: RunContext):
+        with self._handoff_lock:
+            self._apply_session_policy(sender, receiver, run_context)
+            self._active_handoffs[receiver] += 1
+        try:
+            with run_context.handoff(sender, receiver):
+                yield
+        finally:
+            with self._handoff_lock:
+                self._active_handoffs[receiver] -= 1
 
-        return self._collect_output(new_messages) or f"{agent_name} completed the request"
-        
     def _spin_into(self, sender: str, receiver: str, message: str, context: str):
         self._validate_receiver(sender, receiver)
-        return self._spin_up(receiver, self._format_handoff_message(sender, receiver, message, context)), None
 
-    async def _async_spin_into(self, sender: str, receiver: str, message: str, context: str):
-        self._validate_receiver(sender, receiver)
-        return await self._async_spin_up(
-            receiver,
-            self._format_handoff_message(sender, receiver, message, context),
-        ), None
+        run_context = RunContext.current()
+        if run_context is None:
+            with self._new_run_context().activate(sender):
+                return self._spin_into(sender, receiver, message, context)
 
-    def execute(self, input: str, images: Optional[List] = None, start_agent: Optional[str] = None):
-        prior_agent_name = start_agent or list(self.mapping.keys())[0]
+        returned = run_context.check(sender, receiver)
+        if returned is not None:
+            return returned, None
 
-        return self._spin_up(prior_agent_name, input, images=images)
+        with self._receiving(sender, receiver, run_context):
+            output = self._spin_up(receiver, self._handoff_input(sender, receiver, message, context))
+        return self._handoff_output(sender, receiver, output), None
 
-    async def async_execute(self, input: str, images: Optional[List] = None, start_agent: Optional[str] = None):
-        prior_agent_name = start_agent or list(self.mapping.keys())[0]
+    async def _async_spin_into(self, sender: str, receiver: str, message: str, context: str):
+        self._validate_receiver(sender, receiver)
 
-        return await self._async_spin_up(prior_agent_name, input, images=images)
+        run_context = RunContext.current()
+        if run_context is None:
+            with self._new_run_context().activate(sender):
+                return await self._async_spin_into(sender, receiver, message, context)
+
+        returned = run_context.check(sender, receiver)
+        if returned is not None:
+            return returned, None
+
+        with self._receiving(sender, receiver, run_context):
+            output = await self._async_spin_up(
+                receiver,
+                self._handoff_input(sender, receiver, message, context),
+            )
+        return self._handoff_output(sender, receiver, output), None
+
+    def _checkpoint_protocol(self, output):
+        # Peers hold state from earlier handoffs, so the token carries every agent's buffer.
+        if isinstance(output, SuspendedRun):
+            output.checkpoint.buffers = {
+                name: agent.session.export_buffer(name) for name, agent in self.agent_map.items()
+            }
+            run_context = RunContext.current()
+            if run_context is not None:
+                output.checkpoint.artifacts = run_context.artifacts.to_dict()
+        return output
+
+    def _restore_protocol(self, checkpoint: RunCheckpoint | str) -> RunCheckpoint:
+        checkpoint = RunCheckpoint.load(checkpoint)
+        if checkpoint.agent_name not in self.agent_map:
+            raise ValueError(f"No agent found called {checkpoint.agent_name}")
+        for name, buffer in checkpoint.buffers.items():
+            agent = self.agent_map.get(name)
+            if agent is not None:
+                agent.session.load_buffer(name, buffer)
+        return checkpoint
+
+    def _static_input(self, agent_name: str, input: str, outputs: dict) -> str:
+        predecessors = self.graph.predecessors[agent_name]
+        if not predecessors:
+            return input
+        return "\n\n".join(
+            self._handoff_input(sender, agent_name, str(outputs[sender]), "")
+            for sender in predecessors
+        )
 
-    async def asyn_execute(self, input: str, images: Optional[List] = None, start_agent: Optional[str] = None):
-        return await self.async_execute(input, images=images, start_agent=start_agent)
+    def _static_result(self, outputs: dict):
+        if len(self.graph.sinks) == 1:
+            return outputs[self.graph.sinks[0]]
+        return {sink: outputs[sink] for sink in self.graph.sinks}
+
+    def _check_static_start(self, start_agent: Optional[str]) -> None:
+        if start_agent is not None:
+            raise ValueError(
+                f"A static protocol always starts at its source agents {self.graph.sources}; start_agent is not supported"
+            )
+
+    def _execute_static(self, input: str, images: Optional[List] = None):
+        outputs = {}
+        remaining = {node: len(self.graph.predecessors[node]) for node in self.graph.order}
+        ready = list(self.graph.sources)
+
+        def run(agent_name: str):
+            agent_images = images if agent_name in self.graph.sources else None
+            return self._spin_up(agent_name, self._static_input(agent_name, input, outputs), images=agent_images)
+
+        with ThreadPoolExecutor(max_workers=len(self.graph.order)) as executor:
+            pending = {}
+            while ready or pending:
+                for agent_name in ready:
+                    # Copy the context so the worker threads see the caller's deadline.
+                    pending[executor.submit(contextvars.copy_context().run, run, agent_name)] = agent_name
+                ready = []
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    agent_name = pending.pop(future)
+                    outputs[agent_name] = future.result()
+                    for successor in self.graph.successors[agent_name]:
+                        remaining[successor] -= 1
+                        if remaining[successor] == 0:
+                            ready.append(successor)
+
+        return self._static_result(outputs)
+
+    async def _async_execute_static(self, input: str, images: Optional[List] = None):
+        outputs = {}
+        tasks = {}
+
+        async def run(agent_name: str):
+            await asyncio.gather(*[tasks[sender] for sender in self.graph.predecessors[agent_name]])
+            agent_images = images if agent_name in self.graph.sources else None
+            outputs[agent_name] = await self._async_spin_up(
+                agent_name,
+                self._static_input(agent_name, input, outputs),
+                images=agent_images,
+            )
+
+        for agent_name in self.graph.order:
+            tasks[agent_name] = asyncio.create_task(run(agent_name))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        return self._static_result(outputs)
+
+    def execute(
+        self,
+        input: str,
+        images: Optional[List] = None,
+        start_agent: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        with deadline(timeout):
+            if self.static:
+                self._check_static_start(start_agent)
+                with self._new_run_context().activate(self.graph.sources[0]):
+                    return self._execute_static(input, images=images)
+
+            prior_agent_name = start_agent or list(self.mapping.keys())[0]
+
+            with self._new_run_context().activate(prior_agent_name):
+                return self._checkpoint_protocol(self._spin_up(prior_agent_name, input, images=images))
+
+    async def async_execute(
+        self,
+        input: str,
+        images: Optional[List] = None,
+        start_agent: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        # Cancelling this call cancels every in-flight handoff and tool below it.
+        with deadline(timeout):
+            if self.static:
+                self._check_static_start(start_agent)
+                with self._new_run_context().activate(self.graph.sources[0]):
+                    return await await_within_deadline(self._async_execute_static(input, images=images))
+
+            prior_agent_name = start_agent or list(self.mapping.keys())[0]
+
+            with self._new_run_context().activate(prior_agent_name):
+                output = await await_within_deadline(self._async_spin_up(prior_agent_name, input, images=images))
+                return self._checkpoint_protocol(output)
+
+    def resume(
+        self,
+        checkpoint: RunCheckpoint | str,
+        user_input: str,
+        images: Optional[List] = None,
+        timeout: Optional[float] = None,
+    ):
+        checkpoint = self._restore_protocol(checkpoint)
+        agent = self.agent_map[checkpoint.agent_name]
+        mark = agent.session.appended_count(agent.name)
+
+        run_context = self._new_run_context()
+        run_context.artifacts.load(checkpoint.artifacts)
+        with run_context.activate(agent.name):
+            output = agent.resume(checkpoint, user_input, images=images, timeout=timeout)
+            return self._checkpoint_protocol(self._finalize_output(agent, output, mark))
+
+    async def async_resume(
+        self,
+        checkpoint: RunCheckpoint | str,
+        user_input: str,
+        images: Optional[List] = None,
+        timeout: Optional[float] = None,
+    ):
+        checkpoint = self._restore_protocol(checkpoint)
+        agent = self.agent_map[checkpoint.agent_name]
+        mark = agent.session.appended_count(agent.name)
+
+        run_context = self._new_run_context()
+        run_context.artifacts.load(checkpoint.artifacts)
+        with run_context.activate(agent.name):
+            output = await agent.resume(checkpoint, user_input, images=images, timeout=timeout)
+            return self._checkpoint_protocol(self._finalize_output(agent, output, mark))
+
+    async def asyn_execute(
+        self,
+        input: str,
+        images: Optional[List] = None,
+        start_agent: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        return await self.async_execute(input, images=images, start_agent=start_agent, timeout=timeout)
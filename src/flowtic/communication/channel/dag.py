@@ -0,0 +1,41 @@
+from typing import Dict, List
+
+
+class StaticGraph:
+    """
+    A communication mapping compiled into a DAG for static execution.
+
+    Args:
+        mapping (Dict[str, List[str]]): Adjacency list as produced by ``_parse_communication``.
+    """
+
+    def __init__(self, mapping: Dict[str, List[str]]) -> None:
+        nodes = list(dict.fromkeys([*mapping.keys(), *[dst for dsts in mapping.values() for dst in dsts]]))
+        self.successors = {node: list(mapping.get(node, [])) for node in nodes}
+        self.predecessors = {node: [] for node in nodes}
+        for src, dsts in self.successors.items():
+            for dst in dsts:
+                self.predecessors[dst].append(src)
+
+        self.order = self._topological_order(nodes)
+        self.sources = [node for node in self.order if not self.predecessors[node]]
+        self.sinks = [node for node in self.order if not self.successors[node]]
+
+    def _topological_order(self, nodes: List[str]) -> List[str]:
+        in_degree = {node: len(self.predecessors[node]) for node in nodes}
+        ready = [node for node in nodes if in_degree[node] == 0]
+        order = []
+
+        while ready:
+            node = ready.pop(0)
+            order.append(node)
+            for dst in self.successors[node]:
+                in_degree[dst] -= 1
+                if in_degree[dst] == 0:
+                    ready.append(dst)
+
+        if len(order) != len(nodes):
+            cyclic = sorted(node for node in nodes if in_degree[node] > 0)
+            raise ValueError(f"Static protocols must be acyclic. Agents on a cycle: {cyclic}")
+
+        return order
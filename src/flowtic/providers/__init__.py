@@ -0,0 +1,27 @@
+from .base import LiteLLMProvider, Provider, get_default_provider, set_default_provider
+from .fake import FakeProvider, FakeResponse
+from .http import HTTPClientManager, configure_http_pool, get_http_client_manager
+from .limiter import (
+    AdaptiveConcurrencyController,
+    AdaptiveLimiter,
+    configure_adaptive_concurrency,
+    disable_adaptive_concurrency,
+    get_adaptive_controller,
+)
+
+__all__ = [
+    'AdaptiveConcurrencyController',
+    'AdaptiveLimiter',
+    'FakeProvider',
+    'FakeResponse',
+    'HTTPClientManager',
+    'LiteLLMProvider',
+    'Provider',
+    'configure_adaptive_concurrency',
+    'configure_http_pool',
+    'disable_adaptive_concurrency',
+    'get_adaptive_controller',
+    'get_http_client_manager',
+    'get_default_provider',
+    'set_default_provider',
+]
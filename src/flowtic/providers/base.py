@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from litellm import completion, acompletion
+
+
+class Provider(ABC):
+    """
+    Where agents send their completion requests.
+
+    Receives the same keyword arguments as ``litellm.completion`` and must
+    return a litellm-compatible ``ModelResponse``.
+    """
+
+    @abstractmethod
+    def completion(self, **kwargs) -> Any: ...
+
+    @abstractmethod
+    async def acompletion(self, **kwargs) -> Any: ...
+
+
+class LiteLLMProvider(Provider):
+    def completion(self, **kwargs) -> Any:
+        return completion(**kwargs)
+
+    async def acompletion(self, **kwargs) -> Any:
+        return await acompletion(**kwargs)
+
+
+_default_provider = LiteLLMProvider()
+
+
+def get_default_provider() -> Provider:
+    return _default_provider
+
+
+def set_default_provider(provider: Provider) -> None:
+    global _default_provider
+    _default_provider = provider
@@ -0,0 +1,136 @@
+import asyncio
+import itertools
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from litellm import ModelResponse
+
+from flowtic.providers.base import Provider
+
+
+class FakeResponse:
+    """
+    One scripted model turn.
+
+    Args:
+        content (Optional[str], optional): The assistant text. Defaults to None.
+        tool_calls (Optional[List], optional): ``(name, arguments)`` pairs. Arguments may be a dict or a raw
+            JSON string (to script malformed calls). Defaults to None.
+        latency (Optional[float], optional): Seconds to wait before answering, overriding the provider's latency. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        content: Optional[str] = None,
+        tool_calls: Optional[List[tuple]] = None,
+        latency: Optional[float] = None,
+    ) -> None:
+        self.content = content
+        self.tool_calls = tool_calls or []
+        self.latency = latency
+
+    @classmethod
+    def handoff(cls, receiver: str, message: str, context: str = "", asynchronous: bool = False) -> 'FakeResponse':
+        name = '_async_spin_into' if asynchronous else '_spin_into'
+        return cls(tool_calls=[(name, {'receiver': receiver, 'message': message, 'context': context})])
+
+
+ScriptItem = Union[FakeResponse, str, Exception]
+
+
+class FakeProvider(Provider):
+    """
+    Deterministic offline provider that replays scripted responses.
+
+    Give each agent its own instance. Responses come from ``script`` in order;
+    once it is exhausted ``responder`` (if any) is asked, otherwise the
+    provider raises. Strings are plain assistant replies and exceptions are
+    raised as if the provider failed.
+
+    Args:
+        script (Optional[Iterable], optional): ``FakeResponse``s, strings or exceptions. Defaults to None.
+        responder (Optional[Callable], optional): ``responder(messages, tools)`` returning a script item. Defaults to None.
+        latency (float, optional): Seconds to wait per call. Defaults to 0.
+        model (str, optional): The model name reported in responses. Defaults to "fake".
+    """
+
+    _ids = itertools.count()
+
+    def __init__(
+        self,
+        script: Optional[Iterable[ScriptItem]] = None,
+        responder: Optional[Callable[[List[Dict], Optional[List[Dict]]], ScriptItem]] = None,
+        latency: float = 0.0,
+        model: str = "fake",
+    ) -> None:
+        self.script = list(script or [])
+        self.responder = responder
+        self.latency = latency
+        self.model = model
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def add(self, *items: ScriptItem) -> 'FakeProvider':
+        with self._lock:
+            self.script.extend(items)
+        return self
+
+    @property
+    def remaining(self) -> int:
+        return len(self.script)
+
+    def _next(self, kwargs: Dict[str, Any]) -> FakeResponse:
+        with self._lock:
+            self.calls.append(kwargs)
+            item = self.script.pop(0) if self.script else None
+
+        if item is None:
+            if self.responder is None:
+                raise RuntimeError(f"FakeProvider script exhausted after {len(self.calls) - 1} calls")
+            item = self.responder(kwargs.get('messages'), kwargs.get('tools'))
+
+        if isinstance(item, Exception):
+            raise item
+        if isinstance(item, str):
+            return FakeResponse(content=item)
+        return item
+
+    def _build(self, item: FakeResponse) -> ModelResponse:
+        tool_calls = [
+            {
+                'id': f"call_{next(self._ids)}",
+                'type': 'function',
+                'function': {
+                    'name': name,
+                    'arguments': arguments if isinstance(arguments, str) else json.dumps(arguments),
+                },
+            }
+            for name, arguments in item.tool_calls
+        ]
+        return ModelResponse(
+            model=self.model,
+            choices=[{
+                'index': 0,
+                'finish_reason': 'tool_calls' if tool_calls else 'stop',
+                'message': {'role': 'assistant', 'content': item.content, 'tool_calls': tool_calls or None},
+            }],
+        )
+
+    def _latency(self, item: FakeResponse) -> float:
+        return self.latency if item.latency is None else item.latency
+
+    def completion(self, **kwargs) -> Any:
+        item = self._next(kwargs)
+        latency = self._latency(item)
+        if latency:
+            time.sleep(latency)
+        return self._build(item)
+
+    async def acompletion(self, **kwargs) -> Any:
+        item = self._next(kwargs)
+        latency = self._latency(item)
+        if latency:
+            await asyncio.sleep(latency)
+        return self._build(item)
@@ -0,0 +1,227 @@
+import asyncio
+import importlib.util
+import threading
+import weakref
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+import httpx
+import litellm
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec('h2') is not None
+
+
+class _LoopLocalAsyncClient(httpx.AsyncClient):
+    """
+    The ``httpx.AsyncClient`` handed to litellm. It only builds requests; each
+    one is sent through the pooled client owned by the running event loop.
+    """
+
+    def __init__(self, manager: 'HTTPClientManager', **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._manager = manager
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        return await self._manager.client_for_loop().send(request, **kwargs)
+
+    async def aclose(self) -> None:
+        await self._manager.aclose_loop()
+
+
+class HTTPClientManager:
+    """
+    Pooled keep-alive HTTP clients shared by every agent in the process.
+
+    ``install()`` hands the clients to litellm, which uses them for OpenAI and
+    Azure OpenAI compatible endpoints. httpx keeps a connection pool per origin,
+    so agents on the same endpoint reuse TLS sessions instead of reconnecting.
+
+    An async connection pool only works on the event loop that opened it, so
+    every running loop gets its own pooled client. Separate ``asyncio.run``
+    calls (as ``BatchRunner`` makes) each get a fresh pool, which is dropped
+    once its loop is garbage collected.
+
+    Args:
+        max_connections (int, optional): Maximum open connections across all origins. Defaults to 100.
+        max_keepalive_connections (int, optional): Maximum idle connections kept alive. Defaults to 20.
+        keepalive_expiry (float, optional): Seconds an idle connection is kept. Defaults to 30.
+        connect_timeout (float, optional): Seconds to establish a connection. Defaults to 10.
+        read_timeout (float, optional): Seconds to wait for response data. Defaults to 600.
+        pool_timeout (Optional[float], optional): Seconds to wait for a free connection. Defaults to None (wait forever).
+        http2 (Optional[bool], optional): Use HTTP/2. Defaults to None (enabled if ``h2`` is installed).
+        transport (Optional[Any], optional): Custom httpx transport for every client, such as ``httpx.MockTransport``
+            in tests. Pool limits don't apply to it. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 600.0,
+        pool_timeout: Optional[float] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[Any] = None,
+    ) -> None:
+        if http2 and not _http2_available():
+            raise ImportError("HTTP/2 needs the h2 package: pip install 'httpx[http2]'")
+
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout, pool=pool_timeout)
+        self.http2 = _http2_available() if http2 is None else http2
+        self.transport = transport
+
+        self._client = None
+        self._async_client = None
+        self._loop_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._requests = defaultdict(int)
+        self._errors = defaultdict(int)
+        self._http_versions = defaultdict(lambda: defaultdict(int))
+
+    def _origin(self, url: httpx.URL) -> str:
+        return f"{url.scheme}://{url.host}:{url.port or (443 if url.scheme == 'https' else 80)}"
+
+    def _record_request(self, request: httpx.Request) -> None:
+        with self._lock:
+            self._requests[self._origin(request.url)] += 1
+
+    def _record_response(self, response: httpx.Response) -> None:
+        origin = self._origin(response.request.url)
+        with self._lock:
+            self._http_versions[origin][response.http_version] += 1
+            if response.status_code >= 400:
+                self._errors[origin] += 1
+
+    async def _arecord_request(self, request: httpx.Request) -> None:
+        self._record_request(request)
+
+    async def _arecord_response(self, response: httpx.Response) -> None:
+        self._record_response(response)
+
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            'limits': self.limits,
+            'timeout': self.timeout,
+            'http2': self.http2,
+            'follow_redirects': True,
+            'transport': self.transport,
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    **self._client_options(),
+                    event_hooks={'request': [self._record_request], 'response': [self._record_response]},
+                )
+            return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The client to give async libraries; it sends every request through ``client_for_loop()``."""
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = _LoopLocalAsyncClient(self, timeout=self.timeout, follow_redirects=True)
+            return self._async_client
+
+    def client_for_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> httpx.AsyncClient:
+        """The pooled async client of ``loop`` (default: the running loop), created on first use."""
+        loop = loop or asyncio.get_running_loop()
+        with self._lock:
+            client = self._loop_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    **self._client_options(),
+                    event_hooks={'request': [self._arecord_request], 'response': [self._arecord_response]},
+                )
+                self._loop_clients[loop] = client
+            return client
+
+    def install(self) -> 'HTTPClientManager':
+        litellm.client_session = self.client
+        litellm.aclient_session = self.async_client
+        return self
+
+    def uninstall(self) -> None:
+        if self._client is not None and litellm.client_session is self._client:
+            litellm.client_session = None
+        if self._async_client is not None and litellm.aclient_session is self._async_client:
+            litellm.aclient_session = None
+
+    def _pool_stats(self, client: Any) -> Dict[str, int]:
+        pool = getattr(getattr(client, '_transport', None), '_pool', None)
+        connections = list(getattr(pool, 'connections', []))
+        return {
+            'open': len(connections),
+            'idle': sum(1 for connection in connections if connection.is_idle()),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests, error responses and negotiated HTTP versions per origin, plus open/idle pool connections."""
+        with self._lock:
+            loop_clients = list(self._loop_clients.values())
+            origins = {
+                origin: {
+                    'requests': count,
+                    'errors': self._errors[origin],
+                    'http_versions': dict(self._http_versions[origin]),
+                }
+                for origin, count in self._requests.items()
+            }
+        return {
+            'http2': self.http2,
+            'origins': origins,
+            'sync_pool': self._pool_stats(self._client) if self._client is not None else None,
+            'async_pools': [self._pool_stats(client) for client in loop_clients],
+        }
+
+    def close(self) -> None:
+        self.uninstall()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose_loop(self) -> None:
+        """Close the running loop's pooled client, if it has one."""
+        with self._lock:
+            client = self._loop_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Close the sync client and the running loop's client; pools of other loops are dropped."""
+        self.close()
+        await self.aclose_loop()
+        with self._lock:
+            self._loop_clients.clear()
+            self._async_client = None
+
+
+_manager: Optional[HTTPClientManager] = None
+
+
+def configure_http_pool(**kwargs) -> HTTPClientManager:
+    """Create the process-wide client manager with the given limits and install it into litellm."""
+    global _manager
+    if _manager is not None:
+        _manager.close()
+    _manager = HTTPClientManager(**kwargs).install()
+    return _manager
+
+
+def get_http_client_manager() -> HTTPClientManager:
+    """Return the process-wide client manager, creating and installing one with defaults if needed."""
+    if _manager is None:
+        return configure_http_pool()
+    return _manager
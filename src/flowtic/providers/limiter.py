@@ -0,0 +1,253 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+from flowtic.agents.deadline import DeadlineExceeded
+from flowtic.providers.base import Provider
+
+_OVERLOAD_STATUS = (408, 429, 503, 529)
+
+
+def _is_overload(error: BaseException) -> bool:
+    if isinstance(error, DeadlineExceeded):
+        return False
+    if getattr(error, 'status_code', None) in _OVERLOAD_STATUS:
+        return True
+    if isinstance(error, TimeoutError):
+        return True
+    name = type(error).__name__
+    return 'RateLimit' in name or 'Timeout' in name or 'Overloaded' in name
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for one model deployment.
+
+    The limit grows by about one slot per limit's worth of successful calls
+    while it is saturated, and is multiplied by ``backoff`` on a rate-limit,
+    overload or timeout error, or when smoothed latency rises above
+    ``latency_tolerance`` times the baseline (the lowest recent latency). Only
+    calls started after the previous decrease can trigger another one, so a
+    burst of failures from the same wave shrinks the limit once.
+
+    Waiters can come from any thread and event loop, so one limiter is safe to
+    share across ``asyncio.run`` calls, worker threads and servers.
+
+    Args:
+        initial_limit (int, optional): Starting concurrency. Defaults to 8.
+        min_limit (int, optional): Floor for the limit. Defaults to 1.
+        max_limit (int, optional): Ceiling for the limit. Defaults to 256.
+        backoff (float, optional): Multiplier applied on a decrease. Defaults to 0.7.
+        latency_tolerance (float, optional): Latency ratio over baseline treated as congestion. Defaults to 2.0.
+        smoothing (float, optional): Weight of the newest sample in the latency average. Defaults to 0.2.
+        baseline_window (int, optional): Recent samples the baseline latency is taken from. Defaults to 100.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff: float = 0.7,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        baseline_window: int = 100,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque = deque()
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self._samples: deque = deque(maxlen=baseline_window)
+        self._latency: Optional[float] = None
+        self._counters = {'successes': 0, 'errors': 0, 'overloads': 0, 'increases': 0, 'decreases': 0}
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    def _wake(self) -> None:
+        # Called with the lock held.
+        while self._waiters and self._in_flight < self.limit:
+            loop, future = self._waiters.popleft()
+            if loop.is_closed():
+                continue
+            self._in_flight += 1
+            loop.call_soon_threadsafe(self._grant, future)
+
+    def _grant(self, future: asyncio.Future) -> None:
+        if future.done():
+            # The waiter was cancelled after being granted a slot; hand the slot on.
+            self._release()
+            return
+        future.set_result(None)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._wake()
+
+    async def acquire(self) -> Tuple[int, bool]:
+        """Wait for a slot. Returns the epoch the call started in and whether the limiter was saturated."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            saturated = self._in_flight + 1 >= self.limit or bool(self._waiters)
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return self._epoch, saturated
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, future))
+                    granted = False
+                except ValueError:
+                    granted = future.done() and not future.cancelled()
+            if granted:
+                self._release()
+            raise
+        return self._epoch, True
+
+    def _decrease(self) -> None:
+        self._limit = max(float(self.min_limit), math.floor(self._limit * self.backoff))
+        self._epoch += 1
+        self._counters['decreases'] += 1
+
+    def release(self, epoch: int, saturated: bool, latency: Optional[float] = None, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+            if error is not None:
+                self._counters['errors'] += 1
+                if _is_overload(error):
+                    self._counters['overloads'] += 1
+                    if epoch == self._epoch:
+                        self._decrease()
+            elif latency is not None:
+                self._counters['successes'] += 1
+                self._samples.append(latency)
+                self._latency = latency if self._latency is None else (
+                    self.smoothing * latency + (1 - self.smoothing) * self._latency
+                )
+                baseline = min(self._samples)
+                congested = len(self._samples) >= 10 and self._latency > baseline * self.latency_tolerance
+                if congested and epoch == self._epoch:
+                    self._decrease()
+                    # Start the average afresh so one slow spell doesn't cause repeated decreases.
+                    self._latency = baseline
+                elif not congested and saturated and self._limit < self.max_limit:
+                    self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+                    self._counters['increases'] += 1
+
+            self._wake()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'limit': self.limit,
+                'in_flight': self._in_flight,
+                'waiting': len(self._waiters),
+                'latency': self._latency,
+                'baseline_latency': min(self._samples) if self._samples else None,
+                **self._counters,
+            }
+
+
+class AdaptiveConcurrencyController:
+    """
+    Process-wide registry of ``AdaptiveLimiter``s, one per model deployment.
+
+    Args:
+        **limiter_defaults: Default ``AdaptiveLimiter`` arguments for new deployments.
+    """
+
+    def __init__(self, **limiter_defaults) -> None:
+        self.limiter_defaults = limiter_defaults
+        self._overrides: Dict[str, Dict[str, Any]] = {}
+        self._limiters: Dict[Tuple[str, str], AdaptiveLimiter] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, model: str, **limiter_kwargs) -> None:
+        """Use different limiter arguments for ``model``. Applies to limiters created afterwards."""
+        self._overrides[model] = limiter_kwargs
+
+    def limiter(self, model: str, deployment: str = 'default') -> AdaptiveLimiter:
+        key = (model, deployment)
+        with self._lock:
+            if key not in self._limiters:
+                self._limiters[key] = AdaptiveLimiter(**{**self.limiter_defaults, **self._overrides.get(model, {})})
+            return self._limiters[key]
+
+    async def acompletion(self, provider: Provider, **kwargs) -> Any:
+        deployment = kwargs.get('api_base') or kwargs.get('base_url') or 'default'
+        limiter = self.limiter(kwargs.get('model', ''), deployment)
+        epoch, saturated = await limiter.acquire()
+        started = time.perf_counter()
+        try:
+            response = await provider.acompletion(**kwargs)
+        except asyncio.CancelledError:
+            limiter.release(epoch, saturated)
+            raise
+        except Exception as exc:
+            limiter.release(epoch, saturated, error=exc)
+            raise
+        limiter.release(epoch, saturated, latency=time.perf_counter() - started)
+        return response
+
+    def wrap(self, provider: Provider) -> Provider:
+        return _LimitedProvider(provider, self)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Current limit, load, latency and counters keyed by ``"model@deployment"``."""
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {f"{model}@{deployment}": limiter.metrics() for (model, deployment), limiter in limiters.items()}
+
+
+class _LimitedProvider(Provider):
+    def __init__(self, inner: Provider, controller: AdaptiveConcurrencyController) -> None:
+        self.inner = inner
+        self.controller = controller
+
+    def completion(self, **kwargs) -> Any:
+        return self.inner.completion(**kwargs)
+
+    async def acompletion(self, **kwargs) -> Any:
+        return await self.controller.acompletion(self.inner, **kwargs)
+
+
+_controller: Optional[AdaptiveConcurrencyController] = None
+
+
+def configure_adaptive_concurrency(**limiter_defaults) -> AdaptiveConcurrencyController:
+    """Route every ``AsyncAgent`` completion in the process through a new adaptive controller."""
+    global _controller
+    _controller = AdaptiveConcurrencyController(**limiter_defaults)
+    return _controller
+
+
+def disable_adaptive_concurrency() -> None:
+    global _controller
+    _controller = None
+
+
+def get_adaptive_controller() -> Optional[AdaptiveConcurrencyController]:
+    return _controller
@@ -0,0 +1,84 @@
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+_CAMEL_CASE = re.compile(r'([a-z0-9])([A-Z])')
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, splitting snake_case and camelCase identifiers."""
+    return _TOKEN.findall(_CAMEL_CASE.sub(r'\1 \2', text).lower())
+
+
+class BM25Index:
+    """
+    Incremental in-memory BM25 index.
+
+    Documents can be added and removed at any time; statistics are kept up to
+    date so no rebuild is needed.
+
+    Args:
+        k1 (float, optional): Term frequency saturation. Defaults to 1.5.
+        b (float, optional): Document length normalization. Defaults to 0.75.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._term_freqs: Dict[Hashable, Counter] = {}
+        self._lengths: Dict[Hashable, int] = {}
+        self._postings: Dict[str, set] = defaultdict(set)
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._term_freqs)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._term_freqs
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        if doc_id in self._term_freqs:
+            self.remove(doc_id)
+
+        term_freqs = Counter(tokenize(text))
+        self._term_freqs[doc_id] = term_freqs
+        self._lengths[doc_id] = sum(term_freqs.values())
+        self._total_length += self._lengths[doc_id]
+        for term in term_freqs:
+            self._postings[term].add(doc_id)
+
+    def remove(self, doc_id: Hashable) -> None:
+        term_freqs = self._term_freqs.pop(doc_id, None)
+        if term_freqs is None:
+            return
+
+        self._total_length -= self._lengths.pop(doc_id)
+        for term in term_freqs:
+            postings = self._postings[term]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[term]
+
+    def search(self, query: str, k: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """Return ``(doc_id, score)`` pairs with a positive score, best first."""
+        if not self._term_freqs:
+            return []
+
+        doc_count = len(self._term_freqs)
+        average_length = self._total_length / doc_count or 1
+        scores = defaultdict(float)
+
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id in postings:
+                freq = self._term_freqs[doc_id][term]
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / average_length)
+                scores[doc_id] += idf * freq * (self.k1 + 1) / (freq + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:k] if k is not None else ranked
@@ -0,0 +1,3 @@
+from .core import ProtocolServer, RequestRejected
+
+__all__ = ['ProtocolServer', 'RequestRejected']
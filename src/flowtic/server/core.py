@@ -0,0 +1,428 @@
+import asyncio
+import base64
+import binascii
+import contextvars
+import functools
+import hashlib
+import hmac
+import json
+import re
+import secrets
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional
+
+from flowtic.agents.deadline import DeadlineExceeded
+from flowtic.communication import Callback, CommunicationProtocol, HandoffLimitError, SuspendRun
+from flowtic.communication.callbacks import callback_args
+from flowtic.session.checkpoint import RunCheckpoint, SuspendedRun
+
+_TENANT_PATTERN = re.compile(r'^[A-Za-z0-9_.:-]{1,128}$')
+_HANDOFF_TOOLS = ('_spin_into', '_async_spin_into')
+
+
+def _require_aiohttp():
+    try:
+        from aiohttp import web
+    except ImportError as exc:
+        raise ImportError("The Flowtic server needs aiohttp: pip install 'flowtic[server]'") from exc
+    return web
+
+
+class RequestRejected(Exception):
+    def __init__(self, status: int, reason: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _EventCallback(Callback):
+    """Forwards tool calls and handoffs to the request's event stream and parks runs waiting for the user."""
+
+    def __init__(self, inner: Callback, emit: Callable[[Dict[str, Any]], None]) -> None:
+        super().__init__()
+        self.inner = inner
+        self.emit = emit
+
+    def on_user_loop(self, agent_name: str, assistant_message: str):
+        # A server can't block on a human; the client resumes with the returned token.
+        raise SuspendRun()
+
+    def on_tool_call(self, agent_name: str, fn_name: str, arguments: Dict[str, Any]):
+        if fn_name in _HANDOFF_TOOLS:
+            self.emit({'type': 'handoff', 'sender': agent_name, 'receiver': arguments.get('receiver')})
+        else:
+            self.emit({'type': 'tool_call', 'agent': agent_name, 'tool': fn_name, 'arguments': arguments})
+        method = self.inner.on_tool_call
+        return method(*callback_args(method, agent_name, fn_name, arguments))
+
+
+class _Slot:
+    """An admitted request. ``worker`` is the thread running a sync protocol, if any."""
+
+    def __init__(self) -> None:
+        self.worker: Optional[asyncio.Future] = None
+
+
+class ProtocolServer:
+    """
+    asyncio HTTP/WebSocket server running registered protocols for many tenants.
+
+    Every request builds a fresh protocol from the registered factory, called
+    with the tenant id, so tenants never share agents or sessions. Runs that
+    need user input are suspended and return a resume token instead of
+    holding a connection open.
+
+    Admission control: at most ``max_concurrency`` runs execute at once and
+    at most ``max_queue`` wait for a slot; beyond that requests get 503. A
+    tenant with ``max_per_tenant`` runs running or queued gets 429.
+
+    Endpoints:
+        ``POST /v1/protocols/{name}/runs`` with JSON ``{"input", "images", "start_agent", "timeout", "resume_token"}``
+        ``GET /v1/protocols/{name}/stream`` WebSocket; send the same JSON, receive events then a ``result``
+        ``GET /v1/health`` load and rejection counters
+
+    The tenant comes from the ``X-Tenant-ID`` header (default ``"default"``).
+
+    Resume tokens carry the whole conversation, so the server signs them with
+    an HMAC over the protocol name, the tenant and the checkpoint. A token only
+    resumes on a server with the same ``secret``, for the same tenant and
+    protocol, and can't be edited by the client.
+
+    Images must be URLs, data URLs or raw base64; the server never reads local paths.
+
+    Args:
+        max_concurrency (int, optional): Runs executing at once. Defaults to 16.
+        max_queue (int, optional): Requests waiting for a slot before new ones are rejected. Defaults to 64.
+        max_per_tenant (int, optional): Running plus queued requests per tenant. Defaults to -1 (unlimited).
+        queue_timeout (Optional[float], optional): Seconds a request may wait for a slot. Defaults to None (no limit).
+        default_timeout (Optional[float], optional): Deadline for runs that don't set one. Defaults to None.
+        secret (Optional[str | bytes], optional): Key that signs resume tokens. Defaults to None (a random key, so
+            tokens don't survive a restart and aren't accepted by other server processes).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        max_queue: int = 64,
+        max_per_tenant: int = -1,
+        queue_timeout: Optional[float] = None,
+        default_timeout: Optional[float] = None,
+        secret: Optional[str | bytes] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_per_tenant = max_per_tenant
+        self.queue_timeout = queue_timeout
+        self.default_timeout = default_timeout
+        if isinstance(secret, str):
+            secret = secret.encode('utf-8')
+        self._secret = secret or secrets.token_bytes(32)
+
+        self._factories: Dict[str, Callable[[str], CommunicationProtocol]] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._running = 0
+        self._queued = 0
+        self._tenant_load = defaultdict(int)
+        self._counters = defaultdict(int)
+
+    def register(self, name: str, factory: Callable[[str], CommunicationProtocol]) -> None:
+        """Register ``factory(tenant_id) -> CommunicationProtocol`` under ``name``."""
+        self._factories[name] = factory
+
+    def protocol(self, name: str):
+        """Decorator form of ``register``."""
+        def decorator(factory):
+            self.register(name, factory)
+            return factory
+        return decorator
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'running': self._running,
+            'queued': self._queued,
+            'max_concurrency': self.max_concurrency,
+            'max_queue': self.max_queue,
+            'tenants': {tenant: load for tenant, load in self._tenant_load.items() if load},
+            **self._counters,
+        }
+
+    @asynccontextmanager
+    async def _slot(self, tenant: str):
+        if self.max_per_tenant >= 0 and self._tenant_load[tenant] >= self.max_per_tenant:
+            self._counters['rejected_tenant'] += 1
+            raise RequestRejected(429, f"Tenant {tenant!r} has too many runs in progress", retry_after=1)
+        if self._semaphore.locked() and self._queued >= self.max_queue:
+            self._counters['rejected_overload'] += 1
+            raise RequestRejected(503, "Server is at capacity", retry_after=1)
+
+        self._tenant_load[tenant] += 1
+        try:
+            self._queued += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except TimeoutError:
+                self._counters['rejected_timeout'] += 1
+                raise RequestRejected(503, "Timed out waiting for a free slot", retry_after=1) from None
+            finally:
+                self._queued -= 1
+        except BaseException:
+            self._tenant_load[tenant] -= 1
+            raise
+
+        self._running += 1
+        slot = _Slot()
+        try:
+            yield slot
+        finally:
+            if slot.worker is not None and not slot.worker.done():
+                # A sync run's thread can't be cancelled; it keeps its slot until it really stops.
+                self._counters['abandoned'] += 1
+                slot.worker.add_done_callback(functools.partial(self._release_abandoned, tenant))
+            else:
+                self._release(tenant)
+
+    def _release(self, tenant: str) -> None:
+        self._running -= 1
+        self._semaphore.release()
+        self._tenant_load[tenant] -= 1
+
+    def _release_abandoned(self, tenant: str, worker: asyncio.Future) -> None:
+        if not worker.cancelled():
+            # Nobody awaits an abandoned run; retrieve its error so asyncio doesn't log it as unhandled.
+            worker.exception()
+        self._release(tenant)
+
+    def _build(self, name: str, tenant: str, emit: Callable[[Dict[str, Any]], None]) -> CommunicationProtocol:
+        protocol = self._factories[name](tenant)
+        for agent in protocol.agents:
+            agent.callbacks = _EventCallback(agent.callbacks, emit)
+        return protocol
+
+    def _sign(self, name: str, tenant: str, token: str) -> str:
+        message = '\0'.join((name, tenant, token)).encode('utf-8')
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+    def _seal(self, name: str, tenant: str, token: str) -> str:
+        return f"{self._sign(name, tenant, token)}.{token}"
+
+    def _unseal(self, name: str, tenant: str, sealed: Any) -> RunCheckpoint:
+        if not isinstance(sealed, str):
+            raise RequestRejected(400, "'resume_token' must be a string")
+        signature, _, token = sealed.partition('.')
+        if not token or not hmac.compare_digest(signature, self._sign(name, tenant, token)):
+            raise RequestRejected(403, "Resume token is not valid for this tenant and protocol")
+        try:
+            return RunCheckpoint.from_token(token)
+        except (ValueError, KeyError, TypeError) as exc:
+            raise RequestRejected(400, f"Malformed resume token: {exc}") from None
+
+    def _check_image(self, image: Any) -> None:
+        if not isinstance(image, str):
+            raise RequestRejected(400, "'images' must be a list of strings")
+        image = image.strip()
+        if image.startswith(('http://', 'https://', 'data:image/')):
+            return
+        try:
+            base64.b64decode(image, validate=True)
+        except (binascii.Error, ValueError):
+            raise RequestRejected(400, "Images must be URLs, data URLs or raw base64 strings") from None
+
+    def _parse_request(self, name: str, tenant: str, payload: Any) -> Dict[str, Any]:
+        if not isinstance(payload, dict):
+            raise RequestRejected(400, "Request body must be a JSON object")
+        if not isinstance(payload.get('input'), str):
+            raise RequestRejected(400, "'input' must be a string (the user's reply when resuming)")
+
+        images = payload.get('images')
+        if images is not None:
+            if not isinstance(images, list):
+                raise RequestRejected(400, "'images' must be a list of strings")
+            for image in images:
+                self._check_image(image)
+
+        timeout = payload.get('timeout')
+        if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0):
+            raise RequestRejected(400, "'timeout' must be a positive number of seconds")
+
+        start_agent = payload.get('start_agent')
+        if start_agent is not None and not isinstance(start_agent, str):
+            raise RequestRejected(400, "'start_agent' must be a string")
+
+        request = dict(payload)
+        if payload.get('resume_token') is not None:
+            request['checkpoint'] = self._unseal(name, tenant, payload['resume_token'])
+        return request
+
+    def _check_agents(self, protocol: CommunicationProtocol, request: Dict[str, Any]) -> None:
+        checkpoint = request.get('checkpoint')
+        agent_name = checkpoint.agent_name if checkpoint is not None else request.get('start_agent')
+        if agent_name is not None and agent_name not in protocol.agent_map:
+            raise RequestRejected(400, f"No agent called {agent_name!r} in this protocol")
+        if checkpoint is None and agent_name is not None and protocol.static:
+            raise RequestRejected(400, "Static protocols always start at their source agents; start_agent is not supported")
+
+    async def run(
+        self,
+        name: str,
+        tenant: str,
+        payload: Dict[str, Any],
+        emit: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Admit, build and run one request, returning the JSON-ready result.
+
+        Raises ``RequestRejected`` for anything the client should see as an error status.
+        """
+        emit = emit or (lambda event: None)
+        if name not in self._factories:
+            raise RequestRejected(404, f"No protocol registered as {name!r}")
+        if not _TENANT_PATTERN.match(tenant):
+            raise RequestRejected(400, "Invalid tenant id")
+        request = self._parse_request(name, tenant, payload)
+
+        async with self._slot(tenant) as slot:
+            loop = asyncio.get_running_loop()
+
+            def threadsafe_emit(event: Dict[str, Any]) -> None:
+                # Sync protocols run in a worker thread.
+                loop.call_soon_threadsafe(emit, event)
+
+            protocol = self._build(name, tenant, threadsafe_emit)
+            self._check_agents(protocol, request)
+            emit({'type': 'started', 'protocol': name})
+            try:
+                output = await self._execute(protocol, request, slot)
+            except DeadlineExceeded as exc:
+                self._counters['failed'] += 1
+                raise RequestRejected(504, str(exc)) from exc
+            except HandoffLimitError as exc:
+                self._counters['failed'] += 1
+                raise RequestRejected(422, str(exc)) from exc
+            except Exception:
+                # Anything else (a tool raising, a model that can't produce valid tool calls) is a server-side failure.
+                self._counters['failed'] += 1
+                raise
+            self._counters['completed'] += 1
+            return self._result(name, tenant, output)
+
+    async def _execute(self, protocol: CommunicationProtocol, request: Dict[str, Any], slot: _Slot) -> Any:
+        timeout = request.get('timeout') or self.default_timeout
+        images = request.get('images')
+        checkpoint = request.get('checkpoint')
+
+        if protocol.async_run_type:
+            if checkpoint is not None:
+                return await protocol.async_resume(checkpoint, request['input'], images=images, timeout=timeout)
+            return await protocol.async_execute(
+                request['input'], images=images, start_agent=request.get('start_agent'), timeout=timeout
+            )
+
+        if checkpoint is not None:
+            call = functools.partial(protocol.resume, checkpoint, request['input'], images, timeout)
+        else:
+            call = functools.partial(protocol.execute, request['input'], images, request.get('start_agent'), timeout)
+        loop = asyncio.get_running_loop()
+        slot.worker = loop.run_in_executor(None, contextvars.copy_context().run, call)
+        # Shielded so a cancelled request leaves the future pending until the thread finishes.
+        return await asyncio.shield(slot.worker)
+
+    def _result(self, name: str, tenant: str, output: Any) -> Dict[str, Any]:
+        if isinstance(output, SuspendedRun):
+            return {
+                'status': 'suspended',
+                'agent': output.agent_name,
+                'message': output.message,
+                'resume_token': self._seal(name, tenant, output.token),
+            }
+        return {'status': 'completed', 'output': output}
+
+    def _error_response(self, web, error: RequestRejected):
+        headers = {'Retry-After': str(int(error.retry_after))} if error.retry_after else None
+        return web.json_response({'error': error.reason}, status=error.status, headers=headers)
+
+    async def _handle_run(self, request):
+        web = _require_aiohttp()
+        try:
+            payload = await request.json()
+        except json.JSONDecodeError:
+            return web.json_response({'error': "Request body must be JSON"}, status=400)
+
+        tenant = request.headers.get('X-Tenant-ID', 'default')
+        try:
+            result = await self.run(request.match_info['name'], tenant, payload)
+        except RequestRejected as error:
+            return self._error_response(web, error)
+        except Exception as exc:
+            return web.json_response({'error': f"{type(exc).__name__}: {exc}"}, status=500)
+        return web.json_response(result)
+
+    async def _handle_stream(self, request):
+        web = _require_aiohttp()
+        socket = web.WebSocketResponse()
+        await socket.prepare(request)
+
+        tenant = request.headers.get('X-Tenant-ID', 'default')
+        try:
+            payload = await socket.receive_json()
+        except (TypeError, ValueError):
+            await socket.send_json({'type': 'error', 'status': 400, 'error': "Expected a JSON message"})
+            await socket.close()
+            return socket
+
+        events: asyncio.Queue = asyncio.Queue()
+        run = asyncio.create_task(self.run(request.match_info['name'], tenant, payload, emit=events.put_nowait))
+        disconnected = asyncio.create_task(self._wait_for_close(socket))
+        try:
+            while not run.done() or not events.empty():
+                getter = asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait({getter, run, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+                if getter in done:
+                    await socket.send_json(getter.result())
+                else:
+                    getter.cancel()
+                if disconnected in done:
+                    # Nobody is listening any more; the finally block cancels the run.
+                    return socket
+
+            try:
+                await socket.send_json({'type': 'result', **run.result()})
+            except RequestRejected as error:
+                await socket.send_json({'type': 'error', 'status': error.status, 'error': error.reason})
+            except Exception as exc:
+                await socket.send_json({'type': 'error', 'status': 500, 'error': f"{type(exc).__name__}: {exc}"})
+        finally:
+            # A client that disconnects cancels its run.
+            if not run.done():
+                run.cancel()
+            disconnected.cancel()
+            await asyncio.wait({disconnected})
+            await socket.close()
+        return socket
+
+    async def _wait_for_close(self, socket) -> None:
+        # Reading is how aiohttp notices the client closing or dropping the connection; other messages are ignored.
+        async for _ in socket:
+            pass
+
+    async def _handle_health(self, request):
+        web = _require_aiohttp()
+        return web.json_response(self.stats())
+
+    def create_app(self):
+        """Build the ``aiohttp.web.Application`` serving this server's routes."""
+        web = _require_aiohttp()
+        app = web.Application()
+        app.router.add_post('/v1/protocols/{name}/runs', self._handle_run)
+        app.router.add_get('/v1/protocols/{name}/stream', self._handle_stream)
+        app.router.add_get('/v1/health', self._handle_health)
+        return app
+
+    def serve(self, host: str = '127.0.0.1', port: int = 8080) -> None:
+        """Run the server until interrupted."""
+        web = _require_aiohttp()
+        web.run_app(self.create_app(), host=host, port=port)
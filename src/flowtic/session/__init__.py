@@ -1 +1,3 @@
 from .core import SessionManager as SessionManager
+from .checkpoint import RunCheckpoint as RunCheckpoint, SuspendedRun as SuspendedRun
+from .memory import MemoryIndex as MemoryIndex, MemorySessionManager as MemorySessionManager
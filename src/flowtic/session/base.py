@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import copy
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional
 
 class SessionInterface(ABC):
-    def __init__(self, ctx_size: int = 4):
+    def __init__(self, ctx_size: int = 4, thread_safe: bool = False):
         self._buffer_memory = dict()
         self._ctx_size = ctx_size
+        self.thread_safe = thread_safe
+        self._registry_lock = threading.Lock()
+        self._tag_locks: Dict[str, threading.RLock] = {}
+        self._appended: Dict[str, int] = {}
 
     @property
     def ctx_size(self) -> int:
@@ -16,11 +23,63 @@ class SessionInterface(ABC):
     def ctx_size(self, value: int):
         self._ctx_size = value
     
+    def _tag_lock(self, tag: str):
+        if not self.thread_safe:
+            return nullcontext()
+        return self._tag_locks[tag]
+
+    def _append(self, tag: str, message: Any):
+        # Messages are built completely before this point, so readers never see a half-written one.
+        with self._tag_lock(tag):
+            self._buffer_memory[tag].append(message)
+            self._appended[tag] = self._appended.get(tag, 0) + 1
+
+    def appended_count(self, tag: str) -> int:
+        """
+        Messages ever appended under ``tag``.
+
+        Unlike the buffer length it never goes down when messages are evicted
+        or trimmed, so it works as a mark for ``messages_since``.
+        """
+        return self._appended.get(tag, 0)
+
+    def messages_since(self, tag: str, mark: int) -> List:
+        """The messages appended after ``appended_count`` returned ``mark`` that are still in the buffer."""
+        with self._tag_lock(tag):
+            buffer = self._buffer_memory[tag]
+            # Eviction never removes the leading system prompt, which was there before any later mark.
+            system = 0
+            while system < len(buffer) and system < mark and buffer[system].get('role') == 'system':
+                system += 1
+            return list(buffer[max(system, len(buffer) - (self.appended_count(tag) - mark)):])
+
     def get_buffer_memory(self, tag: str) -> List:
-        return self._buffer_memory[tag]
+        """
+        The conversation under ``tag``.
+
+        In thread-safe mode this is a snapshot copy, so a request being built or
+        serialized is unaffected by messages other threads append meanwhile.
+        """
+        if not self.thread_safe:
+            return self._buffer_memory[tag]
+        with self._tag_lock(tag):
+            return list(self._buffer_memory[tag])
     
+    def get_prompt_messages(self, tag: str) -> List:
+        return self.get_buffer_memory(tag)
+
+    def export_buffer(self, tag: str) -> List:
+        with self._tag_lock(tag):
+            return copy.deepcopy(self._buffer_memory[tag])
+
+    def load_buffer(self, tag: str, messages: List):
+        messages = copy.deepcopy(list(messages))
+        with self._tag_lock(tag):
+            self._buffer_memory[tag] = messages
+
     def add_sys_ins(self, tag: str, instruction: str):
-        self._buffer_memory[tag].append(
+        self._append(
+            tag,
             {
                 'role': 'system',
                 'content': instruction
@@ -30,6 +89,9 @@ class SessionInterface(ABC):
     @abstractmethod
     def add_user_context(self, tag: str, text: Optional[str] = None, images: Optional[List] = None): ...
     
+    async def aadd_user_context(self, tag: str, text: Optional[str] = None, images: Optional[List] = None):
+        self.add_user_context(tag, text=text, images=images)
+
     @abstractmethod
     def add_assistant_context(self, tag: str, ass_out: Any): ...
     
@@ -37,7 +99,10 @@ class SessionInterface(ABC):
     def add_tool_context(self, tag: str, fn_name: str, tool_call_id: str, output: Any): ...
 
     def _register_buffer(self, tag: str):
-        if tag not in self._buffer_memory:
-            self._buffer_memory[tag] = []
-        else:
-            raise ValueError(f"Tag {tag} already exists")
+        with self._registry_lock:
+            if tag not in self._buffer_memory:
+                self._tag_locks[tag] = threading.RLock()
+                self._buffer_memory[tag] = []
+                self._appended[tag] = 0
+            else:
+                raise ValueError(f"Tag {tag} already exists")
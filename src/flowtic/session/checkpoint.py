@@ -0,0 +1,105 @@
+import base64
+import json
+import zlib
+from typing import Any, Dict, List, Optional
+
+CHECKPOINT_VERSION = 1
+
+
+class RunCheckpoint:
+    """
+    Serializable state of an agent run parked while waiting for user input.
+
+    Args:
+        agent_name (str): The agent that asked the user and will resume the run.
+        buffers (Dict[str, List]): Session buffers keyed by agent tag.
+        turn_count (int, optional): Turns already spent by the agent. Defaults to 0.
+        final_output (Optional[str], optional): The last final output of the agent. Defaults to None.
+        message (Optional[str], optional): The assistant message shown to the user. Defaults to None.
+        artifacts (Optional[Dict[str, Dict]], optional): The run's shared artifacts keyed by handle. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        agent_name: str,
+        buffers: Dict[str, List],
+        turn_count: int = 0,
+        final_output: Optional[str] = None,
+        message: Optional[str] = None,
+        artifacts: Optional[Dict[str, Dict]] = None,
+    ) -> None:
+        self.agent_name = agent_name
+        self.buffers = buffers
+        self.turn_count = turn_count
+        self.final_output = final_output
+        self.message = message
+        self.artifacts = artifacts or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': CHECKPOINT_VERSION,
+            'agent_name': self.agent_name,
+            'buffers': self.buffers,
+            'turn_count': self.turn_count,
+            'final_output': self.final_output,
+            'message': self.message,
+            'artifacts': self.artifacts,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunCheckpoint':
+        if data.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {data.get('version')!r}")
+        return cls(
+            agent_name=data['agent_name'],
+            buffers=data['buffers'],
+            turn_count=data['turn_count'],
+            final_output=data['final_output'],
+            message=data['message'],
+            artifacts=data.get('artifacts'),
+        )
+
+    def to_token(self) -> str:
+        payload = json.dumps(self.to_dict(), separators=(',', ':'), default=str).encode('utf-8')
+        return base64.urlsafe_b64encode(zlib.compress(payload)).decode('ascii')
+
+    @classmethod
+    def from_token(cls, token: str) -> 'RunCheckpoint':
+        try:
+            payload = zlib.decompress(base64.urlsafe_b64decode(token.encode('ascii')))
+        except (ValueError, zlib.error) as exc:
+            raise ValueError("Invalid resume token") from exc
+        return cls.from_dict(json.loads(payload))
+
+    @classmethod
+    def load(cls, checkpoint: 'RunCheckpoint | str') -> 'RunCheckpoint':
+        if isinstance(checkpoint, RunCheckpoint):
+            return checkpoint
+        return cls.from_token(checkpoint)
+
+
+class SuspendedRun:
+    """
+    Returned instead of the final output when a run is parked for user input.
+
+    Store ``token`` anywhere and pass it with the user's reply to ``resume`` on
+    any worker that builds the same agents.
+    """
+
+    def __init__(self, checkpoint: RunCheckpoint) -> None:
+        self.checkpoint = checkpoint
+
+    @property
+    def agent_name(self) -> str:
+        return self.checkpoint.agent_name
+
+    @property
+    def message(self) -> Optional[str]:
+        return self.checkpoint.message
+
+    @property
+    def token(self) -> str:
+        return self.checkpoint.to_token()
+
+    def __repr__(self) -> str:
+        return f"SuspendedRun(agent_name={self.agent_name!r})"
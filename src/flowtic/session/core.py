@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import binascii
 import io
@@ -50,51 +51,38 @@ class SessionManager(SessionInterface):
         return f"data:image/jpeg;base64,{normalized_image}"
             
     def add_user_context(self, tag: str, text: Optional[str] = None, images: Optional[List] = None):
-        if text and images:
-            self._buffer_memory[tag].append(
-                {
-                    'role': 'user',
-                    'content':[
-                        {'type': 'text', 'text': text},
-                    ]
-                }
-            )
-            for img in images:
-                self._buffer_memory[tag][-1]['content'].append(
-                    {'type': 'image_url', 'image_url': {'url': self._handle_image(img)}}
-                )
-
-        elif text:
-            self._buffer_memory[tag].append(
-                {
-                    'role': 'user',
-                    'content':[
-                        {'type': 'text', 'text': text},
-                    ]
-                }
-            )
-        elif images:
-            self._buffer_memory[tag].append(
-                {
-                    'role': 'user',
-                    'content':[
-                        {'type': 'image_url', 'image_url': {'url': self._handle_image(img)}} for img in images
-                    ]
-                }
-            )
-        else:
+        if not text and not images:
             raise ValueError("No input provided")
+
+        content = [{'type': 'text', 'text': text}] if text else []
+        for img in images or []:
+            content.append({'type': 'image_url', 'image_url': {'url': self._handle_image(img)}})
+        self._append(tag, {'role': 'user', 'content': content})
     
+    async def aadd_user_context(self, tag: str, text: Optional[str] = None, images: Optional[List] = None):
+        """
+        Same as ``add_user_context``, but reads and encodes the images concurrently in the
+        loop's default executor so large files don't block the event loop.
+        """
+        if images:
+            loop = asyncio.get_running_loop()
+            images = await asyncio.gather(*[
+                loop.run_in_executor(None, self._handle_image, img) for img in images
+            ])
+        # Encoded images are data URLs, which add_user_context passes through unchanged.
+        self.add_user_context(tag, text=text, images=images)
+
     def add_assistant_context(self, tag: str, ass_out: Any):
         if hasattr(ass_out, 'model_dump'):
-            self._buffer_memory[tag].append(ass_out.model_dump())
+            self._append(tag, ass_out.model_dump())
         elif hasattr(ass_out, 'dict'):
-            self._buffer_memory[tag].append(ass_out.dict())
+            self._append(tag, ass_out.dict())
         else:
-            self._buffer_memory[tag].append(ass_out)
+            self._append(tag, ass_out)
     
     def add_tool_context(self, tag: str, fn_name, tool_call_id, output):
-        self._buffer_memory[tag].append(
+        self._append(
+            tag,
             {
                 'tool_call_id': tool_call_id,
                 'role': 'tool',
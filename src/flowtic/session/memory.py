@@ -0,0 +1,216 @@
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from flowtic.retrieval import tokenize
+from flowtic.session.core import SessionManager
+
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memories USING fts5(tag UNINDEXED, text UNINDEXED, terms);
+"""
+
+
+def _estimate_tokens(text: str) -> int:
+    # Roughly four characters per token; good enough to keep the injected block a fixed size.
+    return max(1, len(text) // 4)
+
+
+def _message_text(message: Any) -> str:
+    if not isinstance(message, dict):
+        message = message.model_dump() if hasattr(message, 'model_dump') else dict(message)
+
+    role = message.get('role', '')
+    content = message.get('content')
+    parts = []
+    if isinstance(content, str):
+        parts.append(content)
+    elif isinstance(content, list):
+        for item in content:
+            if isinstance(item, dict) and item.get('type') == 'text':
+                parts.append(item.get('text', ''))
+            elif isinstance(item, dict) and item.get('type') == 'image_url':
+                parts.append('[image]')
+
+    for tool_call in message.get('tool_calls') or []:
+        function = tool_call.get('function', {})
+        parts.append(f"called {function.get('name')}({function.get('arguments', '')})")
+
+    if role == 'tool':
+        role = f"tool {message.get('name', '')}".strip()
+    text = ' '.join(part for part in parts if part)
+    return f"{role}: {text}" if text else ''
+
+
+class MemoryIndex:
+    """
+    Per-tag long-term memory in an SQLite FTS5 table, ranked with its ``bm25()``.
+
+    Snippets live only in the database, so memory use doesn't grow with
+    history, and a restarted process can search what earlier ones stored.
+    Text is indexed with the same tokenizer as tool selection (snake_case and
+    camelCase identifiers are split into words).
+
+    Args:
+        path (Optional[str], optional): SQLite file to store memories in. Defaults to None (in memory only).
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path or ':memory:', check_same_thread=False)
+        try:
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.OperationalError as exc:
+            self._conn.close()
+            raise RuntimeError(f"MemoryIndex needs SQLite built with FTS5: {exc}") from exc
+        self._lock = threading.Lock()
+
+    def add(self, tag: str, text: str) -> None:
+        terms = tokenize(text)
+        if not terms:
+            return
+        with self._lock, self._conn:
+            self._conn.execute('INSERT INTO memories (tag, text, terms) VALUES (?, ?, ?)', (tag, text, ' '.join(terms)))
+
+    def search(self, tag: str, query: str, k: int = 5) -> List[Tuple[str, float]]:
+        """Return up to ``k`` ``(text, score)`` pairs for ``tag``, best first."""
+        terms = dict.fromkeys(tokenize(query))
+        if not terms or k <= 0:
+            return []
+        match = ' OR '.join(f'"{term}"' for term in terms)
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT text, bm25(memories) FROM memories WHERE memories MATCH ? AND tag = ? '
+                'ORDER BY bm25(memories) LIMIT ?',
+                (match, tag, k),
+            ).fetchall()
+        # bm25() is lower for better matches; flip it so higher is better, like BM25Index.
+        return [(text, -score) for text, score in rows]
+
+    def count(self, tag: str) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM memories WHERE tag = ?', (tag,)).fetchone()[0]
+
+    def clear(self, tag: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM memories WHERE tag = ?', (tag,))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class MemorySessionManager(SessionManager):
+    """
+    A session that keeps a bounded window of recent messages per tag and moves
+    older ones into a long-term ``MemoryIndex``.
+
+    Each request carries the system prompt, the most relevant recalled
+    snippets (within ``recall_tokens``) and the live window, so request size
+    stays roughly constant however long the agent runs. Messages are evicted a
+    whole exchange at a time, so an assistant tool call is never separated
+    from its tool results or the tool output images sent between them.
+
+    Args:
+        max_messages (int, optional): Non-system messages kept verbatim per tag. Defaults to 20.
+        memory (Optional[MemoryIndex], optional): Where evicted messages go. Defaults to None (a new in-memory index).
+        memory_path (Optional[str], optional): SQLite file for a new index, ignored if ``memory`` is given. Defaults to None.
+        recall_tokens (int, optional): Token budget for recalled snippets per request. Defaults to 1000.
+        recall_k (int, optional): Maximum snippets recalled per request. Defaults to 5.
+        query_messages (int, optional): Recent messages used as the search query. Defaults to 2.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_messages: int = 20,
+        memory: Optional[MemoryIndex] = None,
+        memory_path: Optional[str] = None,
+        recall_tokens: int = 1000,
+        recall_k: int = 5,
+        query_messages: int = 2,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        if max_messages < 1:
+            raise ValueError("max_messages must be at least 1")
+
+        self.max_messages = max_messages
+        self.memory = memory or MemoryIndex(memory_path)
+        self.recall_tokens = recall_tokens
+        self.recall_k = recall_k
+        self.query_messages = query_messages
+
+    def _next_boundary(self, buffer: List, start: int) -> int:
+        # An exchange is one message plus, for an assistant tool call, every result answering it and the
+        # "tool output images" user messages the agent loops insert between those results.
+        pending = {tool_call.get('id') for tool_call in buffer[start].get('tool_calls') or []}
+        end = start + 1
+        while end < len(buffer):
+            message = buffer[end]
+            if message.get('role') == 'tool':
+                pending.discard(message.get('tool_call_id'))
+            elif not (message.get('role') == 'user' and buffer[end - 1].get('role') == 'tool'):
+                break
+            end += 1
+        # Results still missing mean the batch is being written; report it as running to the end.
+        return len(buffer) if pending else end
+
+    def _evict(self, tag: str) -> None:
+        with self._tag_lock(tag):
+            buffer = self._buffer_memory[tag]
+            start = 1 if buffer and buffer[0].get('role') == 'system' else 0
+
+            while len(buffer) - start > self.max_messages:
+                end = self._next_boundary(buffer, start)
+                # Never evict the exchange still being written.
+                if end >= len(buffer):
+                    break
+                text = '\n'.join(filter(None, (_message_text(message) for message in buffer[start:end])))
+                if text:
+                    self.memory.add(tag, text)
+                del buffer[start:end]
+
+    def _recall(self, tag: str, buffer: List) -> Optional[Dict[str, str]]:
+        if self.recall_tokens <= 0 or self.recall_k <= 0:
+            return None
+
+        recent = [message for message in buffer if message.get('role') != 'system'][-self.query_messages:]
+        query = ' '.join(_message_text(message) for message in recent)
+        if not query:
+            return None
+
+        snippets = []
+        budget = self.recall_tokens
+        for text, _ in self.memory.search(tag, query, self.recall_k):
+            cost = _estimate_tokens(text)
+            if cost > budget:
+                continue
+            snippets.append(text)
+            budget -= cost
+
+        if not snippets:
+            return None
+        return {
+            'role': 'system',
+            'content': 'Relevant earlier conversation:\n\n' + '\n\n---\n\n'.join(snippets),
+        }
+
+    def get_prompt_messages(self, tag: str) -> List:
+        buffer = self.get_buffer_memory(tag)
+        recalled = self._recall(tag, buffer)
+        if recalled is None:
+            return buffer
+
+        split = 1 if buffer and buffer[0].get('role') == 'system' else 0
+        return buffer[:split] + [recalled] + buffer[split:]
+
+    def add_user_context(self, tag: str, text: Optional[str] = None, images: Optional[List] = None):
+        super().add_user_context(tag, text=text, images=images)
+        self._evict(tag)
+
+    def add_assistant_context(self, tag: str, ass_out: Any):
+        super().add_assistant_context(tag, ass_out)
+        self._evict(tag)
+
+    def add_tool_context(self, tag: str, fn_name, tool_call_id, output):
+        super().add_tool_context(tag, fn_name, tool_call_id, output)
+        self._evict(tag)
@@ -0,0 +1,70 @@
+import os
+
+# Keep litellm from fetching its model cost map over the network, so offline tests stay offline.
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+import pytest
+
+from flowtic.agents import Agent, AsyncAgent
+from flowtic.agents.tools import Tool
+from flowtic.communication import Callback, SuspendRun
+from flowtic.providers import FakeProvider
+
+
+def calculator_tool(expression: str):
+    return str(eval(expression)), None
+
+
+class ParkingCallback(Callback):
+    def on_user_loop(self, agent_name: str, assistant_message: str):
+        raise SuspendRun()
+
+
+@pytest.fixture
+def calculator():
+    return Tool(
+        tool_definition={
+            "type": "function",
+            'function': {
+                'name': 'calculator_tool',
+                'description': 'Calculate the result of a mathematical expression',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'expression': {
+                            'type': 'string',
+                            'description': 'The mathematical expression to evaluate'
+                        }
+                    },
+                    'required': ['expression']
+                }
+            }
+        },
+        tool_execution=calculator_tool
+    )
+
+
+@pytest.fixture
+def parking_callback():
+    return ParkingCallback()
+
+
+@pytest.fixture
+def make_agent():
+    """
+    Build an offline agent answering from a ``FakeProvider``.
+
+    ``make_agent(name, script, responder=None, latency=0.0, asynchronous=False, **agent_kwargs)``;
+    user input is off unless ``allow_user_input`` or ``callbacks`` is passed.
+    """
+    def make(name, script=None, *, responder=None, latency=0.0, asynchronous=False, provider=None, **kwargs):
+        if 'callbacks' not in kwargs:
+            kwargs.setdefault('allow_user_input', False)
+        agent_class = AsyncAgent if asynchronous else Agent
+        return agent_class(
+            agent_name=name,
+            model_name=kwargs.pop('model_name', 'fake'),
+            provider=provider or FakeProvider(script, responder=responder, latency=latency),
+            **kwargs,
+        )
+    return make
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from flowtic.providers import FakeProvider, configure_adaptive_concurrency, disable_adaptive_concurrency
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_adaptive_concurrency_caps_in_flight_calls_and_backs_off_on_rate_limits(make_agent):
+    in_flight = peak = 0
+
+    class CountingProvider(FakeProvider):
+        async def acompletion(self, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await super().acompletion(**kwargs)
+            finally:
+                in_flight -= 1
+
+    controller = configure_adaptive_concurrency(initial_limit=2, max_limit=4)
+    try:
+        agents = [
+            make_agent(f'agent_{i}', asynchronous=True, provider=CountingProvider(responder=lambda messages, tools: "done", latency=0.01))
+            for i in range(8)
+        ]
+
+        async def run_all():
+            return await asyncio.gather(*[agent('go') for agent in agents])
+
+        assert asyncio.run(run_all()) == ["done"] * 8
+        assert peak <= 4
+        metrics = controller.metrics()['fake@default']
+        assert metrics['successes'] == 8 and metrics['in_flight'] == 0
+        assert 2 <= metrics['limit'] <= 4
+
+        limit = metrics['limit']
+        failing = make_agent('failing', [RateLimitError("slow down")], asynchronous=True)
+        with pytest.raises(RateLimitError):
+            asyncio.run(failing('go'))
+        metrics = controller.metrics()['fake@default']
+        assert metrics['overloads'] == 1 and metrics['limit'] < limit
+    finally:
+        disable_adaptive_concurrency()
@@ -0,0 +1,18 @@
+from flowtic.communication import CommunicationProtocol
+from flowtic.providers import FakeResponse
+
+
+def test_large_handoffs_pass_artifact_handles(make_agent):
+    document = 'lorem ipsum ' * 500
+    manager = make_agent('manager', [FakeResponse.handoff('editor', document)])
+    editor = make_agent('editor', [
+        FakeResponse(tool_calls=[('read_artifact', {'handle': 'artifact-1', 'length': 11})]),
+        "edited",
+    ])
+    protocol = CommunicationProtocol('manager->editor', [manager, editor], artifact_threshold=1000)
+
+    assert protocol.execute('go') == "edited"
+    editor_buffer = editor.session.get_buffer_memory('editor')
+    handoff = editor_buffer[1]['content'][0]['text']
+    assert 'artifact-1' in handoff and len(handoff) < 1000
+    assert editor_buffer[3]['content'].endswith('lorem ipsum')
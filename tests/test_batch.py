@@ -0,0 +1,122 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from flowtic.agents import Agent, AsyncAgent
+from flowtic.batch import BatchRunner, WorkerError, WorkerPool, aexecute_many, execute_many
+from flowtic.communication import CommunicationProtocol
+from flowtic.providers import FakeProvider, FakeResponse
+
+
+def shout(messages, tools):
+    # "slow ..." inputs take longer, so completion order differs from input order.
+    text = messages[-1]['content'][0]['text']
+    return FakeResponse(text.upper(), latency=0.1 if text.startswith('slow') else 0.0)
+
+
+def make_agent():
+    return Agent(agent_name='agent', model_name='fake', allow_user_input=False, provider=FakeProvider(responder=shout))
+
+
+def make_async_agent():
+    return AsyncAgent(agent_name='agent', model_name='fake', allow_user_input=False, provider=FakeProvider(responder=shout))
+
+
+def make_protocol():
+    manager = Agent(
+        agent_name='manager',
+        model_name='fake',
+        allow_user_input=False,
+        provider=FakeProvider([FakeResponse.handoff('developer', 'build it')]),
+    )
+    developer = Agent(agent_name='developer', model_name='fake', allow_user_input=False, provider=FakeProvider(["built"]))
+    return CommunicationProtocol('manager->developer', [manager, developer])
+
+
+def test_map_yields_in_completion_order_and_execute_many_in_input_order():
+    runner = BatchRunner(make_agent, concurrency=2)
+
+    completed = [result.output for result in runner.map(['slow a', 'b'])]
+    assert completed == ['B', 'SLOW A']
+    assert [result.output for result in runner.execute_many(['slow a', 'b'])] == ['SLOW A', 'B']
+
+
+def test_invalid_inputs_fail_per_item():
+    results = execute_many(make_agent, ['a', {'nope': 1}, 'c'], retries=2)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, TypeError) and results[1].attempts == 1
+    assert results[2].output == 'C'
+
+
+def test_retries_back_off_and_count_in_stats():
+    attempts = []
+
+    def flaky():
+        attempts.append(time.perf_counter())
+        script = [RuntimeError("boom")] if len(attempts) < 3 else ["ok"]
+        return Agent(agent_name='agent', model_name='fake', allow_user_input=False, provider=FakeProvider(script))
+
+    progress = []
+    runner = BatchRunner(flaky, retries=2, retry_delay=0.02, on_progress=lambda stats: progress.append(stats.completed))
+    [result] = runner.execute_many(['go'])
+
+    assert result.ok and result.output == 'ok' and result.attempts == 3
+    assert attempts[1] - attempts[0] >= 0.02 and attempts[2] - attempts[1] >= 0.04
+    assert runner.stats.as_dict()['retries'] == 2 and runner.stats.succeeded == 1
+    assert progress == [1]
+
+
+def test_failures_after_retries_are_reported():
+    failing = lambda: Agent(agent_name='agent', model_name='fake', allow_user_input=False, provider=FakeProvider([RuntimeError("down")]))
+    runner = BatchRunner(failing, retries=1)
+    [result] = runner.execute_many(['go'])
+
+    assert not result.ok and str(result.error) == "down" and result.attempts == 2
+    assert runner.stats.failed == 1 and runner.stats.retries == 1
+
+
+def test_async_runs_cover_async_and_sync_targets():
+    inputs = ['slow a', 'b', {'input': 'c'}]
+
+    async_results = asyncio.run(aexecute_many(make_async_agent, inputs, concurrency=3))
+    sync_results = asyncio.run(aexecute_many(make_agent, inputs, concurrency=3))
+    protocol_results = asyncio.run(aexecute_many(make_protocol, ['go', 'go']))
+
+    assert [result.output for result in async_results] == ['SLOW A', 'B', 'C']
+    assert [result.output for result in sync_results] == ['SLOW A', 'B', 'C']
+    assert [result.output for result in protocol_results] == ['built', 'built']
+
+
+def crash_or_shout(messages, tools):
+    if messages[-1]['content'][0]['text'] == 'crash':
+        os._exit(3)
+    if messages[-1]['content'][0]['text'] == 'fail':
+        raise RuntimeError("bad item")
+    return shout(messages, tools)
+
+
+def make_pool_agent():
+    return Agent(agent_name='agent', model_name='fake', allow_user_input=False, provider=FakeProvider(responder=crash_or_shout))
+
+
+def test_worker_pool_records_failures_and_rejects_malformed_jobs(tmp_path):
+    pool = WorkerPool(make_pool_agent, workers=1, db_path=str(tmp_path / 'queue.db'))
+    with pytest.raises(TypeError):
+        pool.submit(['x', {'nope': 1}])
+
+    results = pool.run(['x', 'fail', {'input': 'z'}])
+
+    assert [(result.output, result.ok) for result in results] == [('X', True), (None, False), ('Z', True)]
+    assert 'bad item' in str(results[1].error)
+    assert pool.progress() == {'pending': 0, 'running': 0, 'done': 2, 'failed': 1}
+
+
+def test_worker_pool_raises_when_a_worker_dies(tmp_path):
+    pool = WorkerPool(make_pool_agent, workers=1, db_path=str(tmp_path / 'queue.db'))
+
+    with pytest.raises(WorkerError, match='exited with codes \\[3\\]'):
+        pool.run(['crash', 'y'])
+    assert pool.progress()['pending'] == 2
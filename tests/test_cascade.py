@@ -0,0 +1,19 @@
+from flowtic.agents import Cascade
+from flowtic.agents.tools import Tools
+from flowtic.providers import FakeProvider, FakeResponse
+
+
+def test_cascade_escalates_malformed_tool_arguments(make_agent, calculator):
+    provider = FakeProvider([
+        FakeResponse(tool_calls=[('calculator_tool', '{"expression": ')]),
+        FakeResponse(tool_calls=[('calculator_tool', {'expression': '2 + 2'})]),
+        "4",
+    ])
+    cascade = Cascade(['cheap'])
+    agent = make_agent('agent', model_name='strong', tools=Tools([calculator]), provider=provider, cascade=cascade)
+
+    assert agent('2 + 2?') == "4"
+    assert [call['model'] for call in provider.calls] == ['cheap', 'strong', 'cheap']
+    stats = cascade.stats()
+    assert stats['cheap']['escalated'] == 1 and stats['cheap']['accepted'] == 1
+    assert stats['strong']['accepted'] == 1
@@ -0,0 +1,48 @@
+import asyncio
+import time
+
+import pytest
+
+from flowtic.agents.deadline import DeadlineExceeded
+from flowtic.agents.tools import Tool, Tools
+from flowtic.communication import CommunicationProtocol
+from flowtic.providers import FakeResponse
+
+
+def test_deadline_closes_pending_tool_calls(make_agent):
+    manager = make_agent('manager', [FakeResponse.handoff('developer', 'build it', asynchronous=True)], asynchronous=True)
+    developer = make_agent('developer', ["too late"], latency=5, asynchronous=True)
+    protocol = CommunicationProtocol('manager->developer', [manager, developer], async_run_type=True)
+
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(protocol.async_execute('go', timeout=0.1))
+
+    buffer = manager.session.get_buffer_memory('manager')
+    assert buffer[-1]['role'] == 'tool'
+    assert buffer[-1]['tool_call_id'] == buffer[-2]['tool_calls'][0]['id']
+
+
+def test_cancelling_a_run_does_not_wait_for_a_blocking_tool(make_agent):
+    def slow_tool():
+        time.sleep(3)
+        return "finished", None
+
+    tool = Tool(
+        tool_definition={
+            'type': 'function',
+            'function': {'name': 'slow_tool', 'description': 'Takes a while', 'parameters': {'type': 'object', 'properties': {}}},
+        },
+        tool_execution=slow_tool,
+    )
+    agent = make_agent('agent', [FakeResponse(tool_calls=[('slow_tool', {})]), "done"], tools=Tools([tool]), asynchronous=True)
+
+    async def main():
+        task = asyncio.create_task(agent('go'))
+        await asyncio.sleep(0.2)
+        cancelled_at = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return time.perf_counter() - cancelled_at
+
+    assert asyncio.run(main()) < 1
@@ -0,0 +1,26 @@
+from flowtic.agents.tools import Tools
+from flowtic.communication import CommunicationProtocol
+from flowtic.providers import FakeProvider, FakeResponse
+
+
+def test_single_agent_tool_call(make_agent, calculator):
+    provider = FakeProvider([
+        FakeResponse(tool_calls=[('calculator_tool', {'expression': '15 * 23'})]),
+        "It's 345",
+    ])
+    agent = make_agent('agent', tools=Tools([calculator]), provider=provider)
+
+    assert agent('heyy!') == "It's 345"
+    assert provider.remaining == 0
+    tool_message = agent.session.get_buffer_memory('agent')[-2]
+    assert tool_message['role'] == 'tool' and tool_message['content'] == '345'
+
+
+def test_protocol_handoff(make_agent):
+    manager = make_agent('manager', [FakeResponse.handoff('developer', 'build it')])
+    developer = make_agent('developer', ["built"])
+    protocol = CommunicationProtocol('manager->developer', [manager, developer])
+
+    assert protocol.execute('go') == "built"
+    handoff = developer.session.get_buffer_memory('developer')[1]['content'][0]['text']
+    assert "It's manager here" in handoff and 'build it' in handoff
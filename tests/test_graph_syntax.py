@@ -0,0 +1,25 @@
+import pytest
+
+from flowtic.communication import CommunicationProtocol
+
+
+def test_group_and_wildcard_graph_syntax(make_agent):
+    agents = [make_agent(name) for name in ('hub', 'a', 'b', 'worker_1', 'worker_2', 'qa')]
+    protocol = CommunicationProtocol(
+        'hub<->{a,b}, hub->crew[*], worker_*->qa',
+        agents,
+        groups={'crew': ['worker_1', 'worker_2']},
+    )
+
+    assert protocol.mapping['hub'] == ['a', 'b', 'worker_1', 'worker_2']
+    assert protocol.mapping['worker_2'] == ['qa'] and protocol.mapping['a'] == ['hub']
+    receiver = agents[0].tools.get_definitions()[0]['function']['parameters']['properties']['receiver']
+    assert receiver['enum'] == ['a', 'b', 'worker_1', 'worker_2']
+
+
+def test_explicit_self_edges_are_rejected(make_agent):
+    agents = [make_agent(name) for name in ('a', 'b')]
+
+    with pytest.raises(ValueError, match="can't hand off to itself"):
+        CommunicationProtocol('a->a, a->b', agents)
+    assert CommunicationProtocol('{a,b}<->{a,b}', agents).mapping == {'a': ['b'], 'b': ['a']}
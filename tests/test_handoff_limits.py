@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from flowtic.communication import CommunicationProtocol, HandoffLimitError
+from flowtic.providers import FakeResponse
+
+
+def test_handoff_cycle_is_rejected(make_agent):
+    def build(name, receiver):
+        return make_agent(name, responder=lambda messages, tools: FakeResponse.handoff(receiver, 'ping'))
+
+    protocol = CommunicationProtocol('a<->b', [build('a', 'b'), build('b', 'a')], cycle_policy='reject')
+    with pytest.raises(HandoffLimitError):
+        protocol.execute('go')
+
+
+def ping_pong(make_agent, **limits):
+    def build(name, receiver):
+        return make_agent(name, responder=lambda messages, tools: FakeResponse.handoff(receiver, 'ping'))
+
+    a, b = build('a', 'b'), build('b', 'a')
+    return CommunicationProtocol('a<->b', [a, b], **limits), a.provider, b.provider
+
+
+def test_handoff_depth_is_limited(make_agent):
+    def build(**limits):
+        agents = [
+            make_agent('a', [FakeResponse.handoff('b', 'task')]),
+            make_agent('b', [FakeResponse.handoff('c', 'subtask')]),
+            make_agent('c', ['c done']),
+        ]
+        return CommunicationProtocol('a->b, b->c', agents, **limits)
+
+    with pytest.raises(HandoffLimitError, match='depth 1'):
+        build(max_handoff_depth=1).execute('go')
+    assert build(max_handoff_depth=2).execute('go') == 'c done'
+
+
+def test_edge_traversals_raise_on_the_next_use(make_agent):
+    protocol, a, b = ping_pong(make_agent, max_edge_traversals=2)
+    with pytest.raises(HandoffLimitError, match='a->b traversed more than 2 times'):
+        protocol.execute('go')
+    # a->b ran twice and b->a twice; the third a->b was refused before b ran again.
+    assert (len(a.calls), len(b.calls)) == (3, 2)
+
+
+def test_cycles_are_limited_under_allow(make_agent):
+    protocol, a, b = ping_pong(make_agent, max_cycles=1)
+    with pytest.raises(HandoffLimitError, match='1 handoff cycles'):
+        protocol.execute('go')
+    # b->a was the one allowed cycle; a->b while b is still waiting was the second.
+    assert (len(a.calls), len(b.calls)) == (2, 1)
+
+
+def test_return_policy_hands_the_cycle_back_to_the_sender(make_agent):
+    seen = []
+
+    def respond(messages, tools):
+        seen.append(dict(messages[-1]))
+        return FakeResponse.handoff('a', 'question') if len(seen) == 1 else 'b done'
+
+    a = make_agent('a', [FakeResponse.handoff('b', 'task')])
+    b = make_agent('b', responder=respond)
+    protocol = CommunicationProtocol('a<->b', [a, b], cycle_policy='return')
+
+    assert protocol.execute('go') == 'b done'
+    # The declined handoff came back to b as a tool result, and b kept its turn instead of stopping.
+    assert seen[1]['role'] == 'tool' and 'a is already waiting' in seen[1]['content']
+    assert len(a.provider.calls) == 1
+
+
+def test_parallel_async_handoffs_track_their_own_chains(make_agent):
+    senders = {'a': [], 'b': []}
+
+    def worker(name, other):
+        def respond(messages, tools):
+            last = messages[-1]
+            if last['role'] != 'user':
+                return f'{name} done'
+            text = last['content'][0]['text']
+            senders[name].append(text)
+            if "It's hub here" in text:
+                return FakeResponse.handoff(other, 'compare notes', asynchronous=True)
+            return f'{name} done'
+        return make_agent(name, responder=respond, latency=0.05, asynchronous=True)
+
+    hub = make_agent(
+        'hub',
+        [FakeResponse(tool_calls=[
+            ('_async_spin_into', {'receiver': name, 'message': 'work', 'context': ''}) for name in ('a', 'b')
+        ])],
+        asynchronous=True,
+    )
+    protocol = CommunicationProtocol(
+        'hub->a, hub->b, a<->b', [hub, worker('a', 'b'), worker('b', 'a')],
+        async_run_type=True, cycle_policy='reject', max_handoff_depth=2,
+    )
+
+    # hub->a->b and hub->b->a run at once; neither is a cycle nor deeper than two,
+    # which only holds if each handoff sees its own chain rather than the other's.
+    asyncio.run(protocol.async_execute('go'))
+    assert any("It's b here" in text for text in senders['a'])
+    assert any("It's a here" in text for text in senders['b'])
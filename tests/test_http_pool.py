@@ -0,0 +1,37 @@
+import asyncio
+
+import httpx
+import litellm
+
+from flowtic.providers import HTTPClientManager
+
+
+def respond(request):
+    return httpx.Response(500 if request.url.path == '/broken' else 200, json={'ok': True})
+
+
+def test_pool_counts_per_origin_and_keeps_one_async_client_per_loop():
+    manager = HTTPClientManager(transport=httpx.MockTransport(respond)).install()
+    try:
+        assert litellm.client_session is manager.client
+        assert litellm.aclient_session is manager.async_client
+
+        manager.client.get('https://api.example.com/v1/models')
+        manager.client.get('https://api.example.com/broken')
+
+        async def request():
+            response = await litellm.aclient_session.get('http://localhost:8000/v1/models')
+            assert response.status_code == 200
+            return manager.client_for_loop()
+
+        first, second = asyncio.run(request()), asyncio.run(request())
+        assert first is not second
+
+        origins = manager.stats()['origins']
+        assert origins['https://api.example.com:443'] == {'requests': 2, 'errors': 1, 'http_versions': {'HTTP/1.1': 2}}
+        assert origins['http://localhost:8000']['requests'] == 2
+    finally:
+        manager.uninstall()
+
+    assert litellm.client_session is None and litellm.aclient_session is None
+    manager.close()
@@ -0,0 +1,86 @@
+from flowtic.agents.tools import Tool, Tools
+from flowtic.providers import FakeProvider, FakeResponse
+from flowtic.session import MemorySessionManager
+from flowtic.session.memory import MemoryIndex
+
+
+def test_memory_session_recalls_evicted_history(make_agent, tmp_path):
+    path = str(tmp_path / 'memory.db')
+    agent = make_agent(
+        'agent',
+        ["Noted.", "Sure.", "Okay."],
+        session=MemorySessionManager(max_messages=2, memory_path=path),
+    )
+    agent('My favourite colour is teal.')
+    agent('Tell me a joke.')
+    agent('Another one.')
+    assert len(agent.session.get_buffer_memory('agent')) == 3
+
+    provider = FakeProvider(["Teal!"])
+    later = make_agent('agent', session=MemorySessionManager(max_messages=2, memory_path=path), provider=provider)
+    assert later('What is my favourite colour?') == "Teal!"
+    recalled = provider.calls[0]['messages'][1]
+    assert recalled['role'] == 'system' and 'teal' in recalled['content']
+
+
+def test_memory_index_ranks_with_fts(tmp_path):
+    index = MemoryIndex(str(tmp_path / 'memory.db'))
+    index.add('agent', 'user: deploy the billing_service to staging')
+    index.add('agent', 'user: the weather is nice')
+    index.add('other', 'user: billing is broken')
+
+    [(text, score)] = index.search('agent', 'billing service', k=5)
+    assert 'billing_service' in text and score > 0
+    assert index.count('agent') == 2 and index.search('agent', '!!!') == []
+
+
+def test_messages_since_survives_eviction():
+    session = MemorySessionManager(max_messages=2)
+    session._register_buffer('agent')
+    session.add_sys_ins('agent', 'You are helpful.')
+    session.add_user_context('agent', text='first')
+    mark = session.appended_count('agent')
+
+    for text in ('second', 'third', 'fourth'):
+        session.add_user_context('agent', text=text)
+
+    new = session.messages_since('agent', mark)
+    assert [message['content'][0]['text'] for message in new] == ['third', 'fourth']
+
+
+def test_eviction_keeps_tool_batches_with_images_whole(make_agent):
+    def snapshot(messages, tools):
+        requests.append([dict(message) for message in messages])
+        return script.pop(0)
+
+    def screenshot(name: str):
+        return f"captured {name}", f"https://example.com/{name}.png"
+
+    tool = Tool(
+        tool_definition={
+            'type': 'function',
+            'function': {
+                'name': 'screenshot',
+                'description': 'Take a screenshot',
+                'parameters': {'type': 'object', 'properties': {'name': {'type': 'string'}}, 'required': ['name']},
+            },
+        },
+        tool_execution=screenshot,
+    )
+    requests = []
+    script = [
+        FakeResponse(tool_calls=[('screenshot', {'name': 'home'}), ('screenshot', {'name': 'login'})]),
+        "Both pages look fine.",
+        "Sure.",
+    ]
+    agent = make_agent('agent', responder=snapshot, tools=Tools([tool]), session=MemorySessionManager(max_messages=3))
+    agent('Check the pages.')
+    agent('Thanks!')
+
+    for messages in requests:
+        answered = set()
+        for message in messages:
+            if message['role'] == 'assistant':
+                answered = {tool_call['id'] for tool_call in message.get('tool_calls') or []}
+            elif message['role'] == 'tool':
+                assert message['tool_call_id'] in answered
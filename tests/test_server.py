@@ -0,0 +1,226 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+from aiohttp.test_utils import TestClient, TestServer
+
+from flowtic.agents import Agent, AsyncAgent
+from flowtic.agents.tools import Tool, Tools
+from flowtic.communication import Callback, CommunicationProtocol
+from flowtic.providers import FakeProvider, FakeResponse
+from flowtic.server import ProtocolServer, RequestRejected
+
+
+def build_protocol(tenant, latency=0.0):
+    manager = AsyncAgent(
+        agent_name='manager',
+        model_name='fake',
+        allow_user_input=False,
+        provider=FakeProvider([FakeResponse.handoff('developer', f'build it for {tenant}', asynchronous=True)]),
+    )
+    developer = AsyncAgent(
+        agent_name='developer',
+        model_name='fake',
+        allow_user_input=False,
+        provider=FakeProvider([f"built for {tenant}"], latency=latency),
+    )
+    return CommunicationProtocol('manager->developer', [manager, developer], async_run_type=True)
+
+
+def serve(server, scenario):
+    async def main():
+        async with TestClient(TestServer(server.create_app())) as client:
+            return await scenario(client)
+    return asyncio.run(main())
+
+
+def test_run_and_stream_per_tenant():
+    server = ProtocolServer()
+    server.register('build', build_protocol)
+
+    async def scenario(client):
+        response = await client.post('/v1/protocols/build/runs', json={'input': 'go'}, headers={'X-Tenant-ID': 'acme'})
+        assert response.status == 200
+        assert await response.json() == {'status': 'completed', 'output': 'built for acme'}
+
+        socket = await client.ws_connect('/v1/protocols/build/stream', headers={'X-Tenant-ID': 'globex'})
+        await socket.send_json({'input': 'go'})
+        events = [message async for message in socket]
+        return [event.json() for event in events]
+
+    events = serve(server, scenario)
+    assert [event['type'] for event in events] == ['started', 'handoff', 'result']
+    assert events[-1]['output'] == 'built for globex'
+
+
+def test_admission_control_rejects_overload():
+    server = ProtocolServer(max_concurrency=1, max_queue=0)
+    server.register('build', lambda tenant: build_protocol(tenant, latency=0.2))
+
+    async def scenario(client):
+        responses = await asyncio.gather(*[
+            client.post('/v1/protocols/build/runs', json={'input': 'go'}) for _ in range(3)
+        ])
+        missing = await client.post('/v1/protocols/nope/runs', json={'input': 'go'})
+        return sorted(response.status for response in responses), missing.status
+
+    statuses, missing = serve(server, scenario)
+    assert statuses == [200, 503, 503]
+    assert missing == 404
+
+
+class ToolLog(Callback):
+    # The two-argument form of on_tool_call, without the agent name.
+    def __init__(self, calls):
+        super().__init__()
+        self.calls = calls
+
+    def on_tool_call(self, fn_name, arguments):
+        self.calls.append(fn_name)
+
+    def on_user_loop(self, assistant_message):
+        return "unused"
+
+
+def explode(reason: str):
+    raise ValueError(reason)
+
+
+def greet(messages, tools):
+    reply = messages[-1]['content'][0]['text']
+    return "What's your name?" if reply == 'hi' else f"Hi {reply}"
+
+
+def build_assistant(tenant, script=None, responder=None, calls=None):
+    explode_tool = Tool(
+        tool_definition={
+            'type': 'function',
+            'function': {
+                'name': 'explode',
+                'description': 'Fails',
+                'parameters': {'type': 'object', 'properties': {'reason': {'type': 'string'}}, 'required': ['reason']},
+            },
+        },
+        tool_execution=explode,
+    )
+    assistant = AsyncAgent(
+        agent_name='assistant',
+        model_name='fake',
+        tools=Tools([explode_tool]),
+        callbacks=ToolLog([] if calls is None else calls),
+        provider=FakeProvider(script, responder=responder),
+    )
+    helper = AsyncAgent(agent_name='helper', model_name='fake', allow_user_input=False, provider=FakeProvider([]))
+    return CommunicationProtocol('assistant->helper', [assistant, helper], async_run_type=True)
+
+
+def test_resume_tokens_are_signed_per_tenant():
+    server = ProtocolServer(secret='test-secret')
+    server.register('chat', lambda tenant: build_assistant(tenant, responder=greet))
+
+    async def scenario(client):
+        parked = await (await client.post('/v1/protocols/chat/runs', json={'input': 'hi'}, headers={'X-Tenant-ID': 'acme'})).json()
+        token = parked['resume_token']
+
+        other_tenant = await client.post(
+            '/v1/protocols/chat/runs', json={'input': 'Bob', 'resume_token': token}, headers={'X-Tenant-ID': 'globex'}
+        )
+        tampered = await client.post(
+            '/v1/protocols/chat/runs', json={'input': 'Bob', 'resume_token': token[:-4] + 'AAAA'}, headers={'X-Tenant-ID': 'acme'}
+        )
+        resumed = await client.post(
+            '/v1/protocols/chat/runs', json={'input': 'Bob', 'resume_token': token}, headers={'X-Tenant-ID': 'acme'}
+        )
+        return parked, other_tenant.status, tampered.status, resumed.status, await resumed.json()
+
+    parked, other_tenant, tampered, status, resumed = serve(server, scenario)
+    assert parked['status'] == 'suspended' and parked['message'] == "What's your name?"
+    assert (other_tenant, tampered) == (403, 403)
+    assert status == 200 and resumed['status'] == 'suspended' and resumed['message'] == "Hi Bob"
+
+
+def test_two_argument_tool_callbacks_and_server_side_errors():
+    calls = []
+    server = ProtocolServer()
+    server.register(
+        'chat', lambda tenant: build_assistant(tenant, [FakeResponse(tool_calls=[('explode', {'reason': 'boom'})])], calls=calls)
+    )
+
+    async def scenario(client):
+        failed = await client.post('/v1/protocols/chat/runs', json={'input': 'go'})
+        unknown_agent = await client.post('/v1/protocols/chat/runs', json={'input': 'go', 'start_agent': 'nobody'})
+        local_file = await client.post('/v1/protocols/chat/runs', json={'input': 'go', 'images': ['/etc/passwd']})
+        return failed.status, unknown_agent.status, local_file.status
+
+    assert serve(server, scenario) == (500, 400, 400)
+    assert calls == ['explode']
+
+
+def build_sync_protocol(tenant, latency=0.0):
+    manager = Agent(
+        agent_name='manager',
+        model_name='fake',
+        allow_user_input=False,
+        provider=FakeProvider([f"done for {tenant}"], latency=latency),
+    )
+    developer = Agent(agent_name='developer', model_name='fake', allow_user_input=False, provider=FakeProvider([]))
+    return CommunicationProtocol('manager->developer', [manager, developer])
+
+
+def test_cancelled_sync_run_holds_its_slot_until_the_thread_finishes():
+    server = ProtocolServer(max_concurrency=1, max_queue=0)
+    server.register('build', lambda tenant: build_sync_protocol(tenant, latency=0.3))
+
+    async def main():
+        run = asyncio.create_task(server.run('build', 'acme', {'input': 'go'}))
+        await asyncio.sleep(0.1)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        held = server.stats()
+        with pytest.raises(RequestRejected) as rejected:
+            await server.run('build', 'acme', {'input': 'go'})
+        await asyncio.sleep(0.4)
+        return held, rejected.value.status, server.stats()
+
+    held, status, after = asyncio.run(main())
+    assert held['running'] == 1 and held['abandoned'] == 1
+    assert status == 503
+    assert after['running'] == 0 and after['tenants'] == {}
+
+
+def test_closing_the_socket_cancels_the_run():
+    server = ProtocolServer()
+    server.register('build', lambda tenant: build_protocol(tenant, latency=5.0))
+
+    async def scenario(client):
+        socket = await client.ws_connect('/v1/protocols/build/stream')
+        await socket.send_json({'input': 'go'})
+        assert (await socket.receive_json())['type'] == 'started'
+        await socket.close()
+        for _ in range(50):
+            if server.stats()['running'] == 0:
+                break
+            await asyncio.sleep(0.02)
+        return server.stats()
+
+    stats = serve(server, scenario)
+    assert stats['running'] == 0 and stats.get('completed', 0) == 0
+
+
+def test_static_protocols_reject_start_agent():
+    server = ProtocolServer()
+    server.register('pipeline', lambda tenant: CommunicationProtocol(
+        'a->b',
+        [Agent(agent_name=name, model_name='fake', allow_user_input=False, provider=FakeProvider([f"{name} done"]))
+         for name in ('a', 'b')],
+        static=True,
+    ))
+
+    async def scenario(client):
+        rejected = await client.post('/v1/protocols/pipeline/runs', json={'input': 'go', 'start_agent': 'b'})
+        return rejected.status, (await rejected.json())
+
+    status, body = serve(server, scenario)
+    assert status == 400 and 'start_agent' in str(body)
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from flowtic.communication import CommunicationProtocol
+from flowtic.providers import FakeResponse
+
+
+@pytest.mark.parametrize('policy, sizes', [('persistent', [2, 4, 6]), ('fresh', [2, 2, 2]), (2, [2, 4, 4])])
+def test_edge_session_policy_bounds_worker_history(make_agent, policy, sizes):
+    hub = make_agent('hub', responder=lambda messages, tools: FakeResponse.handoff('worker', 'next task'))
+    request_sizes = []
+
+    def respond(messages, tools):
+        request_sizes.append(len(messages))
+        return "done"
+
+    worker = make_agent('worker', responder=respond)
+    protocol = CommunicationProtocol('hub->worker', [hub, worker], session_policies={'hub->worker': policy})
+
+    for _ in range(3):
+        assert protocol.execute('go') == "done"
+    assert request_sizes == sizes
+
+
+def test_concurrent_handoffs_to_one_receiver_are_not_trimmed(make_agent):
+    def task(message):
+        return ('_async_spin_into', {'receiver': 'worker', 'message': message, 'context': ''})
+
+    hub = make_agent(
+        'hub',
+        [FakeResponse(tool_calls=[task('task A'), task('task B')]), FakeResponse(tool_calls=[task('task C')])],
+        asynchronous=True,
+    )
+    worker = make_agent('worker', responder=lambda messages, tools: "done", latency=0.05, asynchronous=True)
+    protocol = CommunicationProtocol('hub->worker', [hub, worker], async_run_type=True, default_session_policy='fresh')
+
+    def texts():
+        return ' '.join(
+            message['content'][0]['text'] for message in worker.session.get_buffer_memory('worker') if message['role'] == 'user'
+        )
+
+    asyncio.run(protocol.async_execute('go'))
+    assert 'task A' in texts() and 'task B' in texts()
+
+    asyncio.run(protocol.async_execute('again'))
+    assert 'task C' in texts() and 'task A' not in texts()
+
+
+@pytest.mark.parametrize('policy, kept', [('persistent', 0), ('fresh', 0), (3, 2)])
+def test_handoff_starts_stay_bounded(make_agent, policy, kept):
+    hub = make_agent('hub', responder=lambda messages, tools: FakeResponse.handoff('worker', 'next task'))
+    worker = make_agent('worker', responder=lambda messages, tools: "done")
+    protocol = CommunicationProtocol('hub->worker', [hub, worker], default_session_policy=policy)
+
+    for _ in range(10):
+        protocol.execute('go')
+    assert len(protocol._handoff_starts['worker']) == kept
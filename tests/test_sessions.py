@@ -0,0 +1,37 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from flowtic.session import SessionManager
+
+
+def test_async_image_ingestion_matches_sync_layout(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'shot_{i}.png'
+        Image.new('RGB', (64, 64), (i * 40, 0, 0)).save(path)
+        paths.append(str(path))
+    images = paths + ['https://example.com/chart.png']
+
+    sync_session, async_session = SessionManager(), SessionManager()
+    for session in (sync_session, async_session):
+        session._register_buffer('agent')
+    sync_session.add_user_context('agent', text='look', images=images)
+    asyncio.run(async_session.aadd_user_context('agent', text='look', images=images))
+
+    assert async_session.get_buffer_memory('agent') == sync_session.get_buffer_memory('agent')
+
+
+def test_thread_safe_session_shared_by_threads(make_agent):
+    session = SessionManager(thread_safe=True)
+    agents = [make_agent(f'agent_{i}', [f"done {i}"], latency=0.01, session=session) for i in range(16)]
+    snapshot = session.get_buffer_memory('agent_0')
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(executor.map(lambda agent: agent('go'), agents))
+
+    assert outputs == [f"done {i}" for i in range(16)]
+    assert len(snapshot) == 1
+    for agent in agents:
+        assert [message['role'] for message in session.get_buffer_memory(agent.name)] == ['system', 'user', 'assistant']
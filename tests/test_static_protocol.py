@@ -0,0 +1,73 @@
+import asyncio
+import threading
+
+import pytest
+
+from flowtic.communication import CommunicationProtocol
+
+
+def test_async_static_pipeline(make_agent):
+    agents = [make_agent(name, [f"{name} done"], latency=0.01, asynchronous=True) for name in ('a', 'b', 'c', 'd')]
+    protocol = CommunicationProtocol('a->b, a->c, b->d, c->d', agents, async_run_type=True, static=True)
+
+    assert asyncio.run(protocol.async_execute('go')) == "d done"
+    d_input = agents[3].session.get_buffer_memory('d')[1]['content'][0]['text']
+    assert 'b done' in d_input and 'c done' in d_input
+
+
+def test_sync_static_pipeline_runs_branches_in_parallel(make_agent):
+    # b and c only get past the barrier if they run at the same time.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def branch(name):
+        def respond(messages, tools):
+            barrier.wait()
+            return f"{name} done"
+        return make_agent(name, responder=respond)
+
+    agents = [make_agent('a', ['a done']), branch('b'), branch('c'), make_agent('d', ['d done'])]
+    protocol = CommunicationProtocol('a->b, a->c, b->d, c->d', agents, static=True)
+
+    assert protocol.execute('go') == "d done"
+    d_input = agents[3].session.get_buffer_memory('d')[1]['content'][0]['text']
+    assert 'b done' in d_input and 'c done' in d_input
+
+
+def test_sync_static_pipeline_propagates_errors(make_agent):
+    agents = [make_agent('a', ['a done']), make_agent('b', [RuntimeError('b failed')]), make_agent('c', ['c done'])]
+    protocol = CommunicationProtocol('a->b, b->c', agents, static=True)
+
+    with pytest.raises(RuntimeError, match='b failed'):
+        protocol.execute('go')
+    assert agents[2].provider.calls == []
+
+
+def test_multiple_sinks_return_a_dict(make_agent):
+    agents = [make_agent(name, [f"{name} done"]) for name in ('a', 'b', 'c')]
+    protocol = CommunicationProtocol('a->b, a->c', agents, static=True)
+
+    assert protocol.execute('go') == {'b': 'b done', 'c': 'c done'}
+
+
+def test_images_go_only_to_source_agents(make_agent):
+    def image_count(agent):
+        content = agent.session.get_buffer_memory(agent.name)[1]['content']
+        return sum(1 for part in content if part['type'] == 'image_url')
+
+    agents = [make_agent(name, [f"{name} done"], asynchronous=True) for name in ('a', 'b', 'c')]
+    protocol = CommunicationProtocol('a->c, b->c', agents, async_run_type=True, static=True)
+
+    asyncio.run(protocol.async_execute('look', images=['https://example.com/chart.png']))
+    assert [image_count(agent) for agent in agents] == [1, 1, 0]
+
+
+def test_static_protocols_reject_cycles_and_start_agent(make_agent):
+    agents = [make_agent(name, [f"{name} done"]) for name in ('a', 'b', 'c')]
+
+    with pytest.raises(ValueError, match='acyclic'):
+        CommunicationProtocol('a->b, b->c, c->b', agents, static=True)
+
+    protocol = CommunicationProtocol('a->b, b->c', agents, static=True)
+    with pytest.raises(ValueError, match='start_agent'):
+        protocol.execute('go', start_agent='b')
+    assert all(agent.provider.calls == [] for agent in agents)
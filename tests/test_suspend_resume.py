@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from flowtic.communication import Callback, CommunicationProtocol, SuspendRun
+from flowtic.providers import FakeResponse
+
+
+def test_suspend_and_resume_on_new_agent(make_agent, parking_callback):
+    agent = make_agent('agent', ["What's your name?"], callbacks=parking_callback)
+    parked = agent('hi')
+    assert parked.message == "What's your name?"
+
+    resumed = make_agent('agent', ["Hi Bob"], callbacks=parking_callback)
+    again = resumed.resume(parked.token, 'Bob')
+    assert again.message == "Hi Bob"
+    assert [message['role'] for message in resumed.session.get_buffer_memory('agent')] == [
+        'system', 'user', 'assistant', 'user', 'assistant'
+    ]
+
+
+class AsyncReplies(Callback):
+    def __init__(self):
+        super().__init__()
+        self.asked = []
+
+    async def on_user_loop(self, agent_name, assistant_message):
+        self.asked.append((agent_name, assistant_message))
+        if len(self.asked) > 1:
+            raise SuspendRun()
+        return 'Bob'
+
+
+def test_async_user_loop_coroutine(make_agent):
+    callback = AsyncReplies()
+    agent = make_agent('agent', ["What's your name?", "Hi Bob"], callbacks=callback, asynchronous=True)
+
+    parked = asyncio.run(agent('hi'))
+    assert callback.asked == [('agent', "What's your name?"), ('agent', "Hi Bob")]
+    assert parked.message == "Hi Bob"
+
+
+class BlockingReplies(Callback):
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def on_user_loop(self, assistant_message):
+        # Stands in for input(): blocks whatever thread it runs on.
+        self.threads.append(threading.get_ident())
+        time.sleep(0.2)
+        raise SuspendRun()
+
+
+def test_blocking_user_loop_runs_off_the_event_loop(make_agent):
+    callback = BlockingReplies()
+    agent = make_agent('agent', ["What's your name?"], callbacks=callback, asynchronous=True)
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        parked = await agent('hi')
+        ticker.cancel()
+        return parked, ticks
+
+    parked, ticks = asyncio.run(main())
+    assert parked.message == "What's your name?"
+    assert callback.threads and callback.threads[0] != threading.get_ident()
+    # The loop kept running other work while the callback blocked.
+    assert ticks >= 5
+
+
+@pytest.mark.parametrize('asynchronous', [False, True])
+def test_protocol_resumes_on_fresh_agents(make_agent, parking_callback, asynchronous):
+    document = 'lorem ipsum ' * 500
+
+    def build(manager_script, editor_script):
+        manager = make_agent('manager', manager_script, callbacks=parking_callback, asynchronous=asynchronous)
+        editor = make_agent('editor', editor_script, asynchronous=asynchronous)
+        return CommunicationProtocol(
+            'manager->editor', [manager, editor], async_run_type=asynchronous, artifact_threshold=1000
+        )
+
+    def run(call):
+        return asyncio.run(call) if asynchronous else call
+
+    first = build([FakeResponse.handoff('editor', document, asynchronous=asynchronous), "Anything else?"], ["edited"])
+    parked = run(first.async_execute('go') if asynchronous else first.execute('go'))
+    assert parked.message == "Anything else?"
+
+    # Another worker builds the protocol from scratch and picks the run up from the token alone.
+    second = build(
+        [FakeResponse(tool_calls=[('read_artifact', {'handle': 'artifact-1', 'length': 11})]), "Sent back"], []
+    )
+    resumed = run(
+        second.async_resume(parked.token, 'Show me the draft') if asynchronous
+        else second.resume(parked.token, 'Show me the draft')
+    )
+
+    assert resumed.message == "Sent back"
+    for name in ('manager', 'editor'):
+        old, new = (protocol.agent_map[name].session.get_buffer_memory(name) for protocol in (first, second))
+        assert new[:len(old)] == old
+    manager_buffer = second.agent_map['manager'].session.get_buffer_memory('manager')
+    assert [message for message in manager_buffer if message.get('role') == 'tool'][-1]['content'].endswith('lorem ipsum')
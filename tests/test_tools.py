@@ -0,0 +1,101 @@
+import pytest
+
+from flowtic.agents import BM25ToolSelector
+from flowtic.agents.tools import LazyTool, Tool, Tools
+from flowtic.agents.validation import ToolArgumentError
+from flowtic.providers import FakeProvider, FakeResponse
+
+
+def test_tool_selection_sends_relevant_tools(make_agent, calculator):
+    def make_tool(name, description):
+        def execute(**kwargs):
+            return name, None
+        execute.__name__ = name
+        return Tool(
+            tool_definition={
+                'type': 'function',
+                'function': {
+                    'name': name,
+                    'description': description,
+                    'parameters': {'type': 'object', 'properties': {}},
+                },
+            },
+            tool_execution=execute,
+        )
+
+    catalog = [make_tool(f'tool_{i}', f'unrelated helper number {i}') for i in range(20)]
+    catalog.append(make_tool('get_weather', 'Get the current weather forecast for a city'))
+    provider = FakeProvider([
+        FakeResponse(tool_calls=[('get_weather', {})]),
+        "Sunny",
+    ])
+    agent = make_agent(
+        'agent',
+        tools=Tools(catalog + [calculator], selector=BM25ToolSelector(top_k=1)),
+        provider=provider,
+    )
+
+    assert agent("What's the weather in Paris?") == "Sunny"
+    sent = [definition['function']['name'] for definition in provider.calls[0]['tools']]
+    assert sent == ['get_weather']
+
+
+def test_lazy_tool_imports_on_first_call(make_agent, tmp_path, monkeypatch):
+    (tmp_path / 'heavy_tools.py').write_text(
+        "def shout(text):\n"
+        "    return text.upper(), None\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    shout = LazyTool(
+        tool_definition={
+            'type': 'function',
+            'function': {
+                'name': 'shout',
+                'description': 'Uppercase some text',
+                'parameters': {'type': 'object', 'properties': {'text': {'type': 'string'}}},
+            },
+        },
+        import_path='heavy_tools:shout',
+    )
+    tools = Tools([shout])
+    agent = make_agent('agent', [FakeResponse(tool_calls=[('shout', {'text': 'hi'})]), "done"], tools=tools)
+    assert not shout.resolved
+
+    agent('go')
+    assert agent.session.get_buffer_memory('agent')[-2]['content'] == 'HI'
+    [row] = tools.import_report()
+    assert row['resolved'] and row['seconds'] is not None
+
+
+def test_invalid_tool_arguments_are_repaired_in_loop(make_agent, calculator):
+    tools = Tools([calculator])
+    agent = make_agent(
+        'agent',
+        [
+            FakeResponse(tool_calls=[('calculator_tool', '{"expression": ')]),
+            FakeResponse(tool_calls=[('calculator_tool', {'expr': '1 + 1'})]),
+            FakeResponse(tool_calls=[('calculator_tool', {'expression': '1 + 1'})]),
+            "2",
+        ],
+        tools=tools,
+    )
+
+    assert agent('1 + 1?') == "2"
+    errors = [
+        message['content'] for message in agent.session.get_buffer_memory('agent')
+        if message['role'] == 'tool' and message['content'].startswith('Error')
+    ]
+    assert len(errors) == 2 and 'arguments.expression is required' in errors[1]
+    assert tools.validation_report()['calculator_tool']['failures'] == 2
+
+
+def test_tool_repairs_are_bounded(make_agent, calculator):
+    agent = make_agent(
+        'agent',
+        responder=lambda messages, tools: FakeResponse(tool_calls=[('nope', {})]),
+        tools=Tools([calculator]),
+        max_tool_repairs=1,
+    )
+
+    with pytest.raises(ToolArgumentError):
+        agent('go')